@@ -1,20 +1,27 @@
 """Inițializarea integrării E·ON România."""
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
+from datetime import timedelta
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DOMAIN_TOKEN_STORE, LICENSE_DATA_KEY, LICENSE_PURCHASE_URL, PLATFORMS
+from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DETAILS_PREFETCH_WINDOW, DOMAIN_TOKEN_STORE, FIRST_REFRESH_CONCURRENCY, LATENCY_SAVE_INTERVAL, LICENSE_DATA_KEY, LICENSE_PURCHASE_URL, PLATFORMS
 from .api import EonApiClient
 from .coordinator import EonRomaniaCoordinator
+from .history import HistoryStore
+from .latency import LatencyProfileStore
+from .prefetch import ContractDetailsPrefetcher
 from .license import LicenseManager
+from .account_registry import async_acquire_account, async_release_account
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +34,69 @@ class EonRomaniaRuntimeData:
 
     coordinators: dict[str, EonRomaniaCoordinator] = field(default_factory=dict)
     api_client: EonApiClient | None = None
+    # Detaliile contractelor aduse în lot (doar cu mai multe contracte selectate)
+    details_prefetcher: ContractDetailsPrefetcher | None = None
+    # Configurația cu care a pornit intrarea (fără token) — vezi _async_update_options
+    settings_snapshot: dict = field(default_factory=dict)
+
+
+def _settings_snapshot(entry: ConfigEntry) -> dict:
+    """Datele + opțiunile intrării, fără token_data (care se schimbă la fiecare reînnoire)."""
+    data = {key: value for key, value in entry.data.items() if key != "token_data"}
+    return {"data": data, "options": dict(entry.options)}
+
+
+def _is_newer_token(candidate: dict | None, current: dict | None) -> bool:
+    """True dacă tokenul salvat `candidate` e mai nou decât cel curent al broker-ului."""
+    if not candidate:
+        return False
+    if not current:
+        return True
+    return (candidate.get("obtained_at_wallclock") or 0) > (
+        current.get("obtained_at_wallclock") or 0
+    )
+
+
+@callback
+def _async_persist_token(hass: HomeAssistant, entry: ConfigEntry, api_client: EonApiClient) -> None:
+    """Salvează tokenul curent în config_entry.data (refresh_token valid după restart)."""
+    token_data = api_client.export_token_data()
+    if token_data is None:
+        return
+    old_token = entry.data.get("token_data") or {}
+    if (
+        old_token.get("access_token") == token_data.get("access_token")
+        and old_token.get("refresh_token") == token_data.get("refresh_token")
+    ):
+        return
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, "token_data": token_data}
+    )
+    _LOGGER.debug("Token persistat în config_entry (entry_id=%s).", entry.entry_id)
+
+
+async def _async_first_refresh(
+    entry: ConfigEntry,
+    coordinator: EonRomaniaCoordinator,
+    semaphore: asyncio.Semaphore,
+) -> bool:
+    """Prima actualizare a unui contract; un eșec nu le afectează pe celelalte."""
+    async with semaphore:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except UpdateFailed as err:
+            _LOGGER.error(
+                "Prima actualizare eșuată (entry_id=%s, contract=%s): %s",
+                entry.entry_id, coordinator.cod_incasare, err,
+            )
+            return False
+        except Exception as err:
+            _LOGGER.exception(
+                "Eroare neașteptată la prima actualizare (entry_id=%s, contract=%s): %s",
+                entry.entry_id, coordinator.cod_incasare, err,
+            )
+            return False
+    return True
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
@@ -290,7 +360,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             "[EonRomania] LicenseManager există deja (entry suplimentară)"
         )
 
-    session = async_get_clientsession(hass)
     username = entry.data["username"]
     password = entry.data["password"]
     update_interval = entry.data.get("update_interval", DEFAULT_UPDATE_INTERVAL)
@@ -317,11 +386,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         DOMAIN, entry.entry_id, selected_contracts, update_interval, is_account_only,
     )
 
-    # Un singur client API partajat (un singur cont, un singur token)
-    api_client = EonApiClient(session, username, password)
+    # Un singur client API per intrare; tokenul, sesiunea HTTP și planificatorul vin
+    # de la contul partajat cu celelalte intrări ale aceluiași username (un singur
+    # login/MFA, o singură limită de cereri în zbor)
+    account = async_acquire_account(hass, username, password, entry.entry_id)
+    entry.async_on_unload(lambda: async_release_account(hass, username, entry.entry_id))
+    api_client = EonApiClient(
+        account.session,
+        username,
+        password,
+        broker=account.broker,
+        connection_stats=account.connections,
+        scheduler=account.scheduler,
+    )
 
     # Injectăm token-ul salvat — prioritate: hass.data (proaspăt, de la config_flow),
-    # apoi config_entry.data (persistent, pentru restart HA)
+    # apoi config_entry.data (persistent, pentru restart HA), dar numai dacă e mai
+    # nou decât cel deținut deja de broker (altă intrare a contului)
     token_store = hass.data.get(DOMAIN_TOKEN_STORE, {})
     stored_token = token_store.pop(username.lower(), None)
     if stored_token:
@@ -335,12 +416,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             persistent_notification.async_dismiss(
                 hass, f"eonromania_reauth_{contract}"
             )
-    elif entry.data.get("token_data"):
+    elif _is_newer_token(entry.data.get("token_data"), api_client.export_token_data()):
         api_client.inject_token(entry.data["token_data"])
         _LOGGER.debug(
             "Token injectat din config_entry.data (persistent) pentru %s (entry_id=%s).",
             username, entry.entry_id,
         )
+    elif api_client.has_token:
+        _LOGGER.debug(
+            "Token preluat de la broker-ul contului %s (entry_id=%s).",
+            username, entry.entry_id,
+        )
     else:
         _LOGGER.debug(
             "Niciun token salvat disponibil pentru %s (entry_id=%s). Se va face login.",
@@ -350,12 +436,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if DOMAIN_TOKEN_STORE in hass.data and not hass.data[DOMAIN_TOKEN_STORE]:
         hass.data.pop(DOMAIN_TOKEN_STORE, None)
 
+    # Fiecare token nou (login, refresh la cerere sau în fundal) e persistat
+    # imediat în config_entry.data, pentru restart HA fără MFA
+    entry.async_on_unload(
+        api_client.add_token_listener(lambda: _async_persist_token(hass, entry, api_client))
+    )
+    _async_persist_token(hass, entry, api_client)
+
+    # Profilul de latență învățat (timeout-uri adaptive) — restaurat înainte
+    # de prima actualizare, salvat periodic și la descărcare
+    latency_store = LatencyProfileStore(hass, entry.entry_id)
+    api_client.import_latency_profile(await latency_store.async_load())
+
+    @callback
+    def _save_latency_periodic(_now) -> None:
+        latency_store.async_schedule_save(api_client.export_latency_profile)
+
+    async def _save_latency_on_unload() -> None:
+        await latency_store.async_save(api_client.export_latency_profile())
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, _save_latency_periodic, timedelta(seconds=LATENCY_SAVE_INTERVAL)
+        )
+    )
+    entry.async_on_unload(_save_latency_on_unload)
+
     # Metadatele contractelor (tip utilitate, colectiv/nu)
     contract_metadata = entry.data.get("contract_metadata", {})
 
     # Creăm câte un coordinator per contract selectat
     coordinators: dict[str, EonRomaniaCoordinator] = {}
 
+    # Cu mai multe contracte, contract_details vine într-o singură cerere în lot per ciclu
+    details_prefetcher = (
+        ContractDetailsPrefetcher(api_client, DETAILS_PREFETCH_WINDOW)
+        if not is_account_only and len(selected_contracts) > 1
+        else None
+    )
+
     if is_account_only:
         # Cont fără contracte — un singur coordinator pentru date personale
         coordinator = EonRomaniaCoordinator(
@@ -385,36 +504,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         coordinators["__account__"] = coordinator
     else:
+        candidates: dict[str, EonRomaniaCoordinator] = {}
         for cod in selected_contracts:
             meta = contract_metadata.get(cod, {})
             is_collective = meta.get("is_collective", False)
 
-            coordinator = EonRomaniaCoordinator(
+            candidates[cod] = EonRomaniaCoordinator(
                 hass,
                 api_client=api_client,
                 cod_incasare=cod,
                 update_interval=update_interval,
                 is_collective=is_collective,
                 config_entry=entry,
+                details_prefetcher=details_prefetcher,
+                refresh_ttl=entry.data.get("refresh_ttl"),
             )
 
-            try:
-                await coordinator.async_config_entry_first_refresh()
-            except UpdateFailed as err:
-                _LOGGER.error(
-                    "Prima actualizare eșuată (entry_id=%s, contract=%s): %s",
-                    entry.entry_id, cod, err,
-                )
-                # Continuăm cu restul contractelor — nu oprim totul pentru unul
-                continue
-            except Exception as err:
-                _LOGGER.exception(
-                    "Eroare neașteptată la prima actualizare (entry_id=%s, contract=%s): %s",
-                    entry.entry_id, cod, err,
-                )
-                continue
-
-            coordinators[cod] = coordinator
+        # Primele actualizări rulează în paralel (limitat); un contract eșuat
+        # e omis — nu oprim totul pentru unul
+        semaphore = asyncio.Semaphore(FIRST_REFRESH_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_async_first_refresh(entry, coordinator, semaphore) for coordinator in candidates.values())
+        )
+        for (cod, coordinator), ok in zip(candidates.items(), results):
+            if ok:
+                coordinators[cod] = coordinator
+            elif details_prefetcher is not None:
+                # Coordinatorul e renunțat — contractul lui nu mai intră în cererea în lot
+                details_prefetcher.unregister(cod)
 
     if not coordinators:
         _LOGGER.error(
@@ -432,6 +549,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     entry.runtime_data = EonRomaniaRuntimeData(
         coordinators=coordinators,
         api_client=api_client,
+        details_prefetcher=details_prefetcher,
+        settings_snapshot=_settings_snapshot(entry),
     )
 
     # Încărcăm platformele
@@ -449,6 +568,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry):
     """Reîncarcă integrarea când opțiunile se schimbă."""
+    runtime = getattr(entry, "runtime_data", None)
+    if runtime is not None and runtime.settings_snapshot == _settings_snapshot(entry):
+        # Doar tokenul s-a schimbat (persistare după reînnoire) — fără reload
+        return
     _LOGGER.info(
         "Opțiunile integrării %s s-au schimbat (entry_id=%s). Se reîncarcă...",
         DOMAIN, entry.entry_id,
@@ -534,6 +657,21 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entry.entry_id,
     )
 
+    # Istoricul local (plăți, facturi prosumator) al contractelor acestei intrări — doar dacă
+    # niciun alt entry nu mai monitorizează același contract
+    still_used = {
+        cod
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+        for cod in other.data.get("selected_contracts", [])
+    }
+    for cod in entry.data.get("selected_contracts", []):
+        if cod not in still_used:
+            await HistoryStore(hass, cod).async_remove()
+
+    # Profilul de latență învățat de clientul acestei intrări
+    await LatencyProfileStore(hass, entry.entry_id).async_remove()
+
     # Verifică dacă mai sunt entry-uri rămase
     remaining = hass.config_entries.async_entries(DOMAIN)
     if not remaining:
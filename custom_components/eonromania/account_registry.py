@@ -0,0 +1,134 @@
+"""Registrul resurselor partajate per cont E·ON (username): token, sesiune HTTP și planificator.
+
+Mai multe intrări (config entries) ale aceluiași cont — de exemplu grupuri
+diferite de contracte — folosesc același TokenBroker (api.py): un singur
+token, un singur login / refresh, o singură buclă de reînnoire și cel mult
+un cod MFA cerut, indiferent câte intrări are contul. Tot aici trăiește sesiunea HTTP dedicată
+a contului (vezi connection.py), închisă odată cu ultima intrare, împreună cu
+planificatorul de cereri (scheduler.py): limita de cereri în zbor e a contului,
+aceeași cu limita de conexiuni per gazdă a sesiunii.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from aiohttp import ClientSession
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.ssl import get_default_context
+
+from .api import TokenBroker
+from .connection import ConnectionStats, create_api_session
+from .const import (
+    CONNECTOR_DEDICATED_SESSION,
+    DOMAIN,
+    DOMAIN_ACCOUNT_REGISTRY,
+    SCHEDULER_BACKOFF_BASE,
+    SCHEDULER_BACKOFF_MAX,
+    SCHEDULER_BURST,
+    SCHEDULER_CONCURRENCY,
+    SCHEDULER_RATE,
+)
+from .scheduler import RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class AccountLease:
+    """Resursele unui cont și intrările care le folosesc."""
+
+    broker: TokenBroker
+    session: ClientSession
+    scheduler: RequestScheduler
+    # None = sesiunea partajată a Home Assistant (nu e a noastră, nu o închidem)
+    connections: ConnectionStats | None = None
+    entry_ids: set[str] = field(default_factory=set)
+    renewal_task: asyncio.Task | None = None
+    cancel_close_listener: Callable[[], None] | None = None
+
+
+def _account_key(username: str) -> str:
+    return username.strip().lower()
+
+
+@callback
+def async_acquire_account(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    entry_id: str,
+) -> AccountLease:
+    """Returnează resursele contului (create la prima intrare) și le rezervă pentru `entry_id`."""
+    leases: dict[str, AccountLease] = hass.data.setdefault(DOMAIN_ACCOUNT_REGISTRY, {})
+    key = _account_key(username)
+    lease = leases.get(key)
+    if lease is None:
+        if CONNECTOR_DEDICATED_SESSION:
+            connections = ConnectionStats()
+            session = create_api_session(
+                SCHEDULER_CONCURRENCY, connections, get_default_context()
+            )
+        else:
+            connections = None
+            session = async_get_clientsession(hass)
+        scheduler = RequestScheduler(
+            concurrency=SCHEDULER_CONCURRENCY,
+            rate=SCHEDULER_RATE,
+            burst=SCHEDULER_BURST,
+            backoff_base=SCHEDULER_BACKOFF_BASE,
+            backoff_max=SCHEDULER_BACKOFF_MAX,
+        )
+        lease = leases[key] = AccountLease(
+            TokenBroker(session, username, password), session, scheduler, connections
+        )
+        lease.renewal_task = hass.async_create_background_task(
+            lease.broker.async_token_renewal_loop(),
+            f"{DOMAIN}_token_renewal_{key}",
+        )
+        if connections is not None:
+            # Sesiunea trebuie închisă și la oprirea HA (intrările nu sunt descărcate atunci)
+            async def _close_session(_event: Event) -> None:
+                lease.cancel_close_listener = None
+                await session.close()
+
+            lease.cancel_close_listener = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, _close_session
+            )
+        _LOGGER.debug("[AUTH] Broker de token creat pentru %s.", username)
+    else:
+        lease.broker.update_credentials(password)
+        _LOGGER.debug(
+            "[AUTH] Broker de token existent reutilizat pentru %s (intrări: %s).",
+            username, len(lease.entry_ids) + 1,
+        )
+    lease.entry_ids.add(entry_id)
+    return lease
+
+
+async def async_release_account(hass: HomeAssistant, username: str, entry_id: str) -> None:
+    """Eliberează resursele pentru `entry_id`; ultima intrare oprește reînnoirea și închide sesiunea."""
+    leases: dict[str, AccountLease] = hass.data.get(DOMAIN_ACCOUNT_REGISTRY, {})
+    key = _account_key(username)
+    lease = leases.get(key)
+    if lease is None:
+        return
+    lease.entry_ids.discard(entry_id)
+    if lease.entry_ids:
+        return
+    leases.pop(key, None)
+    if not leases:
+        hass.data.pop(DOMAIN_ACCOUNT_REGISTRY, None)
+    if lease.renewal_task is not None:
+        lease.renewal_task.cancel()
+    if lease.connections is not None:
+        if lease.cancel_close_listener is not None:
+            lease.cancel_close_listener()
+        await lease.session.close()
+    _LOGGER.debug("[AUTH] Resursele contului %s eliberate (nicio intrare activă).", username)
@@ -1,19 +1,57 @@
 """Client API pentru comunicarea cu E·ON România."""
 
 import asyncio
+import hashlib
 import logging
+import random
 import time
 import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
 
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientSession, ClientTimeout
 
+try:  # Backend JSON rapid — declarat în manifest.json (HA îl livrează oricum)
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .cache import ResponseCache, ValidatorStore
+from .connection import ConnectionStats
 from .const import (
+    API_BASE,
     API_TIMEOUT,
     AUTH_VERIFY_SECRET,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_RECOVERY_TIME,
+    BREAKER_RECOVERY_TIME,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL,
+    CONDITIONAL_MAX_ENTRIES,
+    CONTRACTS_DETAILS_BATCH_SIZE,
     HEADERS,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_ENDPOINTS,
+    HEDGE_PERCENTILE,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_TIMEOUT_FLOOR,
+    LATENCY_TIMEOUT_MULTIPLIER,
     MFA_REQUIRED_CODE,
+    PREWARM_CONNECTIONS,
+    PREWARM_TIMEOUT,
+    SCHEDULER_BACKOFF_BASE,
+    SCHEDULER_BACKOFF_MAX,
+    SCHEDULER_BURST,
+    SCHEDULER_CONCURRENCY,
+    SCHEDULER_RATE,
     TOKEN_MAX_AGE,
     TOKEN_REFRESH_THRESHOLD,
+    TOKEN_RENEWAL_IDLE,
+    TOKEN_RENEWAL_JITTER,
+    TOKEN_RENEWAL_RETRY,
     URL_CONSUMPTION_CONVENTION,
     URL_CONTRACT_DETAILS,
     URL_CONTRACTS_DETAILS_LIST,
@@ -36,26 +74,177 @@ from .const import (
     URL_USER_DETAILS,
 )
 from .helpers import generate_verify_hmac
+from .latency import LatencyTracker
+from .resilience import (
+    RETRY_IDEMPOTENT,
+    RETRY_NEVER,
+    STATE_CLOSED,
+    TRANSIENT_STATUSES,
+    CircuitBreaker,
+    HedgeBudget,
+    RetryPolicy,
+)
+from .scheduler import RequestScheduler
 
 _LOGGER = logging.getLogger(__name__)
-_DEBUG = _LOGGER.isEnabledFor(logging.DEBUG)
+
+# orjson parsează direct din bytes (fără decodare intermediară în str);
+# json.loads acceptă și el bytes, deci ambele backend-uri primesc corpul brut.
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Câmpuri prezente doar în detaliile complete ale unui contract (cele citite de
+# senzori: adresă, prețuri, contoare). Elementele din lotul URL_CONTRACTS_DETAILS_LIST
+# fără niciunul dintre ele nu pot înlocui async_fetch_contract_details.
+_CONTRACT_DETAIL_FIELDS = frozenset({
+    "consumptionPointAddress",
+    "supplierAndDistributionPrice",
+    "meterReadings",
+    "distributorName",
+})
+
+
+def _is_full_contract_details(item: Any) -> bool:
+    """True dacă elementul are forma detaliilor complete (accountContract + câmpurile senzorilor)."""
+    return (
+        isinstance(item, dict)
+        and bool(item.get("accountContract"))
+        and not _CONTRACT_DETAIL_FIELDS.isdisjoint(item)
+    )
+
+
+# Dacă vreo cerere GET din task-ul curent a eșuat (rețea, 401, 429/5xx, circuit
+# deschis) de la ultimul reset_request_outcome(). Un răspuns definitiv gol
+# (200 fără corp, 404) nu e eșec — vezi EonApiClient.requests_failed.
+_REQUEST_FAILED: ContextVar[bool] = ContextVar("eonromania_request_failed", default=False)
+
+
+def _is_definitive(status: int) -> bool:
+    """True dacă răspunsul e unul final al backend-ului (chiar și gol sau 4xx)."""
+    return status != 401 and status not in TRANSIENT_STATUSES
+
+
+@dataclass(slots=True)
+class _ApiResponse:
+    """Rezultatul unei cereri HTTP: obiectul decodat, codul HTTP și dimensiunea brută.
+
+    `throttled` = răspunsul a impus o pauză globală în planificator (429 / Retry-After).
+    """
+
+    data: Any
+    status: int
+    size: int = 0
+    throttled: bool = False
+
+
+@dataclass(slots=True)
+class PageCursor:
+    """Progresul unei parcurgeri paginate, completat pe măsură ce sosesc paginile.
+
+    `complete` devine True doar dacă s-a ajuns la ultima pagină reală
+    (hasNext=false) — nu și la o eroare, la limita max_pages sau la oprire
+    anticipată din partea consumatorului. `failed` devine True dacă
+    parcurgerea s-a oprit din cauza unei pagini care nu a putut fi adusă.
+    """
+
+    pages: int = 0
+    complete: bool = False
+    failed: bool = False
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Parsează corpul brut o singură dată. Corp gol → None."""
+    if not raw:
+        return None
+    return _json_loads(raw)
+
+
+def _body_digest(raw: bytes) -> bytes:
+    """Amprenta corpului brut — compararea e mult mai ieftină decât parsarea."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
 
 
-def _safe_debug_sample(data, max_len: int = 500) -> str:
-    """Returnează un sample JSON sigur pentru logging (fără serializare inutilă)."""
-    if data is None:
+def _body_text(raw: bytes) -> str:
+    """Text lizibil din corpul brut (doar pentru mesajele de eroare)."""
+    return raw.decode("utf-8", errors="replace")
+
+
+# ──────────────────────────────────────────
+# Instrumentare debug (zero cost cu DEBUG oprit)
+# ──────────────────────────────────────────
+
+_SAMPLE_MAX_LEN = 500
+_SAMPLE_MAX_ITEMS = 3
+
+
+class _Lazy:
+    """Valoare calculată abia când logging-ul formatează efectiv mesajul."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func, *args) -> None:
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+
+def _payload_len(data) -> Any:
+    """Lungimea unui payload listă/dict, altfel "N/A"."""
+    return len(data) if isinstance(data, (list, dict)) else "N/A"
+
+
+def _payload_keys(data) -> Any:
+    """Cheile payload-ului (primul element pentru liste)."""
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        return list(data[0].keys())
+    if isinstance(data, dict):
+        return list(data.keys())
+    return "N/A"
+
+
+def _payload_sample(data, max_len: int = _SAMPLE_MAX_LEN) -> str:
+    """Sample JSON trunchiat; listele lungi sunt reduse la primele elemente înainte de serializare."""
+    if not data:
         return "None"
+    suffix = ""
+    if isinstance(data, list) and len(data) > _SAMPLE_MAX_ITEMS:
+        suffix = f" …(+{len(data) - _SAMPLE_MAX_ITEMS} elemente)"
+        data = data[:_SAMPLE_MAX_ITEMS]
     try:
-        return json.dumps(data, default=str)[:max_len]
+        text = json.dumps(data, default=str, ensure_ascii=False)
     except Exception:  # noqa: BLE001
-        return str(data)[:max_len]
-
-
-class EonApiClient:
-    """Clasă pentru comunicarea cu API-ul E·ON România."""
+        text = str(data)
+    return text[:max_len] + suffix
+
+
+def _debug_payload(tag: str, data, what: str = "Date primite") -> None:
+    """Loghează rezumatul unui payload. Nu face nicio lucrare dacă DEBUG e oprit."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    _LOGGER.debug(
+        "[%s] %s: type=%s, len=%s, keys=%s, sample=%s",
+        tag,
+        what,
+        type(data).__name__,
+        _Lazy(_payload_len, data),
+        _Lazy(_payload_keys, data),
+        _Lazy(_payload_sample, data),
+    )
+
+
+class TokenBroker:
+    """Ciclul de viață al tokenului unui cont E·ON: login, MFA, refresh, reînnoire.
+
+    O singură instanță per cont (username), partajată de toți clienții API ai
+    contului (vezi account_registry.py): traficul de autentificare și declanșările
+    MFA scalează cu numărul de conturi, nu cu numărul de intrări. Clienții
+    creați fără broker (ex. în config_flow) primesc unul propriu.
+    """
 
     def __init__(self, session: ClientSession, username: str, password: str):
-        """Inițializează clientul API cu o sesiune de tip ClientSession."""
+        """Inițializează broker-ul (fără token; vezi inject_token / async_login)."""
         self._session = session
         self._username = username
         self._password = password
@@ -73,6 +262,11 @@ class EonApiClient:
         self._auth_lock = asyncio.Lock()
         self._token_generation: int = 0
 
+        # Reînnoire proactivă în fundal (vezi async_token_renewal_loop)
+        self._token_listeners: list[Callable[[], None]] = []
+        self._renewal_failures: int = 0
+        self._renewal_due_at: float | None = None
+
         # MFA state (setat de async_login când MFA e necesar)
         self._mfa_data: dict | None = None
 
@@ -84,6 +278,23 @@ class EonApiClient:
         # Se resetează la inject_token() (după reconfigurare prin UI)
         self._mfa_blocked: bool = False
 
+        # Cererile de autentificare sunt serializate de _auth_lock; planificatorul
+        # propriu aplică doar ritmul și backoff-ul la 429 / Retry-After
+        self._scheduler = RequestScheduler(
+            concurrency=1,
+            rate=SCHEDULER_RATE,
+            burst=SCHEDULER_BURST,
+            backoff_base=SCHEDULER_BACKOFF_BASE,
+            backoff_max=SCHEDULER_BACKOFF_MAX,
+        )
+
+        self._stats: dict[str, int] = {
+            "logins": 0,
+            "refreshes": 0,
+            "token_renewals": 0,
+            "token_renewal_failures": 0,
+        }
+
     # ──────────────────────────────────────────
     # Proprietăți publice
     # ──────────────────────────────────────────
@@ -113,6 +324,39 @@ class EonApiClient:
         """True dacă login-ul e blocat din cauza MFA necesar în background."""
         return self._mfa_blocked
 
+    @property
+    def generation(self) -> int:
+        """Crește la fiecare token nou (login, refresh, injectare)."""
+        return self._token_generation
+
+    @property
+    def authorization(self) -> str | None:
+        """Valoarea headerului Authorization pentru tokenul curent (sau None)."""
+        if not self._access_token:
+            return None
+        return f"{self._token_type} {self._access_token}"
+
+    def update_credentials(self, password: str) -> None:
+        """Actualizează parola (ex. o intrare reconfigurată a aceluiași cont)."""
+        if password and password != self._password:
+            self._password = password
+            self.clear_mfa_block()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Starea tokenului, fără date sensibile (pentru diagnostics.py)."""
+        return {
+            **self._stats,
+            "has_token": self._access_token is not None,
+            "likely_valid": self.is_token_likely_valid(),
+            "generation": self._token_generation,
+            "mfa_blocked": self._mfa_blocked,
+            "renewal_in_s": (
+                round(max(0.0, self._renewal_due_at - time.monotonic()), 1)
+                if self._renewal_due_at is not None
+                else None
+            ),
+        }
+
     def clear_mfa_block(self) -> None:
         """Resetează blocajul MFA (apelat după reconfigurare prin UI)."""
         self._mfa_blocked = False
@@ -124,9 +368,78 @@ class EonApiClient:
         if self._access_token is None:
             return False
         age = time.monotonic() - self._token_obtained_at
-        # Folosim expires_in din răspunsul API, cu fallback pe TOKEN_MAX_AGE
-        effective_max = self._expires_in - TOKEN_REFRESH_THRESHOLD if self._expires_in > TOKEN_REFRESH_THRESHOLD else TOKEN_MAX_AGE
-        return age < effective_max
+        return age < self._token_lifetime()
+
+    def _token_lifetime(self) -> float:
+        """Cât timp e considerat valid tokenul curent (expires_in − prag, fallback TOKEN_MAX_AGE)."""
+        if self._expires_in > TOKEN_REFRESH_THRESHOLD:
+            return self._expires_in - TOKEN_REFRESH_THRESHOLD
+        return TOKEN_MAX_AGE
+
+    def add_token_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Apelează `listener` după fiecare token nou (login / refresh). Returnează funcția de dezabonare."""
+        self._token_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._token_listeners:
+                self._token_listeners.remove(listener)
+
+        return _remove
+
+    async def async_token_renewal_loop(self) -> None:
+        """Reînnoiește tokenul în fundal, înainte să expire (rulează până la anulare).
+
+        Momentul reînnoirii: expirarea estimată (expires_in − TOKEN_REFRESH_THRESHOLD)
+        minus un jitter aleator, ca mai mulți clienți să nu se reînnoiască simultan.
+        Folosește doar refresh_token — niciodată login complet, care ar putea
+        declanșa MFA; dacă refresh-ul eșuează, calea obișnuită (_ensure_token_valid)
+        rămâne plasa de siguranță la următoarea cerere.
+        """
+        try:
+            while True:
+                generation = self._token_generation
+                delay = self._seconds_until_renewal()
+                self._renewal_due_at = time.monotonic() + delay
+                await asyncio.sleep(delay)
+                self._renewal_due_at = None
+                if self._token_generation != generation:
+                    # Token nou între timp (la cerere sau injectat) — se replanifică
+                    continue
+                await self._async_renew_token()
+        finally:
+            self._renewal_due_at = None
+
+    def _seconds_until_renewal(self) -> float:
+        """Secunde până la următoarea reînnoire (cu jitter și backoff după eșecuri)."""
+        if self._renewal_failures:
+            return min(TOKEN_RENEWAL_RETRY * 2 ** (self._renewal_failures - 1), 900)
+        if self._access_token is None or not self._refresh_token or self._mfa_blocked:
+            return TOKEN_RENEWAL_IDLE
+        remaining = self._token_obtained_at + self._token_lifetime() - time.monotonic()
+        if remaining <= 0:
+            return 0.0
+        return max(0.0, remaining - random.uniform(0, min(TOKEN_RENEWAL_JITTER, remaining / 4)))
+
+    async def _async_renew_token(self) -> None:
+        """O reînnoire în fundal, sub _auth_lock (nu se suprapune cu refresh/login-ul la cerere)."""
+        if self._access_token is None or not self._refresh_token or self._mfa_blocked:
+            return
+        generation = self._token_generation
+        async with self._auth_lock:
+            if self._token_generation != generation:
+                # Alt apel a obținut deja un token nou între timp
+                return
+            if await self.async_refresh_token():
+                self._renewal_failures = 0
+                self._stats["token_renewals"] += 1
+                _LOGGER.debug("[AUTH] Token reînnoit în fundal (expires_in=%s).", self._expires_in)
+            else:
+                self._renewal_failures += 1
+                self._stats["token_renewal_failures"] += 1
+                _LOGGER.debug(
+                    "[AUTH] Reînnoirea în fundal a eșuat (%s eșecuri consecutive).",
+                    self._renewal_failures,
+                )
 
     def export_token_data(self) -> dict | None:
         """Exportă datele de token pentru a fi reinjectate în altă instanță.
@@ -190,6 +503,7 @@ class EonApiClient:
             )
 
         self._token_generation += 1
+        self._renewal_failures = 0
         # Resetăm blocajul MFA — token-ul nou vine din config_flow cu MFA completat
         self._mfa_blocked = False
         self._mfa_data = None
@@ -229,20 +543,22 @@ class EonApiClient:
         _LOGGER.debug("[LOGIN] Trimitere cerere: URL=%s, user=%s", URL_LOGIN, self._username)
 
         try:
-            async with self._session.post(
+            async with self._scheduler.slot(), self._session.post(
                 URL_LOGIN, json=payload, headers=HEADERS, timeout=self._timeout
             ) as resp:
-                response_text = await resp.text()
+                raw = await resp.read()
+                self._scheduler.record_response(resp.status, resp.headers.get("Retry-After"))
                 _LOGGER.debug("[LOGIN] Răspuns: Status=%s", resp.status)
 
                 if resp.status == 200:
-                    data = json.loads(response_text)
-                    if _LOGGER.isEnabledFor(logging.DEBUG):
-                        _LOGGER.debug(
-                            "[LOGIN] Date primite: type=%s, keys=%s",
-                            type(data).__name__,
-                            list(data.keys()) if isinstance(data, dict) else "N/A",
-                        )
+                    self._stats["logins"] += 1
+                    data = _decode_json(raw)
+                    # Doar cheile — payload-ul conține token-uri
+                    _LOGGER.debug(
+                        "[LOGIN] Date primite: type=%s, keys=%s",
+                        type(data).__name__,
+                        _Lazy(_payload_keys, data),
+                    )
                     self._apply_token_data(data)
                     _LOGGER.debug("[LOGIN] Token obținut cu succes (expires_in=%s).", self._expires_in)
                     return True
@@ -250,8 +566,8 @@ class EonApiClient:
                 # ── MFA necesar: HTTP 400 cu code "6054" ──
                 if resp.status == 400:
                     try:
-                        data = json.loads(response_text)
-                    except (json.JSONDecodeError, ValueError):
+                        data = _decode_json(raw) or {}
+                    except ValueError:
                         data = {}
 
                     if str(data.get("code")) == MFA_REQUIRED_CODE:
@@ -273,7 +589,7 @@ class EonApiClient:
                 _LOGGER.error(
                     "[LOGIN] Eroare autentificare. Cod HTTP=%s, Răspuns=%s",
                     resp.status,
-                    response_text,
+                    _body_text(raw),
                 )
                 self._invalidate_tokens()
                 return False
@@ -310,11 +626,11 @@ class EonApiClient:
             async with self._session.post(
                 URL_MFA_LOGIN, json=payload, headers=HEADERS, timeout=self._timeout
             ) as resp:
-                response_text = await resp.text()
+                raw = await resp.read()
                 _LOGGER.debug("[MFA] Răspuns: Status=%s", resp.status)
 
                 if resp.status == 200:
-                    data = json.loads(response_text)
+                    data = _decode_json(raw) or {}
                     access_token = data.get("access_token")
                     if access_token:
                         self._apply_token_data(data)
@@ -325,7 +641,7 @@ class EonApiClient:
                 _LOGGER.error(
                     "[MFA] Autentificare 2FA eșuată. Cod HTTP=%s, Răspuns=%s",
                     resp.status,
-                    response_text,
+                    _body_text(raw),
                 )
                 return False
 
@@ -365,13 +681,13 @@ class EonApiClient:
             async with self._session.post(
                 URL_MFA_RESEND, json=payload, headers=HEADERS, timeout=self._timeout
             ) as resp:
-                response_text = await resp.text()
-                _LOGGER.debug("[MFA-RESEND] Răspuns: Status=%s, Body=%s", resp.status, response_text)
+                raw = await resp.read()
+                _LOGGER.debug("[MFA-RESEND] Răspuns: Status=%s, Body=%s", resp.status, _Lazy(_body_text, raw))
 
                 if resp.status == 200:
                     try:
-                        data = json.loads(response_text)
-                    except (json.JSONDecodeError, ValueError):
+                        data = _decode_json(raw) or {}
+                    except ValueError:
                         data = {}
                     # Actualizează UUID-ul dacă serverul trimite unul nou
                     new_uuid = data.get("uuid")
@@ -386,7 +702,7 @@ class EonApiClient:
                 _LOGGER.error(
                     "[MFA-RESEND] Retransmitere eșuată. Cod HTTP=%s, Răspuns=%s",
                     resp.status,
-                    response_text,
+                    _body_text(raw),
                 )
                 return False
 
@@ -408,19 +724,22 @@ class EonApiClient:
         _LOGGER.debug("[REFRESH] Trimitere cerere: URL=%s", URL_REFRESH_TOKEN)
 
         try:
-            async with self._session.post(
+            async with self._scheduler.slot(), self._session.post(
                 URL_REFRESH_TOKEN, json=payload, headers=HEADERS, timeout=self._timeout
             ) as resp:
+                raw = await resp.read()
+                self._scheduler.record_response(resp.status, resp.headers.get("Retry-After"))
                 _LOGGER.debug("[REFRESH] Răspuns: Status=%s", resp.status)
 
                 if resp.status == 200:
-                    data = await resp.json()
-                    if _LOGGER.isEnabledFor(logging.DEBUG):
-                        _LOGGER.debug(
-                            "[REFRESH] Date primite: type=%s, keys=%s",
-                            type(data).__name__,
-                            list(data.keys()) if isinstance(data, dict) else "N/A",
-                        )
+                    self._stats["refreshes"] += 1
+                    data = _decode_json(raw)
+                    # Doar cheile — payload-ul conține token-uri
+                    _LOGGER.debug(
+                        "[REFRESH] Date primite: type=%s, keys=%s",
+                        type(data).__name__,
+                        _Lazy(_payload_keys, data),
+                    )
                     self._apply_token_data(data)
                     _LOGGER.debug("[REFRESH] Token reîmprospătat cu succes (expires_in=%s).", self._expires_in)
                     return True
@@ -428,7 +747,7 @@ class EonApiClient:
                 _LOGGER.warning(
                     "[REFRESH] Eroare la reîmprospătare. Cod HTTP=%s, Răspuns=%s",
                     resp.status,
-                    response_text,
+                    _body_text(raw),
                 )
                 return False
 
@@ -440,7 +759,11 @@ class EonApiClient:
             return False
 
     def _apply_token_data(self, data: dict) -> None:
-        """Aplică datele de token din răspunsul API (login sau refresh)."""
+        """Aplică datele de token din răspunsul API (login sau refresh).
+
+        Toate câmpurile se schimbă fără niciun await între ele: orice cerere
+        vede fie tokenul vechi complet, fie cel nou complet.
+        """
         self._access_token = data.get("access_token")
         self._token_type = data.get("token_type", "Bearer")
         self._expires_in = data.get("expires_in", 3600)
@@ -449,6 +772,9 @@ class EonApiClient:
         self._uuid = data.get("uuid")
         self._token_obtained_at = time.monotonic()
         self._token_generation += 1
+        self._renewal_failures = 0
+        for listener in list(self._token_listeners):
+            listener()
 
     def invalidate_token(self) -> None:
         """Invalidează tokenul curent (pentru a forța re-autentificare)."""
@@ -539,6 +865,287 @@ class EonApiClient:
 
             return result
 
+
+class EonApiClient:
+    """Clasă pentru comunicarea cu API-ul E·ON România."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        username: str,
+        password: str,
+        max_concurrency: int = SCHEDULER_CONCURRENCY,
+        hedge_endpoints: frozenset[str] = HEDGE_ENDPOINTS,
+        broker: TokenBroker | None = None,
+        connection_stats: ConnectionStats | None = None,
+        scheduler: RequestScheduler | None = None,
+    ):
+        """Inițializează clientul API cu o sesiune de tip ClientSession.
+
+        `max_concurrency` limitează câte cereri HTTP ale acestui cont pot fi
+        simultan în zbor (vezi RequestScheduler). `hedge_endpoints` sunt
+        endpoint-urile GET pentru care se trimite o copie când prima cerere
+        depășește p95 (mulțime vidă = fără hedging). `broker` e broker-ul de
+        token partajat al contului; fără el, clientul își creează unul propriu.
+        `connection_stats` sunt contoarele sesiunii dedicate (vezi connection.py),
+        dacă sesiunea primită e una dedicată. `scheduler` e planificatorul
+        partajat al contului (dimensionat ca limita per gazdă a sesiunii); fără
+        el, clientul își creează unul propriu, cu `max_concurrency` sloturi.
+        """
+        self._session = session
+        self._timeout = ClientTimeout(total=API_TIMEOUT)
+
+        # Tokenul e gestionat de broker-ul contului (partajat între intrări)
+        self._broker = broker if broker is not None else TokenBroker(session, username, password)
+        self._connection_stats = connection_stats
+
+        # ── Single-flight ──
+        # Cereri GET identice (aceeași metodă + URL) aflate simultan în zbor
+        # sunt comasate într-un singur apel HTTP; rezultatul se livrează
+        # tuturor celor care așteaptă (ex. coordinatoare DUO pe același cont).
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # ── Cache răspunsuri (TTL per endpoint, LRU) ──
+        self._cache = ResponseCache(CACHE_TTL, CACHE_MAX_ENTRIES)
+
+        # ── Cereri condiționale (ETag / If-Modified-Since + hash corp) ──
+        self._validators = ValidatorStore(CONDITIONAL_MAX_ENTRIES)
+
+        # ── Planificator: concurență + ritm + backoff la 429 / Retry-After ──
+        # Partajat per cont (ca sesiunea): N intrări nu înseamnă N × concurență
+        if scheduler is None:
+            scheduler = RequestScheduler(
+                concurrency=max_concurrency,
+                rate=SCHEDULER_RATE,
+                burst=SCHEDULER_BURST,
+                backoff_base=SCHEDULER_BACKOFF_BASE,
+                backoff_max=SCHEDULER_BACKOFF_MAX,
+            )
+        self._scheduler = scheduler
+
+        # ── Circuit breaker per endpoint (creat la prima cerere) ──
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+        # ── Latență per endpoint → timeout adaptiv (profil persistat de __init__) ──
+        self._latency = LatencyTracker(
+            multiplier=LATENCY_TIMEOUT_MULTIPLIER,
+            floor=LATENCY_TIMEOUT_FLOOR,
+            ceiling=API_TIMEOUT,
+            min_samples=LATENCY_MIN_SAMPLES,
+        )
+
+        # ── Hedging (doar GET, doar endpoint-urile alese, cu buget) ──
+        self._hedge_endpoints = hedge_endpoints
+        self._hedge_budget = HedgeBudget(HEDGE_BUDGET_RATIO)
+
+        # Contoare expuse în diagnostics
+        self._stats: dict[str, int] = {
+            "http_requests": 0,
+            "coalesced": 0,
+            "not_modified": 0,
+            "unchanged_body": 0,
+            "prefetch_pages": 0,
+            "prefetch_wasted": 0,
+            "retries": 0,
+            "retries_exhausted": 0,
+            "breaker_fallbacks": 0,
+            "details_batches": 0,
+            "details_batch_fallbacks": 0,
+            "details_batch_disabled": 0,
+            "prewarm_runs": 0,
+            "prewarm_skipped": 0,
+            "prewarm_connections": 0,
+        }
+
+        # Momentul ultimului răspuns HTTP (conexiunile sunt probabil încă deschise)
+        self._last_activity: float | None = None
+
+        # Lotul de detalii a întors date inutilizabile → doar cereri individuale în sesiunea curentă
+        self._details_batch_usable = True
+
+    # ──────────────────────────────────────────
+    # Proprietăți publice (autentificarea e delegată broker-ului)
+    # ──────────────────────────────────────────
+
+    @property
+    def broker(self) -> TokenBroker:
+        """Broker-ul de token al contului."""
+        return self._broker
+
+    @property
+    def has_token(self) -> bool:
+        """Verifică dacă există un token setat (nu garantează validitatea)."""
+        return self._broker.has_token
+
+    @property
+    def uuid(self) -> str | None:
+        """Returnează UUID-ul utilizatorului autentificat."""
+        return self._broker.uuid
+
+    @property
+    def mfa_required(self) -> bool:
+        """Verifică dacă login-ul a returnat cerință MFA (2FA)."""
+        return self._broker.mfa_required
+
+    @property
+    def mfa_data(self) -> dict | None:
+        """Returnează datele MFA (uuid, type, recipient, etc.) sau None."""
+        return self._broker.mfa_data
+
+    @property
+    def mfa_blocked(self) -> bool:
+        """True dacă login-ul e blocat din cauza MFA necesar în background."""
+        return self._broker.mfa_blocked
+
+    def clear_mfa_block(self) -> None:
+        """Resetează blocajul MFA (apelat după reconfigurare prin UI)."""
+        self._broker.clear_mfa_block()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Statistici interne ale clientului (pentru diagnostics.py)."""
+        return {
+            "json_backend": JSON_BACKEND,
+            **self._stats,
+            "inflight": len(self._inflight),
+            "cache": self._cache.stats(),
+            "validators": len(self._validators),
+            "scheduler": self._scheduler.stats(),
+            "breakers": {
+                name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())
+            },
+            "latency": self._latency.stats(),
+            "hedging": self._hedge_budget.stats(),
+            "token": self._broker.diagnostics(),
+            "connections": (
+                self._connection_stats.stats()
+                if self._connection_stats is not None
+                else "sesiune partajată HA"
+            ),
+        }
+
+    def counters(self) -> dict[str, int]:
+        """Contoare cumulative ieftine (pentru măsurarea unui singur refresh)."""
+        counters = {"http_requests": self._stats["http_requests"]}
+        if self._connection_stats is not None:
+            counters["connections_created"] = self._connection_stats.stats()["created"]
+        return counters
+
+    @staticmethod
+    def reset_request_outcome() -> None:
+        """Începe o nouă urmărire a eșecurilor pentru task-ul curent (vezi requests_failed)."""
+        _REQUEST_FAILED.set(False)
+
+    @property
+    def requests_failed(self) -> bool:
+        """True dacă o cerere GET din task-ul curent a eșuat de la reset_request_outcome().
+
+        Permite deosebirea unui eșec (date anterioare păstrate, reîncercare la
+        ciclul următor) de un răspuns definitiv fără date (ex. fără prosumator).
+        """
+        return _REQUEST_FAILED.get()
+
+    def export_latency_profile(self) -> dict[str, Any]:
+        """Profilul de latență învățat (pentru persistare între reporniri)."""
+        return self._latency.export_profile()
+
+    def import_latency_profile(self, profile: dict[str, Any] | None) -> None:
+        """Restaurează un profil de latență salvat anterior."""
+        self._latency.import_profile(profile)
+
+    def invalidate_cache(self, endpoint: str | None = None, account_contract: str | None = None) -> None:
+        """Elimină din cache răspunsurile unui endpoint și/sau ale unui contract.
+
+        Fără argumente golește tot cache-ul.
+        """
+        removed = self._cache.invalidate(endpoint, account_contract)
+        _LOGGER.debug(
+            "[CACHE] Invalidare (endpoint=%s, contract=%s): %s intrări eliminate.",
+            endpoint or "toate", account_contract or "toate", removed,
+        )
+
+    def is_token_likely_valid(self) -> bool:
+        """Verifică dacă tokenul există ȘI nu a depășit durata maximă estimată."""
+        return self._broker.is_token_likely_valid()
+
+    def export_token_data(self) -> dict | None:
+        """Exportă datele de token (vezi TokenBroker.export_token_data)."""
+        return self._broker.export_token_data()
+
+    def inject_token(self, token_data: dict) -> None:
+        """Injectează un token existent (vezi TokenBroker.inject_token)."""
+        self._broker.inject_token(token_data)
+
+    def add_token_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Apelează `listener` după fiecare token nou. Returnează funcția de dezabonare."""
+        return self._broker.add_token_listener(listener)
+
+    async def async_token_renewal_loop(self) -> None:
+        """Reînnoirea proactivă a tokenului (vezi TokenBroker.async_token_renewal_loop)."""
+        await self._broker.async_token_renewal_loop()
+
+    async def async_login(self) -> bool:
+        """Login complet (vezi TokenBroker.async_login)."""
+        return await self._broker.async_login()
+
+    async def async_mfa_complete(self, code: str) -> bool:
+        """Finalizează login-ul 2FA cu codul primit."""
+        return await self._broker.async_mfa_complete(code)
+
+    async def async_mfa_resend(self, mfa_type: str | None = None) -> bool:
+        """Retrimite codul MFA (opțional pe alt canal)."""
+        return await self._broker.async_mfa_resend(mfa_type)
+
+    async def async_refresh_token(self) -> bool:
+        """Reîmprospătează tokenul folosind refresh_token."""
+        return await self._broker.async_refresh_token()
+
+    def invalidate_token(self) -> None:
+        """Invalidează tokenul curent (pentru a forța re-autentificare)."""
+        self._broker.invalidate_token()
+
+    async def async_ensure_authenticated(self) -> bool:
+        """Asigură un token valid (refresh sau login complet, o singură dată per cont)."""
+        return await self._broker.async_ensure_authenticated()
+
+    # ──────────────────────────────────────────
+    # Pre-încălzirea conexiunilor
+    # ──────────────────────────────────────────
+
+    async def async_prewarm(self, connections: int = PREWARM_CONNECTIONS, idle_after: float = 0.0) -> int:
+        """Deschide din timp conexiuni (DNS + TCP + TLS) către API.
+
+        Apelat cu câteva secunde înainte de un refresh programat: rafala de
+        cereri a refresh-ului găsește conexiunile deja deschise în pool.
+        Cererile de încălzire sunt HEAD-uri neautentificate pe gazda API-ului
+        (răspunsul nu contează), ritmate de planificator. Nu face nimic dacă
+        clientul a avut trafic în ultimele `idle_after` secunde (conexiunile
+        sunt probabil încă deschise). Returnează câte conexiuni au răspuns.
+        """
+        if self._last_activity is not None and time.monotonic() - self._last_activity < idle_after:
+            self._stats["prewarm_skipped"] += 1
+            return 0
+
+        timeout = ClientTimeout(total=PREWARM_TIMEOUT)
+
+        async def _warm_one() -> bool:
+            try:
+                async with self._scheduler.slot(), self._session.head(
+                    API_BASE, headers=HEADERS, timeout=timeout, allow_redirects=False
+                ):
+                    return True
+            except (ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("[PREWARM] Conexiune eșuată: %s", err)
+                return False
+
+        results = await asyncio.gather(*(_warm_one() for _ in range(max(1, connections))))
+        warmed = sum(results)
+        if warmed:
+            self._last_activity = time.monotonic()
+        self._stats["prewarm_runs"] += 1
+        self._stats["prewarm_connections"] += warmed
+        _LOGGER.debug("[PREWARM] %s/%s conexiuni deschise înainte de refresh.", warmed, len(results))
+        return warmed
+
     # ──────────────────────────────────────────
     # Date utilizator
     # ──────────────────────────────────────────
@@ -549,11 +1156,13 @@ class EonApiClient:
             method="GET",
             url=URL_USER_DETAILS,
             label="user_details",
+            endpoint="user_details",
         )
+        # Doar cheile — date personale
         _LOGGER.debug(
             "[user_details] Date primite: type=%s, keys=%s",
             type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
+            _Lazy(_payload_keys, result),
         )
         return result
 
@@ -578,15 +1187,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label="contracts_list",
+            endpoint="contracts_list",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[contracts_list] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload("contracts_list", result)
         return result
 
     async def async_fetch_contract_details(self, account_contract: str, include_meter_reading: bool = True):
@@ -598,15 +1201,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=f"contract_details ({account_contract})",
+            endpoint="contract_details",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[contract_details %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"contract_details {account_contract}", result)
         return result
 
     async def async_fetch_contracts_with_subcontracts(self, account_contract: str | None = None):
@@ -624,16 +1221,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=label,
+            endpoint="contracts_with_subcontracts",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[%s] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            label,
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(label, result)
         return result
 
     async def async_fetch_contracts_details_list(self, account_contracts: list[str]):
@@ -653,18 +1243,81 @@ class EonApiClient:
             url=URL_CONTRACTS_DETAILS_LIST,
             payload=payload,
             label=label,
+            policy=RETRY_IDEMPOTENT,  # doar citire — sigur de repetat
+            endpoint="contracts_details_list",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[%s] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            label,
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(label, result)
         return result
 
+    async def async_fetch_contract_details_batch(self, account_contracts: list[str]) -> dict[str, dict]:
+        """Detaliile mai multor contracte, prin URL_CONTRACTS_DETAILS_LIST în loturi.
+
+        Contractele sunt trimise în loturi de CONTRACTS_DETAILS_BATCH_SIZE, în
+        paralel; răspunsurile sunt asociate după accountContract. Contractele
+        care lipsesc din răspuns (sau dintr-un lot eșuat) sunt cerute individual
+        (async_fetch_contract_details). Returnează {accountContract: detalii}.
+
+        Sunt păstrate doar elementele cu forma detaliilor complete (vezi
+        _is_full_contract_details). Dacă un lot răspunde, dar fără niciun element
+        utilizabil, lotul e abandonat pentru restul sesiunii: altfel fiecare
+        refresh ar costa cererea în lot plus N cereri individuale.
+        """
+        codes = list(dict.fromkeys(str(code) for code in account_contracts if code))
+        if not codes:
+            return {}
+        if not self._details_batch_usable:
+            return await self._async_fetch_contract_details_each(codes)
+        chunks = [
+            codes[i:i + CONTRACTS_DETAILS_BATCH_SIZE]
+            for i in range(0, len(codes), CONTRACTS_DETAILS_BATCH_SIZE)
+        ]
+        self._stats["details_batches"] += len(chunks)
+        results = await asyncio.gather(
+            *(self.async_fetch_contracts_details_list(chunk) for chunk in chunks)
+        )
+
+        wanted = set(codes)
+        details: dict[str, dict] = {}
+        answered = False
+        for result in results:
+            if not isinstance(result, list):
+                continue
+            answered = answered or bool(result)
+            for item in result:
+                if not _is_full_contract_details(item):
+                    continue
+                code = str(item["accountContract"])
+                if code in wanted:
+                    details[code] = item
+
+        if answered and not details:
+            # Răspuns valid, dar fără detalii complete (ex. doar starea facturii electronice)
+            self._details_batch_usable = False
+            self._stats["details_batch_disabled"] += 1
+            _LOGGER.warning(
+                "[contracts_details_list] Răspunsul în lot nu conține detaliile complete ale "
+                "contractelor — se folosesc cererile individuale până la repornire."
+            )
+
+        missing = [code for code in codes if code not in details]
+        if missing:
+            self._stats["details_batch_fallbacks"] += len(missing)
+            _LOGGER.debug(
+                "[contracts_details_list] %s/%s contracte lipsă din răspuns — se cer individual.",
+                len(missing), len(codes),
+            )
+            details.update(await self._async_fetch_contract_details_each(missing))
+        return details
+
+    async def _async_fetch_contract_details_each(self, codes: list[str]) -> dict[str, dict]:
+        """Detaliile contractelor, câte o cerere individuală per contract (în paralel)."""
+        results = await asyncio.gather(
+            *(self.async_fetch_contract_details(code) for code in codes)
+        )
+        return {
+            code: item for code, item in zip(codes, results) if isinstance(item, dict)
+        }
+
     # ──────────────────────────────────────────
     # Facturi & Plăți
     # ──────────────────────────────────────────
@@ -678,36 +1331,23 @@ class EonApiClient:
             method="GET",
             url=f"{URL_INVOICES_UNPAID}{params}",
             label=f"invoices_unpaid ({account_contract})",
+            endpoint="invoices_unpaid",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[invoices_unpaid %s] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            account_contract,
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"invoices_unpaid {account_contract}", result)
         return result
 
-    async def async_fetch_invoices_prosum(self, account_contract: str, max_pages: int | None = None):
-        """Obține facturile de prosumator (paginate)."""
+    async def async_fetch_invoices_prosum(self, account_contract: str, max_pages: int | None = None, prefetch: int = 0):
+        """Obține facturile de prosumator (paginate, opțional cu prefetch speculativ)."""
         result = await self._paginated_request(
             base_url=URL_INVOICES_PROSUM,
             params={"accountContract": account_contract},
             list_key="list",
             label=f"invoices_prosum ({account_contract})",
             max_pages=max_pages,
+            prefetch=prefetch,
+            endpoint="invoices_prosum",
         )
-        # Debug clar pentru datele cumulate
-        _LOGGER.debug(
-            "[invoices_prosum %s] Date cumulate: type=%s, len=%s, sample keys=%s, sample content=%s",
-            account_contract,
-            type(result).__name__,
-            len(result) if isinstance(result, list) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"invoices_prosum {account_contract}", result, "Date cumulate")
         return result
 
     async def async_fetch_invoice_balance(self, account_contract: str, include_subcontracts: bool = False):
@@ -719,15 +1359,9 @@ class EonApiClient:
             method="GET",
             url=f"{URL_INVOICE_BALANCE}{params}",
             label=f"invoice_balance ({account_contract})",
+            endpoint="invoice_balance",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[invoice_balance %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"invoice_balance {account_contract}", result)
         return result
 
     async def async_fetch_invoice_balance_prosum(self, account_contract: str, include_subcontracts: bool = False):
@@ -739,37 +1373,69 @@ class EonApiClient:
             method="GET",
             url=f"{URL_INVOICE_BALANCE_PROSUM}{params}",
             label=f"invoice_balance_prosum ({account_contract})",
+            endpoint="invoice_balance_prosum",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[invoice_balance_prosum %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"invoice_balance_prosum {account_contract}", result)
         return result
 
-    async def async_fetch_payments(self, account_contract: str, max_pages: int | None = None):
-        """Obține înregistrările de plăți (paginate)."""
+    async def async_fetch_payments(self, account_contract: str, max_pages: int | None = None, prefetch: int = 0):
+        """Obține înregistrările de plăți (paginate, opțional cu prefetch speculativ)."""
         result = await self._paginated_request(
             base_url=URL_PAYMENT_LIST,
             params={"accountContract": account_contract},
             list_key="list",
             label=f"payments ({account_contract})",
             max_pages=max_pages,
+            prefetch=prefetch,
+            endpoint="payments",
         )
-        # Debug clar pentru datele cumulate
-        _LOGGER.debug(
-            "[payments %s] Date cumulate: type=%s, len=%s, sample keys=%s, sample content=%s",
-            account_contract,
-            type(result).__name__,
-            len(result) if isinstance(result, list) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"payments {account_contract}", result, "Date cumulate")
         return result
 
+    def async_iter_payments(
+        self,
+        account_contract: str,
+        max_pages: int | None = None,
+        prefetch: int = 0,
+        cursor: PageCursor | None = None,
+    ) -> AsyncIterator[list]:
+        """Livrează plățile pagină cu pagină (cele mai recente întâi).
+
+        Permite oprirea devreme (ex. la prima plată deja cunoscută) fără a
+        aduce restul istoricului. Folosiți contextlib.aclosing() dacă ieșiți
+        din buclă înainte de final. Dacă e dat, `cursor` arată la final câte
+        pagini s-au livrat și dacă s-a ajuns la ultima pagină reală.
+        """
+        return self._iter_pages(
+            base_url=URL_PAYMENT_LIST,
+            params={"accountContract": account_contract},
+            list_key="list",
+            label=f"payments ({account_contract})",
+            max_pages=max_pages,
+            prefetch=prefetch,
+            cursor=cursor,
+            endpoint="payments",
+        )
+
+    def async_iter_invoices_prosum(
+        self,
+        account_contract: str,
+        max_pages: int | None = None,
+        prefetch: int = 0,
+        cursor: PageCursor | None = None,
+    ) -> AsyncIterator[list]:
+        """Livrează facturile de prosumator pagină cu pagină (vezi async_iter_payments)."""
+        return self._iter_pages(
+            base_url=URL_INVOICES_PROSUM,
+            params={"accountContract": account_contract},
+            list_key="list",
+            label=f"invoices_prosum ({account_contract})",
+            max_pages=max_pages,
+            prefetch=prefetch,
+            cursor=cursor,
+            endpoint="invoices_prosum",
+        )
+
     async def async_fetch_rescheduling_plans(self, account_contract: str, include_subcontracts: bool = False, status: str | None = None):
         """Obține planurile de eșalonare."""
         params = f"?accountContract={account_contract}"
@@ -781,16 +1447,9 @@ class EonApiClient:
             method="GET",
             url=f"{URL_RESCHEDULING_PLANS}{params}",
             label=f"rescheduling_plans ({account_contract})",
+            endpoint="rescheduling_plans",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[rescheduling_plans %s] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            account_contract,
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"rescheduling_plans {account_contract}", result)
         return result
 
     async def async_fetch_graphic_consumption(self, account_contract: str):
@@ -800,15 +1459,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=f"graphic_consumption ({account_contract})",
+            endpoint="graphic_consumption",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[graphic_consumption %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"graphic_consumption {account_contract}", result)
         return result
 
     # ──────────────────────────────────────────
@@ -822,15 +1475,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=f"meter_index ({account_contract})",
+            endpoint="meter_index",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[meter_index %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"meter_index {account_contract}", result)
         return result
 
     async def async_fetch_meter_history(self, account_contract: str):
@@ -840,16 +1487,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=f"meter_history ({account_contract})",
+            endpoint="meter_history",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[meter_history %s] Date primite: type=%s, len=%s, sample keys=%s, sample content=%s",
-            account_contract,
-            type(result).__name__,
-            len(result) if isinstance(result, (list, dict)) else "N/A",
-            list(result[0].keys()) if isinstance(result, list) and result else list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"meter_history {account_contract}", result)
         return result
 
     async def async_fetch_consumption_convention(self, account_contract: str):
@@ -859,15 +1499,9 @@ class EonApiClient:
             method="GET",
             url=url,
             label=f"consumption_convention ({account_contract})",
+            endpoint="consumption_convention",
         )
-        # Debug clar pentru datele primite
-        _LOGGER.debug(
-            "[consumption_convention %s] Date primite: type=%s, keys=%s, sample=%s",
-            account_contract,
-            type(result).__name__,
-            list(result.keys()) if isinstance(result, dict) else "N/A",
-            json.dumps(result, default=str)[:500] if result else "None"
-        )
+        _debug_payload(f"consumption_convention {account_contract}", result)
         return result
 
     async def async_submit_meter_index(
@@ -886,200 +1520,443 @@ class EonApiClient:
             "indexes": indexes,
         }
 
-        if not await self._ensure_token_valid():
-            _LOGGER.error("[%s] Token invalid. Trimiterea nu poate fi efectuată.", label)
-            return None
-
-        gen_before = self._token_generation
-        headers = {**HEADERS, "Authorization": f"{self._token_type} {self._access_token}"}
-
-        _LOGGER.debug("[%s] Trimitere cerere: URL=%s, Payload=%s", label, URL_METER_SUBMIT, json.dumps(payload))
+        _LOGGER.debug("[%s] Trimitere cerere: URL=%s, Payload=%s", label, URL_METER_SUBMIT, _Lazy(json.dumps, payload))
 
-        try:
-            async with self._session.post(
-                URL_METER_SUBMIT,
-                json=payload,
-                headers=headers,
-                timeout=self._timeout,
-            ) as resp:
-                response_text = await resp.text()
-                _LOGGER.debug("[%s] Răspuns: Status=%s, Body=%s", label, resp.status, response_text)
-
-                if resp.status == 200:
-                    data = await resp.json()
-                    # Debug clar pentru datele primite la submit
-                    _LOGGER.debug(
-                        "[%s] Date primite: type=%s, keys=%s, sample=%s",
-                        label,
-                        type(data).__name__,
-                        list(data.keys()) if isinstance(data, dict) else "N/A",
-                        json.dumps(data, default=str)[:500] if data else "None"
-                    )
-                    _LOGGER.debug("[%s] Index trimis cu succes.", label)
-                    return data
-
-                if resp.status == 401:
-                    # Verifică dacă alt apel a reînnoit deja tokenul
-                    if self._token_generation != gen_before:
-                        _LOGGER.debug("[%s] Token reînnoit de alt apel. Se reîncearcă.", label)
-                    else:
-                        _LOGGER.warning("[%s] Token invalid (401). Se reîncearcă...", label)
-                        self.invalidate_token()
-                        if not await self._ensure_token_valid():
-                            _LOGGER.error("[%s] Reautentificare eșuată.", label)
-                            return None
-
-                    headers_retry = {**HEADERS, "Authorization": f"{self._token_type} {self._access_token}"}
-                    async with self._session.post(
-                        URL_METER_SUBMIT,
-                        json=payload,
-                        headers=headers_retry,
-                        timeout=self._timeout,
-                    ) as resp_retry:
-                        response_text_retry = await resp_retry.text()
-                        _LOGGER.debug("[%s] Reîncercare: Status=%s, Body=%s", label, resp_retry.status, response_text_retry)
-                        if resp_retry.status == 200:
-                            data_retry = await resp_retry.json()
-                            # Debug clar pentru datele primite la retry
-                            _LOGGER.debug(
-                                "[%s] Date primite (retry): type=%s, keys=%s, sample=%s",
-                                label,
-                                type(data_retry).__name__,
-                                list(data_retry.keys()) if isinstance(data_retry, dict) else "N/A",
-                                json.dumps(data_retry, default=str)[:500] if data_retry else "None"
-                            )
-                            _LOGGER.debug("[%s] Index trimis cu succes (după reautentificare).", label)
-                            return data_retry
-                        _LOGGER.error("[%s] Reîncercare eșuată. Cod HTTP=%s", label, resp_retry.status)
-                        return None
-
-                _LOGGER.error("[%s] Eroare. Cod HTTP=%s, Răspuns=%s", label, resp.status, response_text)
-                return None
-
-        except asyncio.TimeoutError:
-            _LOGGER.error("[%s] Depășire de timp.", label)
-            return None
-        except Exception as e:
-            _LOGGER.exception("[%s] Eroare: %s", label, e)
+        # Cererea trece prin planificator ca oricare alta; la 401 se
+        # reautentifică și se retrimite o singură dată (nu poate fi dublată,
+        # serverul a respins-o înainte de procesare). Niciodată reîncercată
+        # automat la timeout/5xx: indexul ar putea fi deja înregistrat.
+        data = await self._request_with_token_post(
+            URL_METER_SUBMIT, payload, label, policy=RETRY_NEVER
+        )
+        if data is None:
+            _LOGGER.error("[%s] Trimiterea indexului a eșuat.", label)
             return None
 
+        _LOGGER.debug("[%s] Index trimis cu succes.", label)
+        self._invalidate_meter_cache(account_contract)
+        return data
+
     # ──────────────────────────────────────────
     # Metode interne
     # ──────────────────────────────────────────
 
-    async def _request_with_token(self, method: str, url: str, label: str = "request"):
+    def _invalidate_meter_cache(self, account_contract: str) -> None:
+        """După trimiterea indexului, citirile contorului din cache nu mai sunt actuale."""
+        self.invalidate_cache("meter_index", account_contract)
+        self.invalidate_cache("meter_history", account_contract)
+
+    async def _request_with_token(
+        self,
+        method: str,
+        url: str,
+        label: str = "request",
+        endpoint: str | None = None,
+    ):
+        """
+        Cerere cu gestionare automată a tokenului, cache TTL și comasare single-flight.
+
+        Endpoint-urile cu TTL în CACHE_TTL sunt servite din cache cât timp
+        intrarea e validă. Cererile GET identice aflate deja în zbor nu mai
+        pleacă a doua oară: apelantul așteaptă rezultatul cererii existente.
+        asyncio.shield garantează că anularea unui apelant nu anulează
+        cererea comună.
+        """
+        if method != "GET":
+            response = await self._request_with_token_uncoalesced(method, url, label, endpoint)
+            if not _is_definitive(response.status):
+                _REQUEST_FAILED.set(True)
+            return response.data
+
+        key = f"{method} {url}"
+        cacheable = self._cache.is_cacheable(endpoint)
+        if cacheable:
+            cached = self._cache.get(key)
+            if cached is not None:
+                _LOGGER.debug("[%s] Servit din cache.", label)
+                return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            _LOGGER.debug("[%s] Cerere identică deja în zbor — se reutilizează rezultatul.", label)
+            response = await asyncio.shield(inflight)
+            if not _is_definitive(response.status):
+                _REQUEST_FAILED.set(True)
+            return response.data
+
+        task = asyncio.ensure_future(
+            self._request_with_token_uncoalesced(method, url, label, endpoint)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _task: self._inflight.pop(key, None))
+        response = await asyncio.shield(task)
+        if not _is_definitive(response.status):
+            _REQUEST_FAILED.set(True)
+        result = response.data
+        # Cu circuitul deschis, rezultatul sunt datele anterioare — nu le fixăm în cache
+        if cacheable and self._breaker_closed(endpoint):
+            self._cache.set(key, endpoint, result)
+        return result
+
+    async def _request_with_token_uncoalesced(
+        self,
+        method: str,
+        url: str,
+        label: str = "request",
+        endpoint: str | None = None,
+    ):
         """
         Cerere cu gestionare automată a tokenului.
 
-        1. Asigură token valid (protejat de _auth_lock)
+        1. Asigură token valid (prin broker-ul contului)
         2. Execută cererea
         3. La 401: verifică dacă alt apel a reînnoit deja tokenul, altfel refresh/login + reîncearcă
+
+        Returnează _ApiResponse (status 401 dacă autentificarea a eșuat), ca
+        apelanții să poată deosebi un eșec de un răspuns gol.
         """
-        if not await self._ensure_token_valid():
+        if not await self._broker.async_ensure_authenticated():
             _LOGGER.error("[%s] Nu s-a putut obține un token valid.", label)
-            return None
+            return _ApiResponse(None, 401)
 
         # Memorează generația tokenului înainte de request
-        gen_before = self._token_generation
+        gen_before = self._broker.generation
 
         # Prima încercare
-        resp_data, status = await self._do_request(method, url, label)
-        if status != 401:
-            return resp_data
+        response = await self._send(method, url, label, RETRY_IDEMPOTENT, endpoint)
+        if response.status != 401:
+            return response
 
         # 401 → verifică dacă alt apel concurent a reînnoit deja tokenul
-        if self._token_generation != gen_before:
-            _LOGGER.debug("[%s] Cod HTTP=401, dar tokenul a fost deja reînnoit (gen %s→%s). Se reîncearcă.", label, gen_before, self._token_generation)
+        if self._broker.generation != gen_before:
+            _LOGGER.debug("[%s] Cod HTTP=401, dar tokenul a fost deja reînnoit (gen %s→%s). Se reîncearcă.", label, gen_before, self._broker.generation)
         else:
             # Tokenul nu a fost reînnoit — forțăm refresh/login
             _LOGGER.warning("[%s] Cod HTTP=401 → se reîncearcă cu refresh token.", label)
             self.invalidate_token()
-            if not await self._ensure_token_valid():
+            if not await self._broker.async_ensure_authenticated():
                 _LOGGER.error("[%s] Reautentificare eșuată.", label)
-                return None
+                return _ApiResponse(None, 401)
 
         # A doua încercare
-        resp_data, status = await self._do_request(method, url, label)
-        if status == 401:
+        response = await self._send(method, url, label, RETRY_IDEMPOTENT, endpoint)
+        if response.status == 401:
             _LOGGER.error("[%s] A doua încercare eșuată (401). Se abandonează.", label)
-            return None
+        return response
 
-        return resp_data
-
-    async def _request_with_token_post(self, url: str, payload, label: str = "request_post"):
+    async def _request_with_token_post(
+        self,
+        url: str,
+        payload,
+        label: str = "request_post",
+        policy: RetryPolicy = RETRY_NEVER,
+        endpoint: str | None = None,
+    ):
         """
         Cerere POST cu body JSON și gestionare automată a tokenului.
 
-        Similar cu _request_with_token, dar trimite payload JSON.
+        Similar cu _request_with_token, dar trimite payload JSON. Implicit
+        fără reîncercări la erori tranzitorii (POST poate avea efecte);
+        POST-urile doar de citire pot cere explicit RETRY_IDEMPOTENT.
         """
-        if not await self._ensure_token_valid():
+        if not await self._broker.async_ensure_authenticated():
             _LOGGER.error("[%s] Nu s-a putut obține un token valid.", label)
             return None
 
-        gen_before = self._token_generation
+        gen_before = self._broker.generation
 
         # Prima încercare
-        resp_data, status = await self._do_request("POST", url, label, json_payload=payload)
-        if status != 401:
-            return resp_data
+        response = await self._send("POST", url, label, policy, endpoint, json_payload=payload)
+        if response.status != 401:
+            return response.data
 
         # 401 → verifică dacă alt apel concurent a reînnoit deja tokenul
-        if self._token_generation != gen_before:
-            _LOGGER.debug("[%s] Cod HTTP=401, dar tokenul a fost deja reînnoit (gen %s→%s). Se reîncearcă.", label, gen_before, self._token_generation)
+        if self._broker.generation != gen_before:
+            _LOGGER.debug("[%s] Cod HTTP=401, dar tokenul a fost deja reînnoit (gen %s→%s). Se reîncearcă.", label, gen_before, self._broker.generation)
         else:
             _LOGGER.warning("[%s] Cod HTTP=401 → se reîncearcă cu refresh token.", label)
             self.invalidate_token()
-            if not await self._ensure_token_valid():
+            if not await self._broker.async_ensure_authenticated():
                 _LOGGER.error("[%s] Reautentificare eșuată.", label)
                 return None
 
         # A doua încercare
-        resp_data, status = await self._do_request("POST", url, label, json_payload=payload)
-        if status == 401:
+        response = await self._send("POST", url, label, policy, endpoint, json_payload=payload)
+        if response.status == 401:
             _LOGGER.error("[%s] A doua încercare eșuată (401). Se abandonează.", label)
             return None
 
-        return resp_data
+        return response.data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        label: str,
+        policy: RetryPolicy,
+        endpoint: str | None = None,
+        json_payload=None,
+    ) -> _ApiResponse:
+        """Execută cererea conform politicii de reîncercare și a circuit breaker-ului.
+
+        Se reîncearcă doar erorile tranzitorii (timeout, rețea, 429/5xx), cu
+        backoff exponențial și jitter. Toate încercările — inclusiv așteptările
+        — se încadrează în bugetul `policy.deadline`; timeout-ul fiecărei
+        încercări e redus la timpul rămas din buget.
+
+        Prima încercare folosește timeout-ul adaptiv al endpoint-ului (învățat
+        din latența observată); reîncercările revin la API_TIMEOUT, ca un
+        endpoint încetinit să nu fie tăiat sistematic.
+
+        Fiecare încercare e raportată breaker-ului endpoint-ului. Cât timp
+        acesta e deschis, cererea nu mai pleacă: se returnează imediat ultimele
+        date obținute pentru același URL (sau None), cu status 0.
+
+        Responsabilitățile nu se suprapun: eșecurile unui endpoint (timeout,
+        5xx) țin de reîncercări și de breaker-ul lui, fără efect asupra altor
+        endpoint-uri; o limitare a contului (429 / Retry-After) ține de
+        planificator — pauza lui se aplică deja următoarei încercări, deci nu
+        se mai adaugă backoff local și breaker-ul nu o numără ca eșec.
+        """
+        breaker = self._breaker(endpoint)
+        deadline = time.monotonic() + policy.deadline if policy.deadline else None
+        attempt = 1
+        while True:
+            if breaker is not None and not breaker.allow():
+                return self._breaker_fallback(method, url, label)
+
+            seconds = float(API_TIMEOUT)
+            if attempt == 1 and endpoint is not None:
+                seconds = self._latency.timeout(endpoint)
+            if deadline is not None:
+                seconds = min(seconds, max(deadline - time.monotonic(), 1.0))
+            timeout = self._timeout if seconds >= API_TIMEOUT else ClientTimeout(total=seconds)
+
+            if attempt == 1 and method == "GET" and endpoint in self._hedge_endpoints:
+                response = await self._do_request_hedged(method, url, label, timeout, endpoint)
+            else:
+                response = await self._do_request(
+                    method, url, label, json_payload, timeout, endpoint
+                )
+            if breaker is not None and not response.throttled:
+                breaker.record(response.status)
+            if response.status not in TRANSIENT_STATUSES:
+                return response
+            if attempt >= policy.attempts:
+                break
+
+            # Pauza impusă de planificator întârzie deja încercarea următoare
+            delay = 0.0 if response.throttled else policy.backoff(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                _LOGGER.debug("[%s] Buget de timp epuizat — fără alte reîncercări.", label)
+                break
+
+            self._stats["retries"] += 1
+            _LOGGER.debug(
+                "[%s] Eroare tranzitorie (cod HTTP=%s) — reîncercarea %s/%s în %.1fs.",
+                label, response.status, attempt, policy.attempts - 1, delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if attempt > 1:
+            self._stats["retries_exhausted"] += 1
+            _LOGGER.warning("[%s] Eșec după %s încercări (cod HTTP=%s).", label, attempt, response.status)
+        if breaker is not None and breaker.state != STATE_CLOSED:
+            # Eșecul acesta a deschis circuitul — aceeași regulă ca pentru cererile următoare
+            return self._breaker_fallback(method, url, label)
+        return response
+
+    async def _do_request_hedged(
+        self,
+        method: str,
+        url: str,
+        label: str,
+        timeout: ClientTimeout,
+        endpoint: str,
+    ) -> _ApiResponse:
+        """Cerere cu „hedge": dacă depășește p95, pleacă o copie; câștigă primul răspuns util.
+
+        Copia se trimite doar dacă endpoint-ul are destule eșantioane de
+        latență și bugetul permite. Cererea rămasă în urmă e anulată.
+        """
+        self._hedge_budget.record_request()
+        hedge_after = self._latency.percentile(endpoint, HEDGE_PERCENTILE)
+        if hedge_after is None:
+            return await self._do_request(method, url, label, None, timeout, endpoint)
+
+        primary = asyncio.ensure_future(
+            self._do_request(method, url, label, None, timeout, endpoint)
+        )
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if done or not self._hedge_budget.try_acquire():
+                return await primary
+
+            _LOGGER.debug("[%s] Peste p95 (%.2fs) — se trimite o copie.", label, hedge_after)
+            hedge = asyncio.ensure_future(
+                self._do_request(method, url, f"{label} hedge", None, timeout, endpoint)
+            )
+            pending = {primary, hedge}
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Dacă ambele s-au terminat simultan, primara are prioritate
+                winner = primary if primary in done else next(iter(done))
+                response = winner.result()
+                if response.status not in TRANSIENT_STATUSES or not pending:
+                    if winner is hedge:
+                        self._hedge_budget.record_win()
+                    return response
+        finally:
+            # Cererea rămasă în urmă (sau ambele, dacă apelantul a fost anulat)
+            for task in pending:
+                task.cancel()
+
+    def _breaker(self, endpoint: str | None) -> CircuitBreaker | None:
+        """Breaker-ul unui endpoint (creat la prima utilizare); None fără endpoint."""
+        if endpoint is None:
+            return None
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                BREAKER_FAILURE_THRESHOLD,
+                BREAKER_RECOVERY_TIME,
+                BREAKER_MAX_RECOVERY_TIME,
+            )
+        return breaker
+
+    def _breaker_closed(self, endpoint: str | None) -> bool:
+        """True dacă endpoint-ul nu are breaker sau acesta e închis."""
+        breaker = self._breakers.get(endpoint) if endpoint else None
+        return breaker is None or breaker.state == STATE_CLOSED
+
+    def _breaker_fallback(self, method: str, url: str, label: str) -> _ApiResponse:
+        """Răspunsul cu circuitul deschis: ultimele date cunoscute pentru URL, fără cerere HTTP."""
+        self._stats["breaker_fallbacks"] += 1
+        validator = self._validators.get(url) if method == "GET" else None
+        data = validator.data if validator is not None else None
+        _LOGGER.debug(
+            "[%s] Circuit deschis — cerere omisă, %s.",
+            label, "se servesc datele anterioare" if data is not None else "fără date anterioare",
+        )
+        return _ApiResponse(data, 0)
 
-    async def _do_request(self, method: str, url: str, label: str = "request", json_payload=None):
-        """Efectuează o cerere HTTP cu tokenul curent. Returnează (data, status)."""
+    async def _do_request(
+        self,
+        method: str,
+        url: str,
+        label: str = "request",
+        json_payload=None,
+        timeout: ClientTimeout | None = None,
+        endpoint: str | None = None,
+    ) -> _ApiResponse:
+        """Efectuează o cerere HTTP cu tokenul curent.
+
+        Corpul e citit o singură dată ca bytes și parsat o singură dată;
+        returnează _ApiResponse(data, status, size). La eroare de rețea: status=0.
+
+        Pentru GET se trimit validatorii ultimului răspuns (If-None-Match /
+        If-Modified-Since). La 304 sau la un corp identic byte cu byte cu
+        cel anterior se returnează obiectul deja parsat, fără re-parsare —
+        același obiect, deci comparațiile din aval sunt imediate.
+        """
         headers = {**HEADERS}
-        if self._access_token:
-            headers["Authorization"] = f"{self._token_type} {self._access_token}"
+        authorization = self._broker.authorization
+        if authorization:
+            headers["Authorization"] = authorization
 
-        _LOGGER.debug("[%s] %s %s, Payload=%s", label, method, url, json.dumps(json_payload) if json_payload else "None")
+        validator = self._validators.get(url) if method == "GET" else None
+        if validator is not None:
+            headers.update(ValidatorStore.conditional_headers(validator))
+
+        _LOGGER.debug("[%s] %s %s, Payload=%s", label, method, url, _Lazy(json.dumps, json_payload))
+        self._stats["http_requests"] += 1
 
         try:
-            kwargs = {"headers": headers, "timeout": self._timeout}
+            kwargs = {"headers": headers, "timeout": timeout or self._timeout}
             if json_payload is not None:
                 kwargs["json"] = json_payload
 
-            async with self._session.request(method, url, **kwargs) as resp:
-                response_text = await resp.text()
-
-                if resp.status == 200:
-                    data = await resp.json()
-                    # Debug clar pentru datele primite în _do_request
-                    _LOGGER.debug(
-                        "[%s] Răspuns OK (200). Dimensiune: %s caractere. Date JSON: type=%s, len=%s, sample keys=%s, sample content=%s",
-                        label,
-                        len(response_text),
-                        type(data).__name__,
-                        len(data) if isinstance(data, (list, dict)) else "N/A",
-                        list(data[0].keys()) if isinstance(data, list) and data else list(data.keys()) if isinstance(data, dict) else "N/A",
-                        json.dumps(data, default=str)[:500] if data else "None"
+            async with self._scheduler.slot():
+                # Latența se măsoară după obținerea locului (fără așteptarea la coadă);
+                # o cerere anulată (ex. copia hedge pierzătoare) nu e un eșantion real
+                started = time.monotonic()
+                cancelled = False
+                try:
+                    async with self._session.request(method, url, **kwargs) as resp:
+                        raw = await resp.read()
+                        status = resp.status
+                        resp_headers = resp.headers
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+                finally:
+                    if endpoint is not None and not cancelled:
+                        self._latency.record(endpoint, time.monotonic() - started)
+
+            throttled = self._scheduler.record_response(status, resp_headers.get("Retry-After"))
+            self._last_activity = time.monotonic()
+
+            if status == 304 and validator is not None:
+                self._stats["not_modified"] += 1
+                _LOGGER.debug("[%s] Nemodificat (304) — se refolosesc datele anterioare.", label)
+                return _ApiResponse(validator.data, status, 0)
+
+            if status == 200:
+                if method != "GET":
+                    data = _decode_json(raw)
+                else:
+                    digest = _body_digest(raw)
+                    if validator is not None and validator.body_hash == digest:
+                        self._stats["unchanged_body"] += 1
+                        data = validator.data
+                        _LOGGER.debug("[%s] Corp identic cu cel anterior — parsare omisă.", label)
+                    else:
+                        data = _decode_json(raw)
+                    self._validators.remember(
+                        url,
+                        resp_headers.get("ETag"),
+                        resp_headers.get("Last-Modified"),
+                        digest,
+                        data,
                     )
-                    return data, resp.status
+                _LOGGER.debug("[%s] Răspuns OK (200). Dimensiune: %s octeți.", label, len(raw))
+                _debug_payload(label, data, "Date JSON")
+                return _ApiResponse(data, status, len(raw))
 
-                _LOGGER.error("[%s] Eroare: %s %s → Cod HTTP=%s, Răspuns=%s", label, method, url, resp.status, response_text)
-                return None, resp.status
+            _LOGGER.error("[%s] Eroare: %s %s → Cod HTTP=%s, Răspuns=%s", label, method, url, status, _body_text(raw))
+            return _ApiResponse(None, status, len(raw), throttled)
 
         except asyncio.TimeoutError:
             _LOGGER.error("[%s] Depășire de timp: %s %s.", label, method, url)
-            return None, 0
+            return _ApiResponse(None, 0)
         except Exception as e:
             _LOGGER.error("[%s] Eroare: %s %s → %s", label, method, url, e)
-            return None, 0
+            return _ApiResponse(None, 0)
+
+    async def _fetch_page(
+        self,
+        base_url: str,
+        params: dict,
+        page: int,
+        label: str,
+        endpoint: str | None = None,
+    ) -> _ApiResponse:
+        """Obține o singură pagină (cu gestionarea tokenului și 401).
+
+        Returnează _ApiResponse: cu circuitul deschis, datele sunt pagina
+        anterioară (status 0) — apelantul trebuie să o trateze ca eșec.
+        """
+        query_parts = [f"{k}={v}" for k, v in params.items()]
+        query_parts.append(f"page={page}")
+        url = f"{base_url}?{'&'.join(query_parts)}"
+        _LOGGER.debug("[%s] Pagină %s: %s", label, page, url)
+        # Fără single-flight: o pagină speculativă anulată trebuie să anuleze
+        # efectiv cererea HTTP, nu doar așteptarea ei.
+        return await self._request_with_token_uncoalesced("GET", url, f"{label} p{page}", endpoint)
 
     async def _paginated_request(
         self,
@@ -1088,87 +1965,105 @@ class EonApiClient:
         list_key: str = "list",
         label: str = "paginated",
         max_pages: int | None = None,
+        prefetch: int = 0,
+        endpoint: str | None = None,
     ):
         """Obține paginile unui endpoint paginat. Returnează lista cumulată.
 
         Args:
             max_pages: Număr maxim de pagini de adus. None = toate paginile.
+            prefetch: Câte pagini următoare pot fi în zbor simultan (0 = secvențial).
         """
-        if not await self._ensure_token_valid():
+        if not await self._broker.async_ensure_authenticated():
             _LOGGER.error("[%s] Nu s-a putut obține un token valid.", label)
             return None
 
         results: list = []
-        page = 1
-        retried = False
-
-        while True:
-            query_parts = [f"{k}={v}" for k, v in params.items()]
-            query_parts.append(f"page={page}")
-            url = f"{base_url}?{'&'.join(query_parts)}"
+        async with aclosing(
+            self._iter_pages(
+                base_url, params, list_key, label, max_pages, prefetch, endpoint=endpoint
+            )
+        ) as pages:
+            async for chunk in pages:
+                results.extend(chunk)
+        return results
 
-            gen_before = self._token_generation
-            headers = {**HEADERS, "Authorization": f"{self._token_type} {self._access_token}"}
+    async def _iter_pages(
+        self,
+        base_url: str,
+        params: dict,
+        list_key: str = "list",
+        label: str = "paginated",
+        max_pages: int | None = None,
+        prefetch: int = 0,
+        cursor: PageCursor | None = None,
+        endpoint: str | None = None,
+    ) -> AsyncIterator[list]:
+        """Generator asincron: livrează elementele fiecărei pagini pe măsură ce sosesc.
+
+        Cu prefetch > 0, pe lângă pagina curentă se cer speculativ în paralel
+        următoarele `prefetch` pagini, fără a aștepta `hasNext`. Paginile
+        lansate dincolo de ultima pagină reală — sau rămase în zbor când
+        consumatorul se oprește devreme — sunt anulate și contorizate ca
+        „prefetch_wasted" în diagnostics.
+
+        Consumatorii care pot ieși din buclă înainte de final trebuie să
+        folosească contextlib.aclosing(), ca anularea să fie imediată.
+        """
+        pending: dict[int, asyncio.Task] = {}
+        next_page = 1  # următoarea pagină de lansat
+        page = 1
+        total = 0
 
-            _LOGGER.debug("[%s] Pagină %s: %s", label, page, url)
+        try:
+            while True:
+                # Fereastra: pagina curentă + cel mult `prefetch` pagini următoare
+                while next_page <= page + prefetch and (
+                    max_pages is None or next_page <= max_pages
+                ):
+                    if next_page > page:
+                        self._stats["prefetch_pages"] += 1
+                    pending[next_page] = asyncio.ensure_future(
+                        self._fetch_page(base_url, params, next_page, label, endpoint)
+                    )
+                    next_page += 1
+
+                response = await pending.pop(page)
+                data = response.data
+                if not _is_definitive(response.status) or not isinstance(data, dict):
+                    # Eroare deja logată în _do_request (sau circuit deschis: pagina
+                    # servită e cea veche) — păstrăm ce avem, parcurgerea e eșuată
+                    _REQUEST_FAILED.set(True)
+                    if cursor is not None:
+                        cursor.failed = True
+                    break
 
-            try:
-                async with self._session.get(
-                    url, headers=headers, timeout=self._timeout
-                ) as resp:
-                    response_text = await resp.text()
-
-                    if resp.status == 200:
-                        data = await resp.json()
-                        # Debug clar pentru datele primite per pagină
-                        _LOGGER.debug(
-                            "[%s] Pagină %s: Date JSON: type=%s, keys=%s, list len=%s, sample list keys=%s, sample content=%s",
-                            label, page,
-                            type(data).__name__,
-                            list(data.keys()) if isinstance(data, dict) else "N/A",
-                            len(data.get(list_key, [])),
-                            list(data.get(list_key, [])[0].keys()) if data.get(list_key) and isinstance(data.get(list_key), list) and data.get(list_key) else "N/A",
-                            json.dumps(data, default=str)[:500] if data else "None"
-                        )
-                        chunk = data.get(list_key, [])
-                        results.extend(chunk)
-                        retried = False
-
-                        has_next = data.get("hasNext", False)
-                        _LOGGER.debug(
-                            "[%s] Pagină %s: %s elemente, are_următoare=%s.",
-                            label, page, len(chunk), has_next,
-                        )
+                chunk = data.get(list_key) or []
+                total += len(chunk)
+                has_next = data.get("hasNext", False)
+                _LOGGER.debug(
+                    "[%s] Pagină %s: %s elemente, are_următoare=%s.",
+                    label, page, len(chunk), has_next,
+                )
+                if cursor is not None:
+                    cursor.pages = page
+                    cursor.complete = not has_next
+                yield chunk
 
-                        if not has_next:
-                            break
-                        if max_pages is not None and page >= max_pages:
-                            _LOGGER.debug("[%s] Limită paginare atinsă (%s pagini).", label, max_pages)
-                            break
-                        page += 1
-                        continue
-
-                    if resp.status == 401 and not retried:
-                        # Verifică dacă alt apel a reînnoit deja tokenul
-                        if self._token_generation != gen_before:
-                            _LOGGER.debug("[%s] Token reînnoit de alt apel (pagină %s). Se reîncearcă.", label, page)
-                        else:
-                            _LOGGER.warning("[%s] Token expirat (pagină %s). Se reîncearcă...", label, page)
-                            self.invalidate_token()
-                            if not await self._ensure_token_valid():
-                                return results if results else None
-                        retried = True
-                        continue
-
-                    _LOGGER.error("[%s] Eroare: Cod HTTP=%s (pagină %s), Răspuns=%s", label, resp.status, page, response_text)
+                if not has_next:
                     break
+                if max_pages is not None and page >= max_pages:
+                    _LOGGER.debug("[%s] Limită paginare atinsă (%s pagini).", label, max_pages)
+                    break
+                page += 1
+        finally:
+            if pending:
+                self._stats["prefetch_wasted"] += len(pending)
+                _LOGGER.debug(
+                    "[%s] %s pagini speculative nefolosite — anulate.",
+                    label, len(pending),
+                )
+                for task in pending.values():
+                    task.cancel()
 
-            except asyncio.TimeoutError:
-                _LOGGER.error("[%s] Depășire de timp (pagină %s).", label, page)
-                break
-            except Exception as e:
-                _LOGGER.error("[%s] Eroare: %s", label, e)
-                break
-
-        _LOGGER.debug("[%s] Total: %s elemente din %s pagini.", label, len(results), page)
-        return results
+        _LOGGER.debug("[%s] Total: %s elemente din %s pagini.", label, total, page)
@@ -245,7 +245,8 @@ class TrimiteIndexButton(CoordinatorEntity[EonRomaniaCoordinator], ButtonEntity)
                 )
                 return
 
-            # 4. Refresh date
+            # 4. Refresh date (istoricul indexurilor s-a schimbat — nu așteptăm TTL-ul)
+            self.coordinator.expire_data("meter_history")
             await self.coordinator.async_request_refresh()
 
             _LOGGER.info(
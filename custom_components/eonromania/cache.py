@@ -0,0 +1,151 @@
+"""Cache în memorie pentru răspunsurile API E·ON România.
+
+Intrările sunt indexate după metodă + URL și expiră după un TTL stabilit
+per endpoint (CACHE_TTL din const.py). Capacitatea e limitată; la depășire
+se elimină intrarea folosită cel mai demult (LRU).
+
+Tot aici stau validatorii pentru cererile condiționale (ValidatorStore).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """O intrare din cache: endpoint-ul de origine, datele și momentul expirării."""
+
+    endpoint: str
+    data: Any
+    expires_at: float
+
+
+class ResponseCache:
+    """Cache TTL + LRU pentru răspunsurile decodate."""
+
+    def __init__(self, ttls: dict[str, int], max_entries: int) -> None:
+        """Inițializează cache-ul cu TTL-urile per endpoint și capacitatea maximă."""
+        self._ttls = ttls
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def is_cacheable(self, endpoint: str | None) -> bool:
+        """True dacă endpoint-ul are un TTL configurat."""
+        return endpoint is not None and self._ttls.get(endpoint, 0) > 0
+
+    def get(self, key: str) -> Any | None:
+        """Returnează datele din cache sau None (lipsă/expirat)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.data
+
+    def set(self, key: str, endpoint: str, data: Any) -> None:
+        """Salvează un răspuns; elimină intrările cele mai vechi peste capacitate."""
+        ttl = self._ttls.get(endpoint, 0)
+        if ttl <= 0 or data is None:
+            return
+        self._entries[key] = _CacheEntry(endpoint, data, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, endpoint: str | None = None, match: str | None = None) -> int:
+        """Elimină intrările unui endpoint și/sau al căror URL conține `match`.
+
+        Fără argumente golește tot cache-ul. Returnează numărul de intrări eliminate.
+        """
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if (endpoint is None or entry.endpoint == endpoint)
+            and (match is None or match in key)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> dict[str, int]:
+        """Contoare pentru diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+
+@dataclass(slots=True)
+class _Validator:
+    """Validatorii ultimului răspuns 200 pentru un URL + obiectul deja parsat."""
+
+    etag: str | None
+    last_modified: str | None
+    body_hash: bytes
+    data: Any
+
+
+class ValidatorStore:
+    """Validatori HTTP (ETag / Last-Modified) și hash-ul corpului, per URL.
+
+    Permite cereri condiționale (304 → se refolosește obiectul parsat anterior)
+    și, dacă serverul ignoră validatorii, ocolirea parsării când corpul e
+    identic byte cu byte cu cel anterior.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Inițializează store-ul cu o capacitate maximă (LRU)."""
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Validator] = OrderedDict()
+
+    def get(self, url: str) -> _Validator | None:
+        """Returnează validatorii pentru URL (sau None)."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: _Validator) -> dict[str, str]:
+        """Headerele condiționale de trimis pentru o intrare."""
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def remember(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        body_hash: bytes,
+        data: Any,
+    ) -> None:
+        """Memorează validatorii unui răspuns 200."""
+        if data is None:
+            return
+        self._entries[url] = _Validator(etag, last_modified, body_hash, data)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Numărul de URL-uri urmărite."""
+        return len(self._entries)
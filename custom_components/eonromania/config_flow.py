@@ -24,8 +24,9 @@ from homeassistant.helpers.selector import (
     SelectSelectorMode,
 )
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DOMAIN_TOKEN_STORE, CONF_LICENSE_KEY, LICENSE_DATA_KEY, LICENSE_PURCHASE_URL
+from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, DOMAIN_TOKEN_STORE, CONF_LICENSE_KEY, LICENSE_DATA_KEY, LICENSE_PURCHASE_URL, REFRESH_TTL_DEFAULTS
 from .api import EonApiClient
+from .refresh_policy import resolve_ttls
 from .helpers import (
     build_contract_metadata,
     build_contract_options,
@@ -395,6 +396,7 @@ class EonRomaniaOptionsFlow(config_entries.OptionsFlow):
             step_id="init",
             menu_options=[
                 "settings",
+                "refresh_policy",
                 "licenta",
             ],
         )
@@ -578,6 +580,35 @@ class EonRomaniaOptionsFlow(config_entries.OptionsFlow):
             description_placeholders=description_placeholders,
         )
 
+    async def async_step_refresh_policy(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Prospețimea datelor: TTL per tip de date (în ore)."""
+        if user_input is not None:
+            refresh_ttl = {
+                kind: int(user_input[f"ttl_{kind}"]) * 3600
+                for kind in REFRESH_TTL_DEFAULTS
+                if f"ttl_{kind}" in user_input
+            }
+            self.hass.config_entries.async_update_entry(
+                self.config_entry,
+                data={**self.config_entry.data, "refresh_ttl": refresh_ttl},
+            )
+            return self.async_create_entry(data={})
+
+        current = resolve_ttls(self.config_entry.data.get("refresh_ttl"))
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    f"ttl_{kind}", default=max(1, current[kind] // 3600)
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=2160))
+                for kind in REFRESH_TTL_DEFAULTS
+            }
+        )
+
+        return self.async_show_form(step_id="refresh_policy", data_schema=schema)
+
     async def async_step_settings(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -814,6 +845,8 @@ class EonRomaniaOptionsFlow(config_entries.OptionsFlow):
                         "select_all": select_all,
                         "selected_contracts": final_selection,
                         "contract_metadata": build_contract_metadata(self._contracts_raw),
+                        # TTL-urile setate din „Prospețimea datelor" se păstrează
+                        "refresh_ttl": self.config_entry.data.get("refresh_ttl", {}),
                     },
                 )
 
@@ -0,0 +1,118 @@
+"""Sesiunea HTTP dedicată API-ului E·ON România.
+
+Sesiunea partajată a Home Assistant e reglată pentru multe gazde diferite;
+un refresh E·ON trimite însă rafale de cereri către o singură gazdă. Sesiunea
+dedicată (una per cont) are propriul connector:
+- limită per gazdă egală cu concurența planificatorului (conexiunile deschise
+  în rafală sunt exact cele refolosite apoi);
+- cache DNS cu TTL mai lung și keep-alive mai lung decât implicitele aiohttp,
+  ca pauzele dintre cererile ritmate să nu închidă conexiunile.
+Compresia (Accept-Encoding gzip/deflate + decomprimare automată) e cea
+implicită din aiohttp — sesiunea dedicată nu schimbă nimic aici.
+
+Un TraceConfig numără conexiunile create (handshake TCP + TLS) și cele
+refolosite, expuse în diagnostics.
+"""
+
+from __future__ import annotations
+
+import logging
+import ssl
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import ClientSession, TCPConnector, TraceConfig
+
+from .const import CONNECTOR_DNS_TTL, CONNECTOR_KEEPALIVE_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionStats:
+    """Contoare de conexiuni alimentate de un aiohttp TraceConfig."""
+
+    def __init__(self) -> None:
+        """Inițializează contoarele."""
+        self._stats: dict[str, float] = {
+            "created": 0,
+            "reused": 0,
+            "queued": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "connect_total": 0.0,
+            "connect_max": 0.0,
+        }
+
+    def trace_config(self) -> TraceConfig:
+        """TraceConfig-ul care alimentează contoarele (pentru ClientSession)."""
+        trace = TraceConfig()
+        trace.on_connection_create_start.append(self._on_create_start)
+        trace.on_connection_create_end.append(self._on_create_end)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_connection_queued_start.append(self._on_queued)
+        trace.on_dns_cache_hit.append(self._on_dns_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_miss)
+        return trace
+
+    async def _on_create_start(self, _session, context: SimpleNamespace, _params) -> None:
+        context.connect_started = time.monotonic()
+
+    async def _on_create_end(self, _session, context: SimpleNamespace, _params) -> None:
+        elapsed = time.monotonic() - getattr(context, "connect_started", time.monotonic())
+        self._stats["created"] += 1
+        self._stats["connect_total"] += elapsed
+        self._stats["connect_max"] = max(self._stats["connect_max"], elapsed)
+
+    async def _on_reuse(self, _session, _context, _params) -> None:
+        self._stats["reused"] += 1
+
+    async def _on_queued(self, _session, _context, _params) -> None:
+        self._stats["queued"] += 1
+
+    async def _on_dns_hit(self, _session, _context, _params) -> None:
+        self._stats["dns_cache_hits"] += 1
+
+    async def _on_dns_miss(self, _session, _context, _params) -> None:
+        self._stats["dns_cache_misses"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Contoarele (pentru diagnostics)."""
+        created = int(self._stats["created"])
+        reused = int(self._stats["reused"])
+        return {
+            "created": created,
+            "reused": reused,
+            "reuse_ratio": round(reused / (created + reused), 3) if created + reused else 0.0,
+            "queued_for_limit": int(self._stats["queued"]),
+            "dns_cache_hits": int(self._stats["dns_cache_hits"]),
+            "dns_cache_misses": int(self._stats["dns_cache_misses"]),
+            "connect_avg_ms": (
+                round(self._stats["connect_total"] / created * 1000, 1) if created else 0.0
+            ),
+            "connect_max_ms": round(self._stats["connect_max"] * 1000, 1),
+        }
+
+
+def create_api_session(
+    concurrency: int, stats: ConnectionStats, ssl_context: ssl.SSLContext
+) -> ClientSession:
+    """Creează sesiunea dedicată (apelantul o închide la descărcare).
+
+    `ssl_context` e contextul TLS al Home Assistant (creat o singură dată,
+    în afara event loop-ului).
+    """
+    connector = TCPConnector(
+        limit_per_host=max(1, concurrency),
+        ttl_dns_cache=CONNECTOR_DNS_TTL,
+        keepalive_timeout=CONNECTOR_KEEPALIVE_TIMEOUT,
+        ssl=ssl_context,
+    )
+    _LOGGER.debug(
+        "[HTTP] Sesiune dedicată creată (limită/gazdă=%s, DNS TTL=%ss, keep-alive=%ss).",
+        concurrency, CONNECTOR_DNS_TTL, CONNECTOR_KEEPALIVE_TIMEOUT,
+    )
+    return ClientSession(
+        connector=connector,
+        trace_configs=[stats.trace_config()],
+    )
@@ -6,6 +6,7 @@ from homeassistant.const import Platform
 
 DOMAIN = "eonromania"
 DOMAIN_TOKEN_STORE = f"{DOMAIN}_token_store"  # Cheie în hass.data pentru token-uri MFA
+DOMAIN_ACCOUNT_REGISTRY = f"{DOMAIN}_accounts"  # Cheie în hass.data: resursele partajate per cont (account_registry.py)
 
 # ──────────────────────────────────────────────
 # Versiuni API (configurabile)
@@ -19,6 +20,7 @@ API_VERSION_METERREADINGS = "v1"
 # Configurare implicită
 # ──────────────────────────────────────────────
 DEFAULT_UPDATE_INTERVAL = 21600  # Interval de actualizare în secunde (6 ore)
+FIRST_REFRESH_CONCURRENCY = 4    # Contracte actualizate simultan la pornire
 
 # ──────────────────────────────────────────────
 # Autentificare
@@ -31,12 +33,131 @@ AUTH_VERIFY_SECRET = "zrAnQjN0bDjlTsKYmbpexjaBNY6wrCzuIqGWNgqoaJzlLrYiqd"
 # ──────────────────────────────────────────────
 TOKEN_REFRESH_THRESHOLD = 300  # Refresh cu 5 min înainte de expirare
 TOKEN_MAX_AGE = 3300           # Fallback 55 min (dacă expires_in lipsește)
+TOKEN_RENEWAL_JITTER = 120     # Reînnoirea în fundal pleacă aleator până la 2 min mai devreme
+TOKEN_RENEWAL_RETRY = 60       # Pauza inițială după o reînnoire eșuată (dublată, max 15 min)
+TOKEN_RENEWAL_IDLE = 300       # Verificare periodică când nu există token / refresh_token
 
 # ──────────────────────────────────────────────
 # Timeout implicit pentru requesturi API (secunde)
 # ──────────────────────────────────────────────
 API_TIMEOUT = 30
 
+# ──────────────────────────────────────────────
+# Cache răspunsuri API (TTL în secunde, per endpoint)
+# Doar endpoint-uri care se schimbă de câteva ori pe lună.
+# ──────────────────────────────────────────────
+CACHE_MAX_ENTRIES = 128
+CACHE_TTL: dict[str, int] = {
+    "user_details": 86400,            # 24h
+    "contracts_list": 86400,          # 24h
+    "consumption_convention": 43200,  # 12h
+    "meter_history": 259200,          # 72h (invalidat la trimiterea indexului)
+}
+
+# Număr maxim de URL-uri pentru care se păstrează validatori (ETag / hash corp)
+CONDITIONAL_MAX_ENTRIES = 256
+
+# ──────────────────────────────────────────────
+# Planificator cereri HTTP (per cont)
+# ──────────────────────────────────────────────
+SCHEDULER_CONCURRENCY = 4       # Cereri simultan în zbor
+SCHEDULER_RATE = 5.0            # Ritm mediu (cereri/secundă)
+SCHEDULER_BURST = 10            # Rafală maximă fără așteptare
+SCHEDULER_BACKOFF_BASE = 2.0    # Pauză inițială la 429 fără Retry-After (secunde)
+SCHEDULER_BACKOFF_MAX = 300.0   # Pauză maximă (secunde)
+
+# ──────────────────────────────────────────────
+# Reîncercări pentru erori tranzitorii (doar cereri idempotente)
+# ──────────────────────────────────────────────
+RETRY_ATTEMPTS = 3        # Încercări în total (prima + reîncercări)
+RETRY_BASE_DELAY = 1.0    # Pauza de bază, dublată la fiecare reîncercare (secunde)
+RETRY_MAX_DELAY = 10.0    # Pauza maximă între încercări (secunde)
+RETRY_DEADLINE = 90.0     # Buget total per cerere, inclusiv așteptările (secunde)
+
+# ──────────────────────────────────────────────
+# Circuit breaker per endpoint
+# ──────────────────────────────────────────────
+BREAKER_FAILURE_THRESHOLD = 3     # Eșecuri consecutive care deschid circuitul
+BREAKER_RECOVERY_TIME = 300.0     # Cât rămâne deschis înainte de proba half-open (secunde)
+BREAKER_MAX_RECOVERY_TIME = 3600.0  # Limita dublării după probe eșuate (secunde)
+
+# ──────────────────────────────────────────────
+# Timeout adaptiv per endpoint: clamp(p99 × multiplicator, minim, API_TIMEOUT)
+# Valori alese, nu măsurate pe API-ul E·ON: ×3 peste p99 lasă loc variației
+# obișnuite fără timeout-uri false; minimul de 5s acoperă un handshake TLS lent.
+# Se ajustează după api.latency din diagnostics (p99_s vs. timeout_s).
+# ──────────────────────────────────────────────
+LATENCY_TIMEOUT_MULTIPLIER = 3.0
+LATENCY_TIMEOUT_FLOOR = 5.0       # Timeout minim (secunde)
+LATENCY_MIN_SAMPLES = 20          # Eșantioane necesare înainte de adaptare
+LATENCY_SAVE_INTERVAL = 3600      # Cât de des se salvează profilul învățat (secunde)
+
+# ──────────────────────────────────────────────
+# Cereri „hedged": o a doua copie dacă prima depășește p95
+# (doar GET-uri idempotente din refresh-ul ușor)
+#
+# Pragul p95 vine din Dean & Barroso, „The Tail at Scale" (CACM, 2013): o
+# copie trimisă abia după p95 atinge în mod normal ~5% din cereri, deci
+# încărcarea suplimentară e mică. Bugetul de 10% e dublul acestei valori —
+# rezervă pentru histograme încă imprecise, nu un rezultat măsurat. Nu
+# există măsurători pe API-ul E·ON; se verifică în diagnostics (api.hedging:
+# hedges / requests și hedge_wins).
+# ──────────────────────────────────────────────
+HEDGE_ENDPOINTS: frozenset[str] = frozenset(
+    {"contract_details", "invoice_balance", "invoices_unpaid"}
+)
+HEDGE_PERCENTILE = 0.95    # Copia pleacă după percentila aceasta a latenței endpoint-ului
+HEDGE_BUDGET_RATIO = 0.1   # Cel mult 10% cereri în plus față de cererile primare
+
+# ──────────────────────────────────────────────
+# Sesiune HTTP dedicată (per cont) — vezi connection.py
+# ──────────────────────────────────────────────
+CONNECTOR_DEDICATED_SESSION = True  # False = sesiunea partajată a Home Assistant
+# DNS TTL: 5 minute, durata uzuală a înregistrărilor DNS pentru API-uri publice.
+# Keep-alive: 60s, sub pragul implicit al serverelor uzuale (nginx: 75s), ca
+# serverul să nu închidă primul conexiunea. Ambele sunt alegeri, nemăsurate pe
+# API-ul E·ON; efectul se vede în api.connections (reuse_ratio, created).
+CONNECTOR_DNS_TTL = 300             # Cache DNS (secunde; implicit aiohttp: 10)
+CONNECTOR_KEEPALIVE_TIMEOUT = 60    # Conexiuni inactive păstrate deschise (secunde; implicit: 15)
+
+# ──────────────────────────────────────────────
+# Prospețimea datelor: TTL per tip de date (secunde) — vezi refresh_policy.py
+# Configurabile din opțiuni; salvate în config_entry.data["refresh_ttl"].
+# ──────────────────────────────────────────────
+REFRESH_TTL_DEFAULTS: dict[str, int] = {
+    "payments": 86400,                 # 24h
+    "invoices_prosum": 86400,          # 24h
+    "invoice_balance_prosum": 86400,   # 24h
+    "rescheduling_plans": 86400,       # 24h
+    "graphic_consumption": 86400,      # 24h
+    "meter_history": 604800,           # 7 zile (expirat la trimiterea indexului)
+    "consumption_convention": 2592000,  # 30 zile (inclusiv convențiile subcontractelor DUO)
+}
+# Câte tipuri de date deja aduse se reîmprospătează cel mult într-un ciclu
+# (eșalonare: tipurile cu același TTL nu mai expiră toate deodată)
+REFRESH_KINDS_PER_CYCLE = 2
+
+# ──────────────────────────────────────────────
+# Eșalonarea refresh-urilor între contracte și intrări — vezi refresh_schedule.py
+# ──────────────────────────────────────────────
+REFRESH_JITTER_FRACTION = 0.02  # Jitter: ±2% din interval…
+REFRESH_JITTER_MAX = 300        # …dar cel mult ±5 minute
+
+# ──────────────────────────────────────────────
+# Pre-încălzirea conexiunilor înainte de refresh-ul programat
+# ──────────────────────────────────────────────
+PREWARM_LEAD = 5          # Cu câte secunde înainte de refresh se deschid conexiunile
+PREWARM_CONNECTIONS = 4   # Câte conexiuni (= SCHEDULER_CONCURRENCY)
+PREWARM_TIMEOUT = 10      # Timeout per cerere de încălzire (secunde)
+
+# ──────────────────────────────────────────────
+# Detalii contracte în lot (URL_CONTRACTS_DETAILS_LIST)
+# ──────────────────────────────────────────────
+CONTRACTS_DETAILS_BATCH_SIZE = 20  # Contracte per cerere POST
+# Cât timp detaliile aduse în lot pentru contractele unei intrări sunt
+# refolosite de celelalte coordinatoare (secunde) — vezi prefetch.py
+DETAILS_PREFETCH_WINDOW = 300
+
 # ──────────────────────────────────────────────
 # Headere HTTP
 # ──────────────────────────────────────────────
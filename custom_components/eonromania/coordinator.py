@@ -2,31 +2,80 @@
 
 Strategia de actualizare:
 - Prima actualizare (refresh #0): apelează TOATE endpoint-urile → detectează capabilități
-- Refresh-uri ușoare (light): doar endpoint-uri esențiale (5 calls)
-- Refresh-uri grele (heavy, la fiecare al 4-lea): + endpoint-uri istorice/opționale
-- Capabilitățile se recalibrează la fiecare al 4-lea refresh (~1×/zi la 6h interval)
+- Endpoint-uri esențiale (detalii, sold, facturi neachitate, index): la fiecare refresh
+- Celelalte tipuri de date au câte un TTL (refresh_policy.py): fiecare refresh aduce
+  doar tipurile expirate (ex. plăți 24h, istoric index 7 zile, convenție 30 zile),
+  cel mult REFRESH_KINDS_PER_CYCLE per refresh — eșalonate pe cicluri succesive
+- Capabilitățile se recalibrează ori de câte ori sunt aduse datele din care derivă
+- Plăți și facturi prosumator: istoric local persistent — backfill complet o dată,
+  apoi doar paginile noi
+- Fiecare refresh e un graf de endpoint-uri (fetch_graph.py): cererile independente
+  pornesc simultan, doar datele subcontractelor DUO așteaptă lista subcontractelor
+- Cu câteva secunde înainte de refresh-ul programat, clientul deschide din timp
+  conexiunile (pre-încălzire); durata fiecărui refresh e păstrată pentru diagnostics
+- Refresh-urile programate sunt eșalonate (refresh_schedule.py): fiecare contract are
+  o fază fixă în interval, plus jitter — contractele nu mai lovesc API-ul deodată
 """
 
 import asyncio
 import logging
-from datetime import timedelta
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import aclosing
+from datetime import datetime, timedelta
 import json
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .api import EonApiClient
-from .const import DOMAIN, LICENSE_DATA_KEY
+from homeassistant.util import dt as dt_util
+
+from .api import EonApiClient, PageCursor
+from .fetch_graph import FetchGraph
+from .const import (
+    DOMAIN,
+    LICENSE_DATA_KEY,
+    PREWARM_CONNECTIONS,
+    PREWARM_LEAD,
+    REFRESH_JITTER_FRACTION,
+    REFRESH_JITTER_MAX,
+    REFRESH_KINDS_PER_CYCLE,
+)
+from .history import HistoryStore, invoice_is_open, invoice_key, payment_key
+from .prefetch import ContractDetailsPrefetcher
+from .refresh_policy import RefreshPlan, RefreshPolicy, resolve_ttls
+from .refresh_schedule import next_refresh_delay, phase_fraction
 
 _LOGGER = logging.getLogger(__name__)
 
-# Fiecare al N-lea refresh este „greu" (include endpoint-uri istorice/paginate)
-HEAVY_REFRESH_EVERY = 4  # La 6h interval = heavy la fiecare 24h
+# Tipurile de date condiționate de o capabilitate detectată
+_KIND_CAPABILITY = {
+    "payments": "has_payments",
+    "invoices_prosum": "has_prosum",
+    "invoice_balance_prosum": "has_prosum",
+    "rescheduling_plans": "has_rescheduling",
+}
+
+# Tipuri de date existente doar pentru contractele individuale
+_INDIVIDUAL_ONLY_KINDS = frozenset({"graphic_consumption", "meter_history"})
 
 # Limită paginare pentru endpoint-urile paginate (payments, invoices_prosum)
 MAX_PAGINATED_PAGES = 3
 
+# Pagini cerute speculativ în paralel cu pagina curentă → toate cele
+# MAX_PAGINATED_PAGES pagini pleacă simultan (un singur round-trip)
+PAGINATED_PREFETCH = MAX_PAGINATED_PAGES - 1
+
+# Pagini parcurse după atingerea istoricului cunoscut, pentru revizitarea facturilor
+# deschise; cele negăsite până atunci sunt tratate ca închise
+REVISIT_MAX_PAGES = 3
+
+# Câte măsurători de refresh se păstrează pentru diagnostics
+REFRESH_TIMING_HISTORY = 10
+
 
 class EonRomaniaCoordinator(DataUpdateCoordinator):
     """Coordinator care se ocupă de toate datele E·ON România."""
@@ -40,29 +89,128 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
         is_collective: bool = False,
         config_entry: ConfigEntry | None = None,
         account_only: bool = False,
+        details_prefetcher: ContractDetailsPrefetcher | None = None,
+        refresh_ttl: Mapping[str, Any] | None = None,
     ):
-        """Inițializează coordinatorul cu parametrii necesari."""
+        """Inițializează coordinatorul cu parametrii necesari.
+
+        `details_prefetcher` (opțional) aduce contract_details în lot pentru toate
+        contractele intrării și le împarte între coordinatoare. `refresh_ttl`
+        suprascrie TTL-urile implicite per tip de date (secunde).
+        """
         super().__init__(
             hass,
             _LOGGER,
             name=f"EonRomaniaCoordinator_{cod_incasare}",
             update_interval=timedelta(seconds=update_interval),
+            # Răspunsurile nemodificate (304 / corp identic) refolosesc aceleași
+            # obiecte → datele sunt egale și entitățile nu se mai rescriu degeaba.
+            # Senzorii care depind și de data curentă se rescriu singuri zilnic
+            # (EonRomaniaEntity._date_dependent în sensor.py).
+            always_update=False,
         )
         self.api_client = api_client
         self.cod_incasare = cod_incasare
         self.is_collective = is_collective
         self.account_only = account_only
         self._config_entry = config_entry
+        self._details_prefetcher = details_prefetcher
+        if details_prefetcher is not None and not account_only:
+            details_prefetcher.register(cod_incasare)
 
         # Capabilități detectate la prima actualizare
         # None = nedeterminate (prima actualizare le va seta)
         self._capabilities: dict[str, bool] | None = None
         self._refresh_counter: int = 0
 
+        # Prospețimea per tip de date: ce a expirat se aduce la următorul refresh
+        self._refresh_policy = RefreshPolicy(resolve_ttls(refresh_ttl))
+        self._cycle_plan = RefreshPlan()
+        # Nodurile ciclului curent ale căror cereri au eșuat (≠ răspuns gol)
+        self._failed_fetches: set[str] = set()
+
+        # Istoric persistent (plăți, facturi prosumator) — sincronizat incremental când îi expiră TTL-ul
+        self._history = HistoryStore(hass, cod_incasare)
+
+        # Pre-încălzirea conexiunilor înaintea refresh-ului programat + durata refresh-urilor
+        self._cancel_prewarm: Callable[[], None] | None = None
+        self._prewarmed_at: datetime | None = None
+        self._refresh_timings: deque[dict] = deque(maxlen=REFRESH_TIMING_HISTORY)
+        self._node_timings: dict[str, dict] = {}
+
+        # Eșalonare: faza fixă a contractului în interval + jitter per ciclu
+        self._base_interval = float(update_interval)
+        self._phase, self._jitter = self._schedule_phase()
+        self._next_refresh_at: datetime | None = None
+        if config_entry is not None:
+            config_entry.async_on_unload(self._async_cancel_prewarm)
+
+    def _plan_cycle(self) -> RefreshPlan:
+        """Tipurile de date de adus acum: aplicabile, permise de capabilități, eșalonate."""
+        applicable = []
+        for kind in self._refresh_policy.kinds:
+            if self.is_collective and kind in _INDIVIDUAL_ONLY_KINDS:
+                continue
+            capability = _KIND_CAPABILITY.get(kind)
+            # O capabilitate contează doar după ce tipul a fost adus cu succes
+            # (un eșec la prima aducere nu o dezactivează)
+            if (
+                capability is not None
+                and not self._cap(capability)
+                and self._refresh_policy.was_fetched(kind)
+            ):
+                continue
+            applicable.append(kind)
+        return self._refresh_policy.plan(applicable, self._base_interval, REFRESH_KINDS_PER_CYCLE)
+
+    def _schedule_phase(self) -> tuple[float, float]:
+        """Faza în interval și jitter-ul maxim (secunde).
+
+        Fără prefetcher, fiecare contract primește faza derivată din propriul cod.
+        Cu prefetcher, contractele intrării au o fază comună (derivată din intrare)
+        și se împrăștie doar în jumătate din fereastra de refolosire — altfel
+        fiecare coordinator ar declanșa propria rundă în lot și s-ar pierde partajarea.
+        """
+        interval = self._base_interval
+        jitter = min(interval * REFRESH_JITTER_FRACTION, REFRESH_JITTER_MAX)
+        own = phase_fraction(self.cod_incasare)
+        if self._details_prefetcher is None or self._config_entry is None:
+            return own * interval, jitter
+        window = self._details_prefetcher.window
+        phase = phase_fraction(self._config_entry.entry_id) * interval + own * min(window / 2, interval)
+        return phase % interval, min(jitter, window / 8)
+
+    @property
+    def schedule(self) -> dict[str, Any]:
+        """Faza, jitter-ul și următorul refresh planificat (pentru diagnostics)."""
+        return {
+            "interval_s": self._base_interval,
+            "phase_s": round(self._phase, 1),
+            "jitter_s": round(self._jitter, 1),
+            "next_refresh": self._next_refresh_at.isoformat() if self._next_refresh_at else None,
+        }
+
+    @property
+    def load_profile(self) -> list[dict[str, Any]]:
+        """Încărcarea ultimelor cicluri: tipuri aduse, cereri HTTP, durată (pentru diagnostics)."""
+        return [
+            {
+                "started_at": timing["started_at"],
+                "kinds": len(timing.get("fetched_kinds", [])),
+                "http_requests": timing.get("http_requests", 0),
+                "duration_s": timing["duration_s"],
+            }
+            for timing in self._refresh_timings
+        ]
+
     @property
-    def _is_heavy_refresh(self) -> bool:
-        """Determină dacă refresh-ul curent este „greu" (include endpoint-uri istorice)."""
-        return self._refresh_counter % HEAVY_REFRESH_EVERY == 0
+    def freshness(self) -> dict[str, dict[str, Any]]:
+        """TTL, vârstă și scadență per tip de date (pentru diagnostics)."""
+        return self._refresh_policy.snapshot()
+
+    def expire_data(self, kind: str) -> None:
+        """Forțează aducerea unui tip de date la următorul refresh (ex. după trimiterea indexului)."""
+        self._refresh_policy.expire(kind)
 
     def _update_capabilities(
         self,
@@ -115,13 +263,82 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
             return True  # Prima actualizare: apelează tot
         return self._capabilities.get(key, False)
 
-    async def _async_update_data(self) -> dict:
-        """Obține date de la API cu strategie light/heavy.
+    @property
+    def refresh_timings(self) -> list[dict]:
+        """Ultimele refresh-uri: tipuri aduse, durată, cereri, conexiuni noi, pre-încălzire."""
+        return list(self._refresh_timings)
 
-        Light refresh (frecvent): contract_details, invoice_balance, invoices_unpaid,
-            meter_index, consumption_convention
-        Heavy refresh (rar): + payments, invoices_prosum, invoice_balance_prosum,
-            rescheduling_plans, graphic_consumption, meter_history
+    async def _async_update_data(self) -> dict:
+        """Rulează refresh-ul, îi măsoară durata și programează pre-încălzirea următorului."""
+        kind = "account" if self.account_only else "contract"
+        prewarmed_at, self._prewarmed_at = self._prewarmed_at, None
+        self._node_timings = {}
+        self._cycle_plan = RefreshPlan()
+        before = self.api_client.counters()
+        started = time.monotonic()
+        success = False
+        try:
+            data = await self._async_fetch_data()
+            success = True
+            return data
+        finally:
+            after = self.api_client.counters()
+            timing = {
+                "started_at": dt_util.utcnow().isoformat(),
+                "kind": kind,
+                "fetched_kinds": self._cycle_plan.fetch,
+                "early_kinds": self._cycle_plan.early,
+                "deferred_kinds": self._cycle_plan.deferred,
+                "success": success,
+                "duration_s": round(time.monotonic() - started, 3),
+                "prewarmed": prewarmed_at is not None,
+                **{name: after[name] - before.get(name, 0) for name in after},
+                "nodes": self._node_timings,
+            }
+            self._refresh_timings.append(timing)
+            _LOGGER.debug("Durata refresh (contract=%s): %s", self.cod_incasare, timing)
+            self._schedule_next_refresh()
+            self._schedule_prewarm()
+
+    def _schedule_next_refresh(self) -> None:
+        """Aliniază următorul refresh la faza contractului (DataUpdateCoordinator îl programează după update_interval)."""
+        if self.update_interval is None:
+            return
+        now = dt_util.utcnow()
+        delay = next_refresh_delay(now.timestamp(), self._base_interval, self._phase, self._jitter)
+        self.update_interval = timedelta(seconds=delay)
+        self._next_refresh_at = now + self.update_interval
+
+    def _schedule_prewarm(self) -> None:
+        """Programează pre-încălzirea cu PREWARM_LEAD secunde înaintea următorului refresh."""
+        self._async_cancel_prewarm()
+        if self.update_interval is None:
+            return
+        delay = self.update_interval.total_seconds() - PREWARM_LEAD
+        if delay <= 0:
+            return
+        self._cancel_prewarm = async_call_later(self.hass, delay, self._async_prewarm)
+
+    async def _async_prewarm(self, _now: datetime) -> None:
+        """Deschide conexiunile din timp (sărit dacă alt coordinator tocmai a făcut-o)."""
+        self._cancel_prewarm = None
+        await self.api_client.async_prewarm(PREWARM_CONNECTIONS, idle_after=PREWARM_LEAD * 2)
+        self._prewarmed_at = dt_util.utcnow()
+
+    @callback
+    def _async_cancel_prewarm(self) -> None:
+        """Anulează pre-încălzirea programată (la descărcarea intrării)."""
+        if self._cancel_prewarm is not None:
+            self._cancel_prewarm()
+            self._cancel_prewarm = None
+
+    async def _async_fetch_data(self) -> dict:
+        """Obține date de la API: esențialele + tipurile de date expirate.
+
+        La fiecare refresh: contract_details, invoice_balance, invoices_unpaid,
+            meter_index (individual) / subcontractele (DUO)
+        Doar când le-a expirat TTL-ul: payments, invoices_prosum, invoice_balance_prosum,
+            rescheduling_plans, graphic_consumption, meter_history, consumption_convention
         Account-only: doar user-details (fără contracte)
         """
         # Verificare licență — nu fetchuim date dacă licența/trial nu e validă
@@ -135,12 +352,15 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
             return await self._async_update_data_account_only()
 
         cod = self.cod_incasare
-        is_heavy = self._is_heavy_refresh
+        self._cycle_plan = self._plan_cycle()
+        due = self._cycle_plan.fetch
+        self._failed_fetches = set()
 
         _LOGGER.debug(
-            "Actualizare E·ON (contract=%s, colectiv=%s, refresh=#%s, tip=%s).",
+            "Actualizare E·ON (contract=%s, colectiv=%s, refresh=#%s, de adus=%s, amânate=%s).",
             cod, self.is_collective, self._refresh_counter,
-            "HEAVY" if is_heavy else "light",
+            ", ".join(due) or "niciunul",
+            ", ".join(self._cycle_plan.deferred) or "niciunul",
         )
 
         try:
@@ -173,19 +393,100 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
                     raise UpdateFailed("Nu s-a putut autentifica la API-ul E·ON.")
 
             # ──────────────────────────────────────
-            # Endpoint-uri ESENȚIALE (la fiecare refresh)
+            # Graful refresh-ului: nodurile fără dependențe pornesc toate deodată.
+            # Singura dependență reală: detaliile/convențiile/indexul subcontractelor
+            # DUO au nevoie de lista subcontractelor.
             # ──────────────────────────────────────
-            essential_tasks = [
-                self.api_client.async_fetch_contract_details(cod),
-                self.api_client.async_fetch_invoice_balance(cod),
-                self.api_client.async_fetch_invoices_unpaid(cod),
-            ]
-
-            (
-                contract_details,
-                invoice_balance,
-                invoices_unpaid,
-            ) = await asyncio.gather(*essential_tasks)
+            api = self.api_client
+            graph = FetchGraph()
+
+            # Esențiale (la fiecare refresh)
+            graph.add("contract_details", lambda _: self._async_fetch_contract_details())
+            graph.add("invoice_balance", lambda _: api.async_fetch_invoice_balance(cod))
+            graph.add("invoices_unpaid", lambda _: api.async_fetch_invoices_unpaid(cod))
+
+            # Tipurile de date expirate (TTL), doar cu capabilitate sau prima dată
+            if "payments" in due:
+                graph.add("payments", lambda _: self._async_sync_payments())
+            if "invoices_prosum" in due:
+                graph.add("invoices_prosum", lambda _: self._async_sync_invoices_prosum())
+            if "invoice_balance_prosum" in due:
+                graph.add(
+                    "invoice_balance_prosum",
+                    lambda _: self._async_fetch_checked(
+                        "invoice_balance_prosum",
+                        lambda: api.async_fetch_invoice_balance_prosum(cod),
+                    ),
+                )
+            if "rescheduling_plans" in due:
+                graph.add(
+                    "rescheduling_plans",
+                    lambda _: self._async_fetch_checked(
+                        "rescheduling_plans", lambda: api.async_fetch_rescheduling_plans(cod)
+                    ),
+                )
+
+            if not self.is_collective:
+                # Contract individual: meter_index la fiecare refresh, restul după TTL
+                graph.add("meter_index", lambda _: api.async_fetch_meter_index(cod))
+                if "consumption_convention" in due:
+                    graph.add(
+                        "consumption_convention",
+                        lambda _: self._async_fetch_checked(
+                            "consumption_convention",
+                            lambda: api.async_fetch_consumption_convention(cod),
+                        ),
+                    )
+                if "graphic_consumption" in due:
+                    graph.add(
+                        "graphic_consumption",
+                        lambda _: self._async_fetch_checked(
+                            "graphic_consumption", lambda: api.async_fetch_graphic_consumption(cod)
+                        ),
+                    )
+                if "meter_history" in due:
+                    graph.add(
+                        "meter_history",
+                        lambda _: self._async_fetch_checked(
+                            "meter_history", lambda: api.async_fetch_meter_history(cod)
+                        ),
+                    )
+            else:
+                # Contract colectiv/DUO: lista subcontractelor, apoi datele fiecăruia
+                graph.add("subcontracts", lambda _: self._async_fetch_subcontracts())
+                graph.add(
+                    "subcontracts_details",
+                    lambda r: self._async_fetch_subcontracts_details(r["subcontracts"]),
+                    deps=("subcontracts",),
+                )
+                if "consumption_convention" in due:
+                    graph.add(
+                        "subcontracts_conventions",
+                        lambda r: self._async_fetch_per_subcontract(
+                            "subcontracts_conventions",
+                            r["subcontracts"],
+                            api.async_fetch_consumption_convention,
+                            list,
+                        ),
+                        deps=("subcontracts",),
+                    )
+                graph.add(
+                    "subcontracts_meter_index",
+                    lambda r: self._async_fetch_per_subcontract(
+                        "subcontracts_meter_index",
+                        r["subcontracts"],
+                        api.async_fetch_meter_index,
+                        dict,
+                    ),
+                    deps=("subcontracts",),
+                )
+
+            results = await graph.async_run()
+            self._node_timings = graph.timings
+
+            contract_details = results.get("contract_details")
+            invoice_balance = results.get("invoice_balance")
+            invoices_unpaid = results.get("invoices_unpaid")
 
             _LOGGER.debug(
                 "Date esențiale (contract=%s): contract_details=%s, invoice_balance=%s, "
@@ -197,190 +498,68 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
                 len(invoices_unpaid) if isinstance(invoices_unpaid, list) else "N/A",
             )
 
-            # ──────────────────────────────────────
-            # Endpoint-uri GRELE / OPȚIONALE (doar la heavy refresh)
-            # Se reutilizează datele anterioare la light refresh.
-            # ──────────────────────────────────────
+            # Tipurile cu TTL: valoarea nouă dacă au fost aduse cu succes în acest
+            # ciclu (chiar și un răspuns definitiv gol, ex. fără prosumator),
+            # altfel cea din refresh-ul anterior — fără a reseta TTL-ul
             prev = self.data or {}
 
-            if is_heavy:
-                heavy_tasks = []
-                heavy_labels = []
-
-                # Payments — doar dacă are capabilitate sau prima dată
-                if self._cap("has_payments"):
-                    heavy_tasks.append(
-                        self.api_client.async_fetch_payments(cod, max_pages=MAX_PAGINATED_PAGES)
-                    )
-                    heavy_labels.append("payments")
+            def _fresh_or_prev(key: str, kind: str | None = None):
+                kind = kind or key
+                if kind in due and key in graph and key not in self._failed_fetches:
+                    self._refresh_policy.mark_fetched(kind)
+                    return results.get(key)
+                return prev.get(key)
 
-                # Prosum — doar dacă are capabilitate sau prima dată
-                if self._cap("has_prosum"):
-                    heavy_tasks.append(
-                        self.api_client.async_fetch_invoices_prosum(cod, max_pages=MAX_PAGINATED_PAGES)
-                    )
-                    heavy_labels.append("invoices_prosum")
-                    heavy_tasks.append(
-                        self.api_client.async_fetch_invoice_balance_prosum(cod)
-                    )
-                    heavy_labels.append("invoice_balance_prosum")
-
-                # Rescheduling — doar dacă are capabilitate sau prima dată
-                if self._cap("has_rescheduling"):
-                    heavy_tasks.append(
-                        self.api_client.async_fetch_rescheduling_plans(cod)
-                    )
-                    heavy_labels.append("rescheduling_plans")
+            payments = _fresh_or_prev("payments")
+            invoices_prosum = _fresh_or_prev("invoices_prosum")
+            invoice_balance_prosum = _fresh_or_prev("invoice_balance_prosum")
+            rescheduling_plans = _fresh_or_prev("rescheduling_plans")
 
-                if heavy_tasks:
-                    heavy_results = await asyncio.gather(*heavy_tasks)
-                    heavy_map = dict(zip(heavy_labels, heavy_results))
-                else:
-                    heavy_map = {}
-
-                payments = heavy_map.get("payments")
-                invoices_prosum = heavy_map.get("invoices_prosum")
-                invoice_balance_prosum = heavy_map.get("invoice_balance_prosum")
-                rescheduling_plans = heavy_map.get("rescheduling_plans")
-
-                _LOGGER.debug(
-                    "Date grele (contract=%s): %s endpoint-uri apelate (%s).",
-                    cod, len(heavy_tasks), ", ".join(heavy_labels),
-                )
-
-                # Actualizează capabilitățile (la fiecare heavy refresh)
+            # Capabilitățile derivă din aceste tipuri — recalibrate când oricare a fost adus
+            if self._capabilities is None or any(kind in due for kind in _KIND_CAPABILITY):
                 self._update_capabilities(
                     invoices_prosum, invoice_balance_prosum,
                     rescheduling_plans, payments,
                 )
 
+            meter_index = results.get("meter_index")
+            if self.is_collective:
+                consumption_convention = None
+                graphic_consumption = None
+                meter_history = None
             else:
-                # Light refresh: reutilizăm datele grele din refresh-ul anterior
-                payments = prev.get("payments")
-                invoices_prosum = prev.get("invoices_prosum")
-                invoice_balance_prosum = prev.get("invoice_balance_prosum")
-                rescheduling_plans = prev.get("rescheduling_plans")
-
-            # ──────────────────────────────────────
-            # Endpoint-uri specifice tipului de contract
-            # ──────────────────────────────────────
-            graphic_consumption = None
-            meter_index = None
-            consumption_convention = None
-            meter_history = None
-            subcontracts = None
-            subcontracts_details = None
-            subcontracts_conventions = None
-            subcontracts_meter_index = None
+                consumption_convention = _fresh_or_prev("consumption_convention")
+                graphic_consumption = _fresh_or_prev("graphic_consumption")
+                meter_history = _fresh_or_prev("meter_history")
+
+            subcontracts = results.get("subcontracts")
+            subcontracts_details = results.get("subcontracts_details")
+            subcontracts_conventions = (
+                _fresh_or_prev("subcontracts_conventions", "consumption_convention")
+                if self.is_collective
+                else None
+            )
+            subcontracts_meter_index = results.get("subcontracts_meter_index")
 
             if not self.is_collective:
-                # Contract individual: meter_index + consumption_convention la fiecare refresh
-                # graphic_consumption + meter_history doar la heavy
-                meter_essential_tasks = [
-                    self.api_client.async_fetch_meter_index(cod),
-                    self.api_client.async_fetch_consumption_convention(cod),
-                ]
-
-                (
-                    meter_index,
-                    consumption_convention,
-                ) = await asyncio.gather(*meter_essential_tasks)
-
-                if is_heavy:
-                    meter_heavy_tasks = [
-                        self.api_client.async_fetch_graphic_consumption(cod),
-                        self.api_client.async_fetch_meter_history(cod),
-                    ]
-                    (
-                        graphic_consumption,
-                        meter_history,
-                    ) = await asyncio.gather(*meter_heavy_tasks)
-                else:
-                    graphic_consumption = prev.get("graphic_consumption")
-                    meter_history = prev.get("meter_history")
-
                 _LOGGER.debug(
                     "Date contor (contract=%s): meter_index=%s, consumption_convention=%s, "
                     "graphic_consumption=%s, meter_history=%s.",
                     cod,
                     type(meter_index).__name__ if meter_index else None,
                     type(consumption_convention).__name__ if consumption_convention else None,
-                    "fresh" if is_heavy and graphic_consumption else ("cached" if graphic_consumption else None),
-                    "fresh" if is_heavy and meter_history else ("cached" if meter_history else None),
+                    "fresh" if "graphic_consumption" in graph else ("cached" if graphic_consumption else None),
+                    "fresh" if "meter_history" in graph else ("cached" if meter_history else None),
                 )
-
-            else:
-                # Contract colectiv/DUO: subcontracte
+            elif subcontracts:
                 _LOGGER.debug(
-                    "Contract colectiv/DUO (contract=%s). Se interoghează subcontractele.",
-                    cod,
-                )
-                raw_subs = await self.api_client.async_fetch_contracts_list(
-                    collective_contract=cod
+                    "DUO (contract=%s): %s subcontracte, details=%s, conventions=%s, meter_index=%s.",
+                    cod, len(subcontracts),
+                    len(subcontracts_details) if subcontracts_details else 0,
+                    len(subcontracts_conventions) if subcontracts_conventions else 0,
+                    len(subcontracts_meter_index) if subcontracts_meter_index else 0,
                 )
 
-                if raw_subs and isinstance(raw_subs, list):
-                    subcontracts = [
-                        s for s in raw_subs
-                        if isinstance(s, dict) and s.get("accountContract")
-                    ]
-
-                    sub_codes = [s["accountContract"] for s in subcontracts]
-                    if sub_codes:
-                        # Esențiale per subcontract: details + convention + meter_index
-                        detail_tasks = [
-                            self.api_client.async_fetch_contract_details(sc)
-                            for sc in sub_codes
-                        ]
-                        convention_tasks = [
-                            self.api_client.async_fetch_consumption_convention(sc)
-                            for sc in sub_codes
-                        ]
-                        meter_index_tasks = [
-                            self.api_client.async_fetch_meter_index(sc)
-                            for sc in sub_codes
-                        ]
-                        all_results = await asyncio.gather(
-                            *detail_tasks, *convention_tasks, *meter_index_tasks
-                        )
-
-                        n = len(sub_codes)
-                        detail_results = all_results[:n]
-                        convention_results = all_results[n:2 * n]
-                        meter_index_results = all_results[2 * n:]
-
-                        subcontracts_details = [
-                            d for d in detail_results if isinstance(d, dict)
-                        ] or None
-
-                        subcontracts_conventions = {}
-                        for sc_code, conv_data in zip(sub_codes, convention_results):
-                            if conv_data and isinstance(conv_data, list) and len(conv_data) > 0:
-                                subcontracts_conventions[sc_code] = conv_data
-                        subcontracts_conventions = subcontracts_conventions or None
-
-                        subcontracts_meter_index = {}
-                        for sc_code, mi_data in zip(sub_codes, meter_index_results):
-                            if mi_data and isinstance(mi_data, dict):
-                                subcontracts_meter_index[sc_code] = mi_data
-                        subcontracts_meter_index = subcontracts_meter_index or None
-
-                        _LOGGER.debug(
-                            "DUO (contract=%s): %s subcontracte, details=%s, conventions=%s, meter_index=%s.",
-                            cod, n,
-                            len(subcontracts_details) if subcontracts_details else 0,
-                            len(subcontracts_conventions) if subcontracts_conventions else 0,
-                            len(subcontracts_meter_index) if subcontracts_meter_index else 0,
-                        )
-
-                    if not subcontracts:
-                        subcontracts = None
-                else:
-                    _LOGGER.warning(
-                        "DUO list (collective) invalid (contract=%s): %s.",
-                        cod, type(raw_subs).__name__,
-                    )
-
         except asyncio.TimeoutError as err:
             _LOGGER.error(
                 "Depășire de timp la actualizarea datelor E·ON (contract=%s): %s.", cod, err
@@ -423,9 +602,6 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
         # Incrementăm contorul de refresh
         self._refresh_counter += 1
 
-        # Persistăm token-ul curent în config_entry.data (pentru restart HA)
-        self._persist_token()
-
         # Sumar
         _LOGGER.debug(
             "Actualizare E·ON finalizată (contract=%s, colectiv=%s, refresh=#%s).",
@@ -458,6 +634,197 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
             "is_collective": self.is_collective,
         }
 
+    async def _async_fetch_contract_details(self):
+        """contract_details: din runda în lot a intrării (dacă există), altfel individual."""
+        if self._details_prefetcher is not None:
+            return await self._details_prefetcher.async_get(self.cod_incasare)
+        return await self.api_client.async_fetch_contract_details(self.cod_incasare)
+
+    async def _async_fetch_subcontracts(self) -> list[dict] | None:
+        """Subcontractele unui contract colectiv/DUO (doar cele cu accountContract)."""
+        _LOGGER.debug(
+            "Contract colectiv/DUO (contract=%s). Se interoghează subcontractele.",
+            self.cod_incasare,
+        )
+        raw_subs = await self.api_client.async_fetch_contracts_list(
+            collective_contract=self.cod_incasare
+        )
+        if not raw_subs or not isinstance(raw_subs, list):
+            _LOGGER.warning(
+                "DUO list (collective) invalid (contract=%s): %s.",
+                self.cod_incasare, type(raw_subs).__name__,
+            )
+            return None
+        subcontracts = [
+            s for s in raw_subs
+            if isinstance(s, dict) and s.get("accountContract")
+        ]
+        return subcontracts or None
+
+    async def _async_fetch_subcontracts_details(self, subcontracts: list[dict] | None) -> list[dict] | None:
+        """Detaliile subcontractelor, în lot (ordinea subcontractelor e păstrată)."""
+        if not subcontracts:
+            return None
+        sub_codes = [s["accountContract"] for s in subcontracts]
+        details_by_code = await self.api_client.async_fetch_contract_details_batch(sub_codes)
+        return [
+            details_by_code[str(sc)] for sc in sub_codes if str(sc) in details_by_code
+        ] or None
+
+    async def _async_fetch_checked(self, node: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Rulează cererea unui nod și notează dacă a eșuat (un răspuns gol nu e eșec)."""
+        self.api_client.reset_request_outcome()
+        value = await fetch()
+        if self.api_client.requests_failed:
+            self._failed_fetches.add(node)
+        return value
+
+    async def _async_fetch_per_subcontract(
+        self,
+        node: str,
+        subcontracts: list[dict] | None,
+        fetch: Callable[[str], Any],
+        expected: type,
+    ) -> dict | None:
+        """Câte o cerere per subcontract; păstrează doar răspunsurile nevide de tipul așteptat.
+
+        Nodul e marcat eșuat dacă lista subcontractelor lipsește sau oricare cerere a eșuat.
+        """
+        if not subcontracts:
+            self._failed_fetches.add(node)
+            return None
+        sub_codes = [s["accountContract"] for s in subcontracts]
+        results = await asyncio.gather(
+            *(self._async_fetch_checked(node, lambda sc=sc: fetch(sc)) for sc in sub_codes)
+        )
+        return {
+            sc: data for sc, data in zip(sub_codes, results)
+            if data and isinstance(data, expected)
+        } or None
+
+    async def _async_sync_payments(self) -> list | None:
+        """Plățile contractului, din istoricul local completat incremental."""
+        return await self._async_sync_history(
+            "payments",
+            lambda prefetch, cursor: self.api_client.async_iter_payments(
+                self.cod_incasare, prefetch=prefetch, cursor=cursor
+            ),
+            payment_key,
+            sort_field="paymentDate",
+        )
+
+    async def _async_sync_invoices_prosum(self) -> list | None:
+        """Facturile de prosumator, din istoricul local completat incremental.
+
+        Facturile stocate care încă au sold trebuie revăzute (soldul se poate
+        schimba), deci parcurgerea continuă până le reîntâlnește pe toate.
+        """
+        return await self._async_sync_history(
+            "invoices_prosum",
+            lambda prefetch, cursor: self.api_client.async_iter_invoices_prosum(
+                self.cod_incasare, prefetch=prefetch, cursor=cursor
+            ),
+            invoice_key,
+            sort_field="maturityDate",
+            must_revisit=invoice_is_open,
+        )
+
+    @property
+    def prosum_invoices(self) -> list:
+        """Facturile de prosumator din istoricul local (cele mai recente primele)."""
+        return self._history.records("invoices_prosum")
+
+    @property
+    def prosum_invoices_unverified(self) -> set[str]:
+        """Cheile facturilor de prosumator al căror sold nu mai e revăzut (poate fi învechit)."""
+        return self._history.revisit_expired("invoices_prosum")
+
+    async def _async_sync_history(
+        self,
+        kind: str,
+        open_stream: Callable[[int, PageCursor], AsyncIterator[list]],
+        key_fn: Callable[[dict], str],
+        sort_field: str,
+        must_revisit: Callable[[dict], bool] | None = None,
+    ) -> list | None:
+        """Sincronizează incremental un istoric paginat (cele mai recente pagini primele).
+
+        - Prima dată (backfill): se parcurg toate paginile, cu prefetch.
+        - Apoi: se aduc pagini doar până la prima pagină care conține un
+          element deja cunoscut (high-water mark-ul persistat) și după ce
+          au fost revăzute toate elementele marcate de `must_revisit` (cel mult
+          REVISIT_MAX_PAGES pagini; cele negăsite nu mai sunt căutate ulterior).
+        Dacă parcurgerea se termină fără a atinge un element cunoscut,
+        ar putea rămâne o gaură în istoric → se reface backfill-ul data viitoare.
+        O pagină care nu a putut fi adusă (eroare de rețea, 5xx) nu e o gaură:
+        paginile incrementale deja aduse se aruncă, iar sync-ul următor reia
+        parcurgerea incrementală de la pagina 1; starea backfill rămâne neschimbată.
+
+        Returnează înregistrările cunoscute, sau None dacă parcurgerea a eșuat
+        (nodul e marcat eșuat: TTL-ul nu se resetează, se reîncearcă la ciclul următor).
+        """
+        history = self._history
+        await history.async_load()
+
+        backfill = not history.is_backfilled(kind)
+        known = history.known_keys(kind, key_fn)
+        revisit = {
+            key_fn(item)
+            for item in history.records(kind)
+            if must_revisit is not None and must_revisit(item)
+        } - history.revisit_expired(kind)
+        revisit_pages = 0
+        cursor = PageCursor()
+        fetched: list = []
+        reached_known = False
+
+        stream = open_stream(PAGINATED_PREFETCH if backfill else 0, cursor)
+        async with aclosing(stream) as pages:
+            async for chunk in pages:
+                fetched.extend(chunk)
+                keys = {key_fn(item) for item in chunk}
+                revisit -= keys
+                if not backfill and not known.isdisjoint(keys):
+                    reached_known = True
+                if reached_known:
+                    if not revisit:
+                        break
+                    revisit_pages += 1
+                    if revisit_pages > REVISIT_MAX_PAGES:
+                        _LOGGER.debug(
+                            "[HISTORY] %s (contract=%s): %s înregistrări deschise negăsite în %s pagini — tratate ca închise.",
+                            kind, self.cod_incasare, len(revisit), REVISIT_MAX_PAGES,
+                        )
+                        history.expire_revisit(kind, revisit)
+                        break
+
+        if cursor.failed and not backfill and not reached_known:
+            # Paginile aduse nu se leagă de istoricul cunoscut — fără ele, high-water
+            # mark-ul rămâne pe loc și data viitoare se reia de la pagina 1
+            fetched = []
+        added = history.merge(kind, fetched, key_fn, sort_field)
+        if backfill:
+            history.set_backfilled(kind, cursor.complete)
+        elif not reached_known and not cursor.complete and not cursor.failed:
+            history.set_backfilled(kind, False)
+        if fetched:
+            history.async_schedule_save()
+
+        _LOGGER.debug(
+            "[HISTORY] %s (contract=%s): %s, %s pagini, %s noi, %s total, hwm=%s.",
+            kind,
+            self.cod_incasare,
+            "backfill" if backfill else "incremental",
+            cursor.pages,
+            added,
+            len(history.records(kind)),
+            history.high_water_mark(kind),
+        )
+        if cursor.failed:
+            self._failed_fetches.add(kind)
+            return None
+        return history.records(kind)
+
     async def _async_update_data_account_only(self) -> dict:
         """Actualizare simplificată: doar user-details (conturi fără contracte)."""
         _LOGGER.debug(
@@ -494,7 +861,6 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
             raise UpdateFailed("Nu s-au putut obține datele personale (user-details).")
 
         self._refresh_counter += 1
-        self._persist_token()
 
         _LOGGER.debug(
             "Actualizare account_only finalizată (refresh=#%s, user=%s).",
@@ -507,38 +873,6 @@ class EonRomaniaCoordinator(DataUpdateCoordinator):
             "user_details": user_details,
         }
 
-    def _persist_token(self) -> None:
-        """Persistă token-ul curent în config_entry.data pentru restart HA.
-
-        Salvează refresh_token + access_token astfel încât la restart
-        coordinatorul poate folosi refresh_token fără a necesita MFA.
-        """
-        if self._config_entry is None:
-            return
-        token_data = self.api_client.export_token_data()
-        if token_data is None:
-            return
-
-        current_data = dict(self._config_entry.data)
-        old_token = current_data.get("token_data", {})
-
-        # Actualizăm doar dacă s-a schimbat ceva (evităm scrieri inutile)
-        if (
-            old_token.get("access_token") == token_data.get("access_token")
-            and old_token.get("refresh_token") == token_data.get("refresh_token")
-        ):
-            return
-
-        current_data["token_data"] = token_data
-        self.hass.config_entries.async_update_entry(
-            self._config_entry, data=current_data
-        )
-        _LOGGER.debug(
-            "Token persistat în config_entry (contract=%s, access=%s...).",
-            self.cod_incasare,
-            token_data["access_token"][:8] if token_data.get("access_token") else "None",
-        )
-
     def _create_reauth_notification(self) -> None:
         """Creează o notificare persistentă care cere reconfigurare MFA."""
         from homeassistant.components import persistent_notification
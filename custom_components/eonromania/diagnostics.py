@@ -5,6 +5,8 @@ Exportă informații de diagnostic pentru support tickets:
 - Licență (fingerprint, status, cheie mascată)
 - Contracte active și senzori
 - Starea coordinator-elor
+- Statistici client API
+- Planificarea refresh-urilor pentru toate intrările (eșalonare)
 
 Datele sensibile (parolă, token-uri) sunt excluse.
 """
@@ -45,8 +47,21 @@ async def async_get_config_entry_diagnostics(
             coordinators_info[cod] = {
                 "is_collective": getattr(coordinator, "is_collective", False),
                 "last_update_success": coordinator.last_update_success,
+                "refresh_timings": getattr(coordinator, "refresh_timings", []),
+                "freshness": getattr(coordinator, "freshness", {}),
+                "load_profile": getattr(coordinator, "load_profile", []),
+                "schedule": getattr(coordinator, "schedule", {}),
             }
 
+    # ── Client API (comasări single-flight, contoare HTTP) ──
+    api_info: dict[str, Any] = {}
+    api_client = getattr(runtime, "api_client", None) if runtime else None
+    if api_client is not None:
+        api_info = api_client.diagnostics()
+    details_prefetcher = getattr(runtime, "details_prefetcher", None) if runtime else None
+    if details_prefetcher is not None:
+        api_info["details_prefetch"] = details_prefetcher.stats()
+
     # ── Senzori activi ──
     senzori_activi = sorted(
         entitate.entity_id
@@ -66,6 +81,8 @@ async def async_get_config_entry_diagnostics(
         },
         "licenta": licenta_info,
         "contracte": coordinators_info,
+        "api": api_info,
+        "planificare": _planificare_globala(hass),
         "stare": {
             "senzori_activi": len(senzori_activi),
             "lista_senzori": senzori_activi,
@@ -73,6 +90,18 @@ async def async_get_config_entry_diagnostics(
     }
 
 
+def _planificare_globala(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Următorul refresh planificat al fiecărui coordinator, din toate intrările, în ordine."""
+    planificare: list[dict[str, Any]] = []
+    for other in hass.config_entries.async_entries(DOMAIN):
+        runtime = getattr(other, "runtime_data", None)
+        for cod, coordinator in getattr(runtime, "coordinators", {}).items():
+            schedule = getattr(coordinator, "schedule", None)
+            if schedule:
+                planificare.append({"intrare": other.title, "contract": cod, **schedule})
+    return sorted(planificare, key=lambda item: item["next_refresh"] or "")
+
+
 def _mascheaza_email(email: str) -> str:
     """Maschează email-ul păstrând prima literă și domeniul."""
     if not email or "@" not in email:
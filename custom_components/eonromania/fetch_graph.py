@@ -0,0 +1,84 @@
+"""Graful de dependențe al unui refresh: fiecare endpoint e un nod.
+
+Un nod pornește imediat ce nodurile de care depinde s-au terminat; nodurile
+independente rulează toate simultan (ritmul și concurența reale sunt
+impuse oricum de RequestScheduler). Durata unui refresh tinde astfel spre
+cel mai lung lanț de dependențe, nu spre suma etapelor. Pentru fiecare nod
+se păstrează momentul pornirii și durata (vezi diagnostics).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# Funcția unui nod primește rezultatele nodurilor deja terminate
+NodeFetch = Callable[[Mapping[str, Any]], Awaitable[Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class _Node:
+    name: str
+    fetch: NodeFetch
+    deps: tuple[str, ...]
+
+
+class FetchGraph:
+    """Noduri de fetch cu dependențe, rulate concurent."""
+
+    def __init__(self) -> None:
+        """Inițializează un graf gol."""
+        self._nodes: dict[str, _Node] = {}
+        self._timings: dict[str, dict[str, Any]] = {}
+
+    def add(self, name: str, fetch: NodeFetch, deps: tuple[str, ...] = ()) -> None:
+        """Adaugă un nod; dependențele trebuie adăugate înaintea lui (graful rămâne aciclic)."""
+        if name in self._nodes:
+            raise ValueError(f"Nod duplicat: {name}")
+        missing = [dep for dep in deps if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"Nodul {name} depinde de noduri necunoscute: {missing}")
+        self._nodes[name] = _Node(name, fetch, tuple(deps))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes
+
+    @property
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """Per nod: pornire (ms de la începutul rulării), durată (ms), dependențe."""
+        return self._timings
+
+    async def async_run(self) -> dict[str, Any]:
+        """Rulează toate nodurile. O excepție într-un nod anulează restul și e propagată."""
+        results: dict[str, Any] = {}
+        self._timings = {}
+        started = time.monotonic()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _run(node: _Node) -> None:
+            if node.deps:
+                await asyncio.gather(*(tasks[dep] for dep in node.deps))
+            node_started = time.monotonic()
+            try:
+                results[node.name] = await node.fetch(results)
+            finally:
+                self._timings[node.name] = {
+                    "start_ms": round((node_started - started) * 1000, 1),
+                    "duration_ms": round((time.monotonic() - node_started) * 1000, 1),
+                    "deps": list(node.deps),
+                }
+
+        # Ordinea de inserare e topologică (vezi add), deci dependențele au deja task
+        for node in self._nodes.values():
+            tasks[node.name] = asyncio.ensure_future(_run(node))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        return results
@@ -0,0 +1,146 @@
+"""Istoric local persistent pentru datele paginate ale unui contract E·ON.
+
+Plățile și facturile de prosumator sunt păstrate în .storage, deduplicate
+după o cheie stabilă. După o primă parcurgere completă (backfill), fiecare
+refresh aduce doar paginile noi, până la primul element deja cunoscut.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY_PREFIX = f"{DOMAIN}_history"
+
+# Scrierile pe disc sunt grupate (un singur write la câteva secunde după ultima modificare)
+SAVE_DELAY = 10
+
+
+def payment_key(payment: dict) -> str:
+    """Cheia unei plăți: data plății + valoarea (high-water mark-ul persistat)."""
+    return f"{payment.get('paymentDate', '')}|{payment.get('value', '')}"
+
+
+def invoice_key(invoice: dict) -> str:
+    """Cheia unei facturi: numărul facturii (fallback: scadență + valoare emisă)."""
+    number = invoice.get("invoiceNumber")
+    if number:
+        return str(number)
+    return f"{invoice.get('maturityDate', '')}|{invoice.get('issuedValue', '')}"
+
+
+def invoice_is_open(invoice: dict) -> bool:
+    """True dacă factura mai are de plată (sold pozitiv) — trebuie revăzută la sync.
+
+    Creditele și notele de credit (sold negativ) nu se mai urmăresc: nu se
+    „închid" prin plată, deci ar forța la nesfârșit parcurgeri lungi.
+    """
+    try:
+        return float(invoice.get("balanceValue", 0) or 0) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+class HistoryStore:
+    """Istoric persistent al unui contract, organizat pe secțiuni (ex. „payments")."""
+
+    def __init__(self, hass: HomeAssistant, cod_incasare: str) -> None:
+        """Inițializează store-ul (datele se încarcă la primul async_load)."""
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}_{cod_incasare}")
+        self._data: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Încarcă istoricul din storage (o singură dată)."""
+        if self._loaded:
+            return
+        try:
+            stored = await self._store.async_load()
+            self._data = dict(stored) if stored else {}
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("[HISTORY] Storage ilizibil — se reface istoricul de la zero.")
+            self._data = {}
+        self._loaded = True
+
+    async def async_remove(self) -> None:
+        """Șterge istoricul de pe disc (la eliminarea integrării)."""
+        await self._store.async_remove()
+        self._data = {}
+
+    def _section(self, kind: str) -> dict[str, Any]:
+        return self._data.setdefault(
+            kind, {"records": [], "backfilled": False, "high_water_mark": None}
+        )
+
+    def records(self, kind: str) -> list[dict]:
+        """Toate înregistrările cunoscute, cele mai recente primele."""
+        return self._section(kind)["records"]
+
+    def is_backfilled(self, kind: str) -> bool:
+        """True dacă istoricul complet a fost adus cel puțin o dată."""
+        return self._section(kind)["backfilled"]
+
+    def set_backfilled(self, kind: str, value: bool) -> None:
+        """Marchează (sau resetează) finalizarea parcurgerii complete."""
+        self._section(kind)["backfilled"] = value
+
+    def high_water_mark(self, kind: str) -> str | None:
+        """Cheia celei mai recente înregistrări cunoscute."""
+        return self._section(kind)["high_water_mark"]
+
+    def revisit_expired(self, kind: str) -> set[str]:
+        """Cheile renunțate la revizitare (negăsite în limita de pagini) — tratate ca închise."""
+        return set(self._section(kind).get("revisit_expired", []))
+
+    def expire_revisit(self, kind: str, keys: set[str]) -> None:
+        """Renunță la revizitarea unor înregistrări (nu mai prelungesc sync-urile următoare)."""
+        section = self._section(kind)
+        section["revisit_expired"] = sorted(set(section.get("revisit_expired", [])) | keys)
+
+    def known_keys(self, kind: str, key_fn: Callable[[dict], str]) -> set[str]:
+        """Cheile tuturor înregistrărilor cunoscute."""
+        return {key_fn(item) for item in self.records(kind)}
+
+    def merge(
+        self,
+        kind: str,
+        items: list[dict],
+        key_fn: Callable[[dict], str],
+        sort_field: str,
+    ) -> int:
+        """Adaugă/actualizează înregistrări (upsert după cheie). Returnează câte sunt noi."""
+        section = self._section(kind)
+        by_key = {key_fn(item): item for item in section["records"]}
+        expired = set(section.get("revisit_expired", []))
+        added = 0
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            key = key_fn(item)
+            if key not in by_key:
+                added += 1
+            by_key[key] = item
+            # Revăzută cu date proaspete — soldul ei e din nou de încredere
+            expired.discard(key)
+        if "revisit_expired" in section:
+            section["revisit_expired"] = sorted(expired)
+
+        records = sorted(
+            by_key.values(), key=lambda item: item.get(sort_field) or "", reverse=True
+        )
+        section["records"] = records
+        section["high_water_mark"] = key_fn(records[0]) if records else None
+        return added
+
+    def async_schedule_save(self) -> None:
+        """Programează salvarea pe disc (grupată)."""
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
@@ -0,0 +1,183 @@
+"""Latența observată per endpoint și timeout-urile adaptive derivate din ea.
+
+Fiecare endpoint are o histogramă cu bucket-uri logaritmice. Timeout-ul
+unei cereri devine p99 × multiplicator, limitat între un minim și un
+maxim; până la strângerea suficientor eșantioane se folosește maximul
+(API_TIMEOUT). O conexiune blocată pe un endpoint rapid eșuează astfel în
+câteva secunde, nu după 30.
+
+Profilul învățat se păstrează în .storage între reporniri.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY_PREFIX = f"{DOMAIN}_latency"
+
+# Scrierile pe disc sunt grupate (un singur write la câteva secunde după ultima programare)
+SAVE_DELAY = 10
+
+# Limitele superioare ale bucket-urilor (secunde): 50 ms → ~2 min, pas ×1.25
+_BUCKET_FACTOR = 1.25
+_BUCKETS: tuple[float, ...] = tuple(0.05 * _BUCKET_FACTOR**i for i in range(36))
+
+# Când numărul de eșantioane depășește fereastra, contoarele se înjumătățesc:
+# histograma urmărește comportamentul recent, nu tot istoricul.
+_WINDOW = 500
+
+
+class LatencyHistogram:
+    """Histogramă cu bucket-uri logaritmice și îmbătrânire exponențială."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, counts: list[float] | None = None) -> None:
+        """Inițializează histograma (opțional din contoare salvate)."""
+        if counts is None or len(counts) != len(_BUCKETS) + 1:
+            counts = [0.0] * (len(_BUCKETS) + 1)  # +1: peste ultimul bucket
+        self.counts = counts
+        self.total = sum(counts)
+
+    def record(self, seconds: float) -> None:
+        """Adaugă un eșantion."""
+        index = len(_BUCKETS)
+        for i, bound in enumerate(_BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.total += 1
+        if self.total > _WINDOW:
+            self.counts = [count / 2 for count in self.counts]
+            self.total /= 2
+
+    def percentile(self, q: float) -> float:
+        """Estimarea percentilei q (0–1): limita superioară a bucket-ului în care cade."""
+        target = q * self.total
+        seen = 0.0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return _BUCKETS[min(i, len(_BUCKETS) - 1)]
+        return _BUCKETS[-1]
+
+
+class LatencyTracker:
+    """Histogramele de latență ale unui client și timeout-urile calculate din ele."""
+
+    def __init__(
+        self,
+        multiplier: float,
+        floor: float,
+        ceiling: float,
+        min_samples: int,
+    ) -> None:
+        """Inițializează tracker-ul.
+
+        Args:
+            multiplier: Timeout = p99 × multiplier.
+            floor: Timeout minim (secunde).
+            ceiling: Timeout maxim (secunde) — folosit și cât timp nu sunt destule eșantioane.
+            min_samples: Eșantioane necesare înainte de a adapta timeout-ul.
+        """
+        self._multiplier = multiplier
+        self._floor = floor
+        self._ceiling = ceiling
+        self._min_samples = min_samples
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Înregistrează durata unei încercări (inclusiv cele terminate cu timeout)."""
+        histogram = self._histograms.get(endpoint)
+        if histogram is None:
+            histogram = self._histograms[endpoint] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def percentile(self, endpoint: str, q: float) -> float | None:
+        """Percentila q a endpoint-ului; None dacă nu sunt destule eșantioane."""
+        histogram = self._histograms.get(endpoint)
+        if histogram is None or histogram.total < self._min_samples:
+            return None
+        return histogram.percentile(q)
+
+    def timeout(self, endpoint: str) -> float:
+        """Timeout-ul adaptiv: clamp(p99 × multiplier, floor, ceiling)."""
+        p99 = self.percentile(endpoint, 0.99)
+        if p99 is None:
+            return self._ceiling
+        return min(self._ceiling, max(self._floor, p99 * self._multiplier))
+
+    def export_profile(self) -> dict[str, Any]:
+        """Profilul învățat, serializabil (pentru Store)."""
+        return {
+            "buckets": len(_BUCKETS),
+            "factor": _BUCKET_FACTOR,
+            "endpoints": {
+                endpoint: [round(count, 3) for count in histogram.counts]
+                for endpoint, histogram in self._histograms.items()
+            },
+        }
+
+    def import_profile(self, profile: dict[str, Any] | None) -> None:
+        """Restaurează un profil salvat; profilele cu alte bucket-uri sunt ignorate."""
+        if not profile:
+            return
+        if profile.get("buckets") != len(_BUCKETS) or profile.get("factor") != _BUCKET_FACTOR:
+            _LOGGER.debug("[LATENCY] Profil salvat incompatibil — se reînvață de la zero.")
+            return
+        for endpoint, counts in (profile.get("endpoints") or {}).items():
+            if isinstance(counts, list):
+                self._histograms[endpoint] = LatencyHistogram([float(c) for c in counts])
+        _LOGGER.debug("[LATENCY] Profil restaurat pentru %s endpoint-uri.", len(self._histograms))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Percentile și timeout curent per endpoint (pentru diagnostics)."""
+        result: dict[str, dict[str, Any]] = {}
+        for endpoint, histogram in sorted(self._histograms.items()):
+            result[endpoint] = {
+                "samples": round(histogram.total, 1),
+                "p50_s": round(histogram.percentile(0.5), 3),
+                "p95_s": round(histogram.percentile(0.95), 3),
+                "p99_s": round(histogram.percentile(0.99), 3),
+                "timeout_s": round(self.timeout(endpoint), 2),
+            }
+        return result
+
+
+class LatencyProfileStore:
+    """Persistența profilului de latență al unei intrări (config entry)."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Inițializează store-ul."""
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}_{entry_id}")
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Încarcă profilul salvat (None dacă lipsește sau e ilizibil)."""
+        try:
+            return await self._store.async_load()
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("[LATENCY] Storage ilizibil — se reînvață profilul de latență.")
+            return None
+
+    def async_schedule_save(self, export: Callable[[], dict[str, Any]]) -> None:
+        """Programează salvarea profilului (grupată; `export` e apelat la scriere)."""
+        self._store.async_delay_save(export, SAVE_DELAY)
+
+    async def async_save(self, profile: dict[str, Any]) -> None:
+        """Salvează profilul imediat (la descărcarea intrării)."""
+        await self._store.async_save(profile)
+
+    async def async_remove(self) -> None:
+        """Șterge profilul de pe disc (la eliminarea integrării)."""
+        await self._store.async_remove()
@@ -0,0 +1,108 @@
+"""Detaliile contractelor unei intrări, aduse o singură dată per ciclu.
+
+Când sunt selectate mai multe contracte ale aceluiași cont, fiecare
+coordinator ar cere separat contract_details, după propriul program. Primul
+coordinator care are nevoie de detalii într-un ciclu le aduce pentru TOATE
+contractele înregistrate, printr-o singură cerere în lot
+(URL_CONTRACTS_DETAILS_LIST); ceilalți primesc rezultatul din aceeași rundă,
+cât timp acesta e mai nou decât fereastra de refolosire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from .api import EonApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ContractDetailsPrefetcher:
+    """Cerere în lot pentru detaliile contractelor înregistrate, partajată între coordinatoare."""
+
+    def __init__(self, api_client: EonApiClient, window: float) -> None:
+        """Inițializează prefetcher-ul.
+
+        Args:
+            api_client: Clientul intrării.
+            window: Cât timp (secunde) un rezultat în lot e refolosit de celelalte coordinatoare.
+        """
+        self._api = api_client
+        self._window = window
+        self._codes: list[str] = []
+        self._results: dict[str, dict] = {}
+        self._fetched_at: float | None = None
+        self._pending: asyncio.Future | None = None
+        self._stats: dict[str, int] = {"batches": 0, "shared_hits": 0, "misses": 0}
+
+    @property
+    def window(self) -> float:
+        """Fereastra de refolosire a unui rezultat (secunde)."""
+        return self._window
+
+    def register(self, account_contract: str) -> None:
+        """Adaugă un contract în lot."""
+        code = str(account_contract)
+        if code not in self._codes:
+            self._codes.append(code)
+
+    def unregister(self, account_contract: str) -> None:
+        """Scoate un contract din lot (ex. coordinatorul lui a fost renunțat)."""
+        code = str(account_contract)
+        if code in self._codes:
+            self._codes.remove(code)
+        self._results.pop(code, None)
+
+    async def async_get(self, account_contract: str) -> dict | None:
+        """Detaliile contractului: din runda curentă dacă e proaspătă, altfel o rundă nouă."""
+        code = str(account_contract)
+        if code not in self._codes or len(self._codes) < 2:
+            # Un singur contract: cererea individuală (cu validatori / 304) e mai ieftină
+            return await self._api.async_fetch_contract_details(code)
+
+        if self._pending is None and not self._is_fresh(code):
+            self._pending = asyncio.ensure_future(self._async_fetch_round())
+            self._pending.add_done_callback(self._clear_pending)
+        elif self._pending is None:
+            # Servit din runda altui coordinator; rezultatul e consumat o singură dată,
+            # astfel încât următorul ciclu al acestui contract pornește o rundă nouă
+            self._stats["shared_hits"] += 1
+            return self._results.pop(code)
+
+        results = await asyncio.shield(self._pending)
+        details = results.pop(code, None)
+        if details is None:
+            self._stats["misses"] += 1
+        return details
+
+    def _is_fresh(self, code: str) -> bool:
+        return (
+            code in self._results
+            and self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self._window
+        )
+
+    def _clear_pending(self, _future: asyncio.Future) -> None:
+        self._pending = None
+
+    async def _async_fetch_round(self) -> dict[str, dict]:
+        """O rundă: detaliile tuturor contractelor înregistrate, într-o singură cerere în lot."""
+        self._stats["batches"] += 1
+        self._results = await self._api.async_fetch_contract_details_batch(self._codes)
+        self._fetched_at = time.monotonic()
+        _LOGGER.debug(
+            "[PREFETCH] Detalii aduse în lot pentru %s/%s contracte.",
+            len(self._results), len(self._codes),
+        )
+        return self._results
+
+    def stats(self) -> dict[str, Any]:
+        """Contoare pentru diagnostics."""
+        return {
+            "contracts": len(self._codes),
+            "window_s": self._window,
+            **self._stats,
+        }
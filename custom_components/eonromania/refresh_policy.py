@@ -0,0 +1,139 @@
+"""Prospețimea datelor per tip: fiecare ciclu aduce doar ce a expirat.
+
+Fiecare tip de date „lent" (plăți, istoric index, convenție etc.) are un TTL
+propriu, independent de intervalul de actualizare. Datele esențiale (detalii
+contract, sold, facturi neachitate, index curent) nu au TTL: sunt aduse la
+fiecare ciclu. TTL-urile implicite sunt în const.REFRESH_TTL_DEFAULTS și pot
+fi suprascrise din opțiuni (config_entry.data["refresh_ttl"]).
+
+Ca tipurile cu același TTL să nu expire toate în același ciclu (vârf de
+cereri), fiecare ciclu aduce cel mult un număr mic de tipuri (buget). Când
+mai multe tipuri ar expira în ciclurile următoare decât poate absorbi bugetul
+acelor cicluri, cele mai apropiate de expirare sunt aduse mai devreme, în
+locurile libere ale ciclului curent. După câteva cicluri tipurile ajung
+eșalonate și niciunul nu mai e adus înainte de expirare.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import REFRESH_TTL_DEFAULTS
+
+
+def resolve_ttls(overrides: Mapping[str, Any] | None) -> dict[str, int]:
+    """TTL-urile efective: implicitele, suprascrise de valorile valide din opțiuni."""
+    ttls = dict(REFRESH_TTL_DEFAULTS)
+    for kind, value in (overrides or {}).items():
+        if kind not in ttls:
+            continue
+        try:
+            ttls[kind] = max(0, int(value))
+        except (TypeError, ValueError):
+            continue
+    return ttls
+
+
+# Un tip care expiră în următoarele câteva procente din interval e considerat deja
+# expirat (altfel ar aștepta un ciclu întreg din cauza unei diferențe de secunde)
+_DUE_TOLERANCE = 0.1
+
+
+@dataclass(slots=True)
+class RefreshPlan:
+    """Tipurile de date de adus într-un ciclu."""
+
+    # De adus acum: niciodată aduse + expirate (în limita bugetului) + aduse devreme
+    fetch: list[str] = field(default_factory=list)
+    # Aduse înainte de expirare, pentru a elibera ciclurile următoare
+    early: list[str] = field(default_factory=list)
+    # Expirate, dar amânate un ciclu (buget depășit)
+    deferred: list[str] = field(default_factory=list)
+
+
+class RefreshPolicy:
+    """Momentul ultimei aduceri a fiecărui tip de date și ce a expirat."""
+
+    def __init__(self, ttls: Mapping[str, int]) -> None:
+        """Inițializează politica (niciun tip adus încă → toate sunt scadente)."""
+        self._ttls = dict(ttls)
+        self._fetched_at: dict[str, float] = {}
+
+    @property
+    def kinds(self) -> tuple[str, ...]:
+        """Tipurile de date cu TTL."""
+        return tuple(self._ttls)
+
+    def plan(self, kinds: list[str], interval: float, budget: int) -> RefreshPlan:
+        """Alege tipurile de adus în ciclul curent.
+
+        Args:
+            kinds: Tipurile aplicabile contractului (în ordinea preferată).
+            interval: Intervalul până la următorul ciclu (secunde).
+            budget: Câte tipuri deja aduse pot fi reîmprospătate într-un ciclu.
+
+        Tipurile niciodată aduse (prima actualizare) nu consumă din buget.
+        """
+        plan = RefreshPlan()
+        now = time.monotonic()
+        tolerance = interval * _DUE_TOLERANCE
+        remaining: dict[str, float] = {}
+        for kind in kinds:
+            fetched_at = self._fetched_at.get(kind)
+            if fetched_at is None:
+                plan.fetch.append(kind)
+            else:
+                remaining[kind] = self._ttls.get(kind, 0) - (now - fetched_at)
+
+        due_now = sorted((k for k, r in remaining.items() if r <= tolerance), key=remaining.get)
+        plan.fetch.extend(due_now[:budget])
+        plan.deferred = due_now[budget:]
+        slots = budget - len(due_now[:budget])
+        if slots <= 0 or interval <= 0:
+            return plan
+
+        # Ciclul (1 = următorul) în care expiră fiecare tip încă valabil
+        upcoming = sorted((k for k, r in remaining.items() if r > tolerance), key=remaining.get)
+        due_cycle = {k: max(1, math.ceil((remaining[k] - tolerance) / interval)) for k in upcoming}
+        horizon = max(due_cycle.values(), default=0)
+        for cycle in range(1, horizon + 1):
+            pending = [k for k in upcoming if due_cycle[k] <= cycle and k not in plan.early]
+            excess = len(pending) - budget * cycle
+            while excess > 0 and slots > 0:
+                plan.early.append(pending.pop(0))
+                excess -= 1
+                slots -= 1
+            if slots <= 0:
+                break
+        plan.fetch.extend(plan.early)
+        return plan
+
+    def mark_fetched(self, kind: str) -> None:
+        """Tipul a fost adus cu succes în ciclul curent."""
+        self._fetched_at[kind] = time.monotonic()
+
+    def was_fetched(self, kind: str) -> bool:
+        """True dacă tipul a fost adus cu succes cel puțin o dată (de la ultimul expire)."""
+        return kind in self._fetched_at
+
+    def expire(self, kind: str) -> None:
+        """Forțează aducerea tipului la următorul ciclu (ex. după trimiterea indexului)."""
+        self._fetched_at.pop(kind, None)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """TTL, vârstă și scadență per tip (pentru diagnostics)."""
+        now = time.monotonic()
+        result: dict[str, dict[str, Any]] = {}
+        for kind, ttl in self._ttls.items():
+            fetched_at = self._fetched_at.get(kind)
+            age = None if fetched_at is None else now - fetched_at
+            result[kind] = {
+                "ttl_s": ttl,
+                "age_s": None if age is None else round(age),
+                "due_in_s": 0 if age is None else max(0, round(ttl - age)),
+            }
+        return result
@@ -0,0 +1,42 @@
+"""Eșalonarea refresh-urilor: fiecare coordinator are propria fază în interval.
+
+Fără eșalonare, toate coordinatoarele (din toate intrările) pornesc odată
+la setup și au același interval, deci lovesc API-ul în aceeași secundă la
+fiecare ciclu. Faza fiecărui coordinator e derivată determinist din cheia lui
+(codul contractului), deci rămâne aceeași după restart; refresh-urile cad la
+momentele epoch + k × interval + fază, plus un jitter mic, diferit la fiecare
+ciclu.
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+
+
+def phase_fraction(key: str) -> float:
+    """Fracțiunea [0, 1) din interval asociată stabil cheii (CRC32, nu hash() — acela e aleator per proces)."""
+    return zlib.crc32(key.encode()) / 2**32
+
+
+def next_refresh_delay(
+    now: float,
+    interval: float,
+    phase: float,
+    jitter: float,
+    min_gap: float = 0.5,
+) -> float:
+    """Secunde până la următorul refresh planificat.
+
+    Args:
+        now: Momentul curent (timestamp UNIX).
+        interval: Intervalul configurat (secunde).
+        phase: Faza coordinatorului în interval (secunde, 0 ≤ phase < interval).
+        jitter: Abaterea aleatoare maximă, în ambele sensuri (secunde).
+        min_gap: Distanța minimă față de acum, ca fracțiune din interval (după un
+            refresh cerut manual, următorul slot poate fi prea aproape).
+    """
+    slot = (now - phase) // interval * interval + phase
+    while slot - now < interval * min_gap:
+        slot += interval
+    return max(1.0, slot - now + random.uniform(-jitter, jitter))
@@ -0,0 +1,203 @@
+"""Politici de reziliență pentru cererile către API-ul E·ON România.
+
+O cerere eșuată tranzitoriu (timeout, eroare de rețea, 429/5xx) nu mai
+golește un bloc întreg de date până la următorul ciclu de actualizare:
+cererile idempotente sunt reîncercate cu backoff exponențial și jitter,
+în limita unui buget de timp (deadline) per cerere. Cererile cu efecte
+(ex. trimiterea indexului) nu sunt reîncercate niciodată automat.
+
+Pentru endpoint-urile critice ca latență, o cerere care depășește p95 poate
+primi o copie („hedge"); copiile sunt limitate de un buget (HedgeBudget).
+
+Un endpoint căzut nu mai costă câte un timeout complet pentru fiecare
+contract: după câteva eșecuri consecutive, circuit breaker-ul lui se
+deschide și cererile eșuează imediat (clientul servește datele anterioare),
+până la o cerere de probă reușită.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from .const import RETRY_ATTEMPTS, RETRY_BASE_DELAY, RETRY_DEADLINE, RETRY_MAX_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status 0 = timeout / eroare de rețea (vezi _ApiResponse în api.py)
+TRANSIENT_STATUSES = frozenset({0, 429, 500, 502, 503, 504})
+
+# Eșecuri care indică un endpoint căzut (429 = doar limitare de ritm, endpoint-ul răspunde)
+BREAKER_FAILURE_STATUSES = TRANSIENT_STATUSES - {429}
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Câte încercări, cu ce pauze și în ce buget total de timp."""
+
+    attempts: int
+    base_delay: float = 0.0
+    max_delay: float = 0.0
+    deadline: float | None = None
+
+    def backoff(self, attempt: int) -> float:
+        """Pauza după încercarea `attempt` (1-based): exponențial, cu jitter pe jumătatea superioară."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+# GET-uri și POST-uri doar de citire: sigur de repetat
+RETRY_IDEMPOTENT = RetryPolicy(
+    attempts=RETRY_ATTEMPTS,
+    base_delay=RETRY_BASE_DELAY,
+    max_delay=RETRY_MAX_DELAY,
+    deadline=RETRY_DEADLINE,
+)
+
+# Cereri cu efecte (ex. trimiterea indexului): o singură încercare
+RETRY_NEVER = RetryPolicy(attempts=1)
+
+
+class CircuitBreaker:
+    """Circuit breaker pentru un endpoint: closed → open → half-open → closed.
+
+    - closed: cererile trec; `failure_threshold` eșecuri consecutive îl deschid.
+    - open: cererile sunt refuzate imediat, timp de `recovery_time` secunde.
+    - half-open: trece o singură cerere de probă; reușita închide circuitul,
+      eșecul îl redeschide (cu timp de recuperare dublat, până la `max_recovery_time`).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_time: float,
+        max_recovery_time: float,
+    ) -> None:
+        """Inițializează breaker-ul (închis)."""
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._base_recovery = recovery_time
+        self._max_recovery = max_recovery_time
+        self._recovery = recovery_time
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._rejected = 0
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        """Starea curentă (open trece în half-open după expirarea timpului de recuperare)."""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self._recovery:
+            self._state = STATE_HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """True dacă cererea poate pleca; în half-open lasă să treacă o singură probă."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        # O probă fără rezultat (ex. anulată) nu blochează circuitul la nesfârșit
+        now = time.monotonic()
+        if state == STATE_HALF_OPEN and (
+            not self._probe_in_flight or now - self._probe_started >= self._recovery
+        ):
+            self._probe_in_flight = True
+            self._probe_started = now
+            return True
+        self._rejected += 1
+        return False
+
+    def record(self, status: int) -> None:
+        """Înregistrează rezultatul unei încercări (cod HTTP; 0 = timeout / rețea)."""
+        if status in BREAKER_FAILURE_STATUSES:
+            self._record_failure()
+        else:
+            self._record_success()
+
+    def _record_success(self) -> None:
+        if self._state != STATE_CLOSED:
+            _LOGGER.info("[BREAKER] %s: endpoint disponibil din nou — circuit închis.", self._name)
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._recovery = self._base_recovery
+        self._probe_in_flight = False
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        if self._state == STATE_HALF_OPEN:
+            self._recovery = min(self._recovery * 2, self._max_recovery)
+            self._open()
+        elif self._state == STATE_CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._trips += 1
+        _LOGGER.warning(
+            "[BREAKER] %s: %s eșecuri consecutive — circuit deschis pentru %.0fs.",
+            self._name, self._failures, self._recovery,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Starea breaker-ului (pentru diagnostics)."""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "trips": self._trips,
+            "rejected": self._rejected,
+            "retry_in_s": (
+                round(max(0.0, self._opened_at + self._recovery - time.monotonic()), 1)
+                if state == STATE_OPEN
+                else 0.0
+            ),
+        }
+
+
+class HedgeBudget:
+    """Limitează copiile „hedge" la o fracțiune din cererile primare."""
+
+    def __init__(self, ratio: float) -> None:
+        """Inițializează bugetul (ex. 0.1 = cel mult 10% cereri în plus)."""
+        self._ratio = ratio
+        self._requests = 0
+        self._hedges = 0
+        self._wins = 0
+
+    def record_request(self) -> None:
+        """Contorizează o cerere primară eligibilă pentru hedging."""
+        self._requests += 1
+
+    def try_acquire(self) -> bool:
+        """True (și consumă din buget) dacă se mai poate trimite o copie."""
+        if self._hedges + 1 > self._requests * self._ratio:
+            return False
+        self._hedges += 1
+        return True
+
+    def record_win(self) -> None:
+        """Copia a răspuns înaintea cererii primare."""
+        self._wins += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Contoare pentru diagnostics."""
+        return {
+            "budget_ratio": self._ratio,
+            "requests": self._requests,
+            "hedges": self._hedges,
+            "hedge_wins": self._wins,
+        }
@@ -0,0 +1,213 @@
+"""Planificator pentru cererile HTTP către API-ul E·ON România.
+
+Toate cererile unui cont (toți clienții API ai contului, vezi
+account_registry.py) trec printr-un singur punct de control:
+- limită de concurență (câte cereri pot fi simultan în zbor);
+- token bucket (ritm mediu + rafală maximă);
+- backoff adaptiv la 429 (sau la orice răspuns cu Retry-After): se respectă
+  Retry-After dacă e trimis, altfel pauza crește exponențial; ritmul e
+  înjumătățit la fiecare semnal de limitare și revine treptat după
+  răspunsuri reușite.
+
+Un 503 fără Retry-After e un eșec al unui singur endpoint, nu o limitare a
+contului: îl tratează reîncercările și circuit breaker-ul endpoint-ului
+(resilience.py), fără a opri cererile către celelalte endpoint-uri.
+
+Conturile mari (DUO cu multe subcontracte) nu mai trimit zeci de cereri
+deodată, deci nu mai ajung să fie limitate sau blocate temporar de backend.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Limitare explicită a contului (backoff global + reducerea ritmului)
+THROTTLE_STATUSES = frozenset({429})
+
+# Coduri la care un Retry-After trimis de server impune pauza tuturor cererilor
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Ritmul nu scade sub această fracțiune din ritmul configurat
+_MIN_RATE_FACTOR = 0.125
+# Creștere aditivă a ritmului după fiecare răspuns reușit (fracțiune din ritmul configurat)
+_RATE_RECOVERY_STEP = 0.05
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Interpretează headerul Retry-After (secunde sau dată HTTP). None dacă lipsește/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestScheduler:
+    """Limitează concurența și ritmul cererilor; reacționează la 429 / 503."""
+
+    def __init__(
+        self,
+        concurrency: int,
+        rate: float,
+        burst: int,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> None:
+        """Inițializează planificatorul.
+
+        Args:
+            concurrency: Număr maxim de cereri simultan în zbor.
+            rate: Ritm mediu permis (cereri pe secundă).
+            burst: Câte cereri pot pleca imediat, fără așteptare (capacitatea bucket-ului).
+            backoff_base: Pauza inițială la 429 / 503 fără Retry-After (secunde).
+            backoff_max: Pauza maximă (secunde).
+        """
+        self._concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._base_rate = rate
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._refilled_at = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._blocked_until = 0.0
+        self._throttle_streak = 0
+
+        self._in_flight = 0
+        self._queued = 0
+        self._stats: dict[str, float] = {
+            "requests": 0,
+            "max_queued": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            "throttled": 0,
+        }
+
+    @property
+    def concurrency(self) -> int:
+        """Limita de concurență configurată."""
+        return self._concurrency
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Rezervă un loc pentru o cerere: concurență, ritm și eventuala pauză de backoff."""
+        queued_at = time.monotonic()
+        self._queued += 1
+        self._stats["max_queued"] = max(self._stats["max_queued"], self._queued)
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            self._queued -= 1
+            raise
+        try:
+            await self._wait_backoff()
+            await self._take_token()
+        except BaseException:
+            self._queued -= 1
+            self._semaphore.release()
+            raise
+
+        waited = time.monotonic() - queued_at
+        self._queued -= 1
+        self._in_flight += 1
+        self._stats["requests"] += 1
+        self._stats["wait_total"] += waited
+        self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def _wait_backoff(self) -> None:
+        """Așteaptă până expiră pauza impusă de un 429 / 503 (poate fi prelungită între timp)."""
+        while (delay := self._blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+    async def _take_token(self) -> None:
+        """Consumă un token din bucket; așteaptă reumplerea dacă e gol (ordine FIFO)."""
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self._burst), self._tokens + (now - self._refilled_at) * self._rate
+                )
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def record_response(self, status: int, retry_after: str | None = None) -> bool:
+        """Adaptează ritmul după un răspuns: backoff la 429 / Retry-After, revenire treptată altfel.
+
+        Returnează True dacă răspunsul a impus o pauză globală (apelantul nu mai
+        adaugă propriul backoff peste ea).
+        """
+        delay = parse_retry_after(retry_after) if status in RETRY_AFTER_STATUSES else None
+        if status in THROTTLE_STATUSES or delay is not None:
+            self._throttle(status, delay)
+            return True
+        if 200 <= status < 500:
+            self._throttle_streak = 0
+            if self._rate < self._base_rate:
+                self._rate = min(
+                    self._base_rate, self._rate + self._base_rate * _RATE_RECOVERY_STEP
+                )
+        return False
+
+    def _throttle(self, status: int, retry_after: float | None) -> None:
+        """Impune o pauză tuturor cererilor și înjumătățește ritmul."""
+        self._stats["throttled"] += 1
+        self._throttle_streak += 1
+        if retry_after is not None:
+            delay = min(retry_after, self._backoff_max)
+        else:
+            delay = min(
+                self._backoff_base * 2 ** (self._throttle_streak - 1), self._backoff_max
+            )
+            delay += random.uniform(0, delay * 0.1)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._rate = max(self._base_rate * _MIN_RATE_FACTOR, self._rate / 2)
+        _LOGGER.warning(
+            "[SCHEDULER] Cod HTTP=%s — pauză %.1fs pentru toate cererile (ritm redus la %.2f cereri/s).",
+            status, delay, self._rate,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Starea și contoarele planificatorului (pentru diagnostics)."""
+        requests = self._stats["requests"]
+        return {
+            "concurrency": self._concurrency,
+            "rate": round(self._rate, 3),
+            "rate_configured": self._base_rate,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "max_queued": int(self._stats["max_queued"]),
+            "requests": int(requests),
+            "wait_avg_ms": round(self._stats["wait_total"] / requests * 1000, 1) if requests else 0.0,
+            "wait_max_ms": round(self._stats["wait_max"] * 1000, 1),
+            "throttled": int(self._stats["throttled"]),
+            "backoff_remaining_s": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+        }
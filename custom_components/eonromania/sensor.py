@@ -7,15 +7,17 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import UnitOfVolume, UnitOfEnergy
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, ATTRIBUTION, LICENSE_DATA_KEY
 from .coordinator import EonRomaniaCoordinator
+from .history import invoice_key
 from .helpers import (
     CONVENTION_MONTH_MAPPING,
     INVOICE_BALANCE_KEY_MAP,
@@ -44,6 +46,11 @@ class EonRomaniaEntity(CoordinatorEntity[EonRomaniaCoordinator], SensorEntity):
 
     _attr_has_entity_name = False
 
+    # Starea depinde și de data curentă (ex. zile până la scadență): coordinatorul
+    # nu notifică entitățile când datele API sunt neschimbate (always_update=False),
+    # deci senzorul se rescrie singur după miezul nopții.
+    _date_dependent = False
+
     def __init__(self, coordinator: EonRomaniaCoordinator, config_entry: ConfigEntry):
         """Inițializare cu coordinator și config_entry."""
         super().__init__(coordinator)
@@ -51,6 +58,21 @@ class EonRomaniaEntity(CoordinatorEntity[EonRomaniaCoordinator], SensorEntity):
         self._cod_incasare = coordinator.cod_incasare
         self._custom_entity_id: str | None = None
 
+    async def async_added_to_hass(self) -> None:
+        """Abonare la coordinator; senzorii dependenți de dată se reevaluează zilnic."""
+        await super().async_added_to_hass()
+        if self._date_dependent:
+            self.async_on_remove(
+                async_track_time_change(
+                    self.hass, self._async_new_day, hour=0, minute=0, second=5
+                )
+            )
+
+    @callback
+    def _async_new_day(self, _now: datetime) -> None:
+        """Rescrie starea la schimbarea zilei (fără refresh API)."""
+        self.async_write_ha_state()
+
     @property
     def _license_valid(self) -> bool:
         """Verifică dacă licența este validă (STAB-02).
@@ -983,6 +1005,7 @@ class CitirePermisaSensor(EonRomaniaEntity):
     """Senzor pentru verificarea permisiunii de citire a indexului."""
 
     _attr_translation_key = "citire_permisa"
+    _date_dependent = True
 
     def __init__(self, coordinator, config_entry, device_number, subcontract_code=None, utility_type=None):
         super().__init__(coordinator, config_entry)
@@ -1126,6 +1149,7 @@ class FacturaRestantaSensor(EonRomaniaEntity):
 
     _attr_icon = "mdi:invoice-text-arrow-left"
     _attr_translation_key = "factura_restanta"
+    _date_dependent = True
 
     def __init__(self, coordinator, config_entry):
         super().__init__(coordinator, config_entry)
@@ -1184,6 +1208,11 @@ class FacturaProsumSensor(EonRomaniaEntity):
 
     _attr_icon = "mdi:invoice-text-arrow-left"
     _attr_translation_key = "factura_prosumator"
+    _date_dependent = True
+
+    # Istoricul local poate avea ani de facturi; creditele (nerevăzute la sync) și cele
+    # fără sold se listează și se însumează doar pe cele mai recente
+    _RECENT_LIMIT = 12
 
     def __init__(self, coordinator, config_entry):
         super().__init__(coordinator, config_entry)
@@ -1195,8 +1224,8 @@ class FacturaProsumSensor(EonRomaniaEntity):
     def native_value(self):
         if not self._license_valid:
             return "Licență necesară"
-        data = self.coordinator.data.get("invoices_prosum") if self.coordinator.data else None
-        if not data or not isinstance(data, list):
+        data = self._invoices()
+        if not data:
             balance_data = self.coordinator.data.get("invoice_balance_prosum") if self.coordinator.data else None
             if balance_data and isinstance(balance_data, dict):
                 balance = float(balance_data.get("balance", 0))
@@ -1208,8 +1237,8 @@ class FacturaProsumSensor(EonRomaniaEntity):
     def extra_state_attributes(self):
         if not self._license_valid:
             return {"licență": "necesară"}
-        data = self.coordinator.data.get("invoices_prosum") if self.coordinator.data else None
-        if not data or not isinstance(data, list):
+        data = self._invoices()
+        if not data:
             return {
                 "Total neachitat": "0,00 lei",
                 "Detalii": "Nu există facturi disponibile",
@@ -1219,6 +1248,7 @@ class FacturaProsumSensor(EonRomaniaEntity):
         attributes = {}
         total_sold = 0.0
         total_credit = 0.0
+        unverified = self.coordinator.prosum_invoices_unverified
 
         for idx, item in enumerate(data, start=1):
             issued_value = float(item.get("issuedValue", 0))
@@ -1228,6 +1258,16 @@ class FacturaProsumSensor(EonRomaniaEntity):
             invoice_number = item.get("invoiceNumber", "N/A")
             invoice_type = item.get("type", "Necunoscut")
 
+            # Sold pozitiv nerevăzut de mult: nu se adună la datorie (poate fi deja achitată)
+            if display_value > 0 and invoice_key(item) in unverified:
+                if idx <= self._RECENT_LIMIT:
+                    attributes[f"Factură {idx} ({invoice_number})"] = f"Sold neconfirmat (scadentă {raw_date})"
+                continue
+
+            # Doar datoriile se urmăresc pe tot istoricul
+            if display_value <= 0 and idx > self._RECENT_LIMIT:
+                continue
+
             try:
                 if display_value > 0:
                     total_sold += display_value
@@ -1253,6 +1293,12 @@ class FacturaProsumSensor(EonRomaniaEntity):
         attributes["attribution"] = ATTRIBUTION
         return attributes
 
+    def _invoices(self) -> list:
+        """Facturile de prosumator din istoricul local al coordinatorului."""
+        if not self.coordinator.data:
+            return []
+        return [item for item in self.coordinator.prosum_invoices if isinstance(item, dict)]
+
 
 # ──────────────────────────────────────────────
 # ConventieConsumSensor
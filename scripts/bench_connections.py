@@ -0,0 +1,134 @@
+"""Benchmark: conexiuni deschise și durata unui refresh, sesiune dedicată vs. partajată.
+
+Rulează aceeași rafală de cereri (ca un refresh: mai multe runde, cu pauză
+între ele, limitate de RequestScheduler) de două ori către un server aiohttp
+local cu latență artificială:
+- o dată prin create_api_session (sesiunea dedicată a contului);
+- o dată printr-o sesiune configurată ca cea partajată din Home Assistant
+  (async_get_clientsession: limită mare per gazdă, keep-alive implicit).
+Conexiunile create / refolosite vin din ConnectionStats (același TraceConfig
+ca în diagnostics); durata raportată e suma rundelor, fără pauze.
+
+Serverul local nu are TLS, deci costul unei conexiuni noi e doar cel TCP;
+pe API-ul real fiecare conexiune nouă adaugă și handshake-ul TLS.
+
+Rulare din rădăcina repo-ului, într-un mediu cu Home Assistant instalat:
+    python scripts/bench_connections.py [--rounds 3] [--requests 16] [--pause 20]
+(o pauză mai mare decât keep-alive-ul implicit aiohttp, 15 s, arată diferența
+dintre runde).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import ssl
+import sys
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.eonromania.connection import (  # noqa: E402
+    ConnectionStats,
+    create_api_session,
+)
+from custom_components.eonromania.const import (  # noqa: E402
+    SCHEDULER_BACKOFF_BASE,
+    SCHEDULER_BACKOFF_MAX,
+    SCHEDULER_BURST,
+    SCHEDULER_CONCURRENCY,
+    SCHEDULER_RATE,
+)
+from custom_components.eonromania.scheduler import RequestScheduler  # noqa: E402
+
+SERVER_LATENCY = 0.05  # Secunde per răspuns (simulează backend-ul)
+
+# Valorile din homeassistant.helpers.aiohttp_client (sesiunea partajată)
+HA_SHARED_LIMIT = 4096
+HA_SHARED_LIMIT_PER_HOST = 100
+
+
+async def _handler(_request: web.Request) -> web.Response:
+    await asyncio.sleep(SERVER_LATENCY)
+    return web.json_response({"ok": True})
+
+
+def _shared_session(stats: ConnectionStats) -> ClientSession:
+    """Sesiune echivalentă cu cea partajată din Home Assistant."""
+    connector = TCPConnector(limit=HA_SHARED_LIMIT, limit_per_host=HA_SHARED_LIMIT_PER_HOST)
+    return ClientSession(connector=connector, trace_configs=[stats.trace_config()])
+
+
+async def _fan_out(
+    session: ClientSession, url: str, rounds: int, requests: int, pause: float
+) -> float:
+    """Rundele de cereri, prin planificator; returnează durata totală (fără pauze)."""
+    scheduler = RequestScheduler(
+        concurrency=SCHEDULER_CONCURRENCY,
+        rate=SCHEDULER_RATE,
+        burst=SCHEDULER_BURST,
+        backoff_base=SCHEDULER_BACKOFF_BASE,
+        backoff_max=SCHEDULER_BACKOFF_MAX,
+    )
+
+    async def _one(index: int) -> None:
+        async with scheduler.slot(), session.get(f"{url}?i={index}") as resp:
+            await resp.read()
+
+    elapsed = 0.0
+    for round_no in range(rounds):
+        if round_no:
+            await asyncio.sleep(pause)
+        started = time.monotonic()
+        await asyncio.gather(*(_one(i) for i in range(requests)))
+        elapsed += time.monotonic() - started
+    return elapsed
+
+
+async def main(rounds: int, requests: int, pause: float) -> None:
+    """Pornește serverul local și rulează rafala cu ambele sesiuni."""
+    app = web.Application()
+    app.router.add_get("/", _handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+    url = f"http://127.0.0.1:{port}/"
+
+    print(
+        f"{rounds} runde × {requests} cereri, pauză {pause:g} s, "
+        f"latență server {SERVER_LATENCY * 1000:g} ms, concurență {SCHEDULER_CONCURRENCY}"
+    )
+    try:
+        for label in ("dedicată", "partajată"):
+            stats = ConnectionStats()
+            if label == "dedicată":
+                session = create_api_session(
+                    SCHEDULER_CONCURRENCY, stats, ssl.create_default_context()
+                )
+            else:
+                session = _shared_session(stats)
+            async with session:
+                elapsed = await _fan_out(session, url, rounds, requests, pause)
+            result = stats.stats()
+            print(
+                f"{label:10s} conexiuni create: {result['created']:3d}   "
+                f"refolosite: {result['reused']:3d}   "
+                f"în așteptare: {result['queued_for_limit']:3d}   "
+                f"durată: {elapsed:6.2f} s"
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--pause", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds, args.requests, args.pause))
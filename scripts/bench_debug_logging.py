@@ -0,0 +1,70 @@
+"""Benchmark: costul logging-ului de debug din api.py, cu DEBUG oprit și pornit.
+
+Compară varianta veche (argumente construite înainte de apel: json.dumps pe
+tot payload-ul, lista cheilor) cu _debug_payload (verificare isEnabledFor +
+argumente leneșe) pe un payload de plăți de 300 de elemente.
+
+Rulare din rădăcina repo-ului, într-un mediu cu Home Assistant instalat:
+    python scripts/bench_debug_logging.py
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.eonromania import api  # noqa: E402
+
+CALLS = 2000
+PAYLOAD = [
+    {
+        "paymentDocument": f"PD{i:08d}",
+        "value": 123.45 + i,
+        "paymentDate": "2024-05-01",
+        "channel": "card",
+        "accountContract": "002100000000",
+    }
+    for i in range(300)
+]
+
+
+def _eager(data) -> None:
+    """Apelul de dinainte: argumentele se calculează indiferent de nivel."""
+    api._LOGGER.debug(
+        "[payments] Date cumulate: type=%s, len=%s, sample keys=%s, sample content=%s",
+        type(data).__name__,
+        len(data) if isinstance(data, list) else "N/A",
+        list(data[0].keys()) if isinstance(data, list) and data else "N/A",
+        json.dumps(data, default=str)[:500] if data else "None",
+    )
+
+
+def _lazy(data) -> None:
+    api._debug_payload("payments", data, "Date cumulate")
+
+
+def _measure(func) -> float:
+    """Microsecunde per apel."""
+    return timeit.timeit(lambda: func(PAYLOAD), number=CALLS) / CALLS * 1e6
+
+
+def main() -> None:
+    """Rulează ambele variante cu DEBUG oprit, apoi pornit (handler care formatează în gol)."""
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    api._LOGGER.addHandler(handler)
+    api._LOGGER.propagate = False
+    for level, label in ((logging.INFO, "DEBUG oprit"), (logging.DEBUG, "DEBUG pornit")):
+        api._LOGGER.setLevel(level)
+        print(
+            f"{label:13s} vechi: {_measure(_eager):9.2f} µs/apel   "
+            f"_debug_payload: {_measure(_lazy):9.2f} µs/apel"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Fixture-uri comune pentru testele integrării E·ON România.
+
+Testele folosesc pytest-homeassistant-custom-component (fixture-ul `hass`).
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Permite încărcarea integrării din custom_components în toate testele."""
+    yield
@@ -0,0 +1,93 @@
+"""Parcurgerea paginată cu circuitul deschis: eșec, nu date proaspete."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from custom_components.eonromania.api import EonApiClient, PageCursor
+from custom_components.eonromania.const import BREAKER_FAILURE_THRESHOLD, URL_PAYMENT_LIST
+from custom_components.eonromania.coordinator import EonRomaniaCoordinator
+
+CONTRACT = "002100000001"
+STALE_PAGE = {"list": [{"paymentDate": "2024-01-15", "value": 100}], "hasNext": False}
+
+
+class _FakeResponse:
+    def __init__(self, payload) -> None:
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self._raw = json.dumps(payload).encode()
+
+    async def read(self) -> bytes:
+        return self._raw
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+class _FakeSession:
+    """Răspunde 200 cu o pagină goală / obiect gol la orice cerere; le numără."""
+
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    def request(self, method: str, url: str, **kwargs) -> _FakeResponse:
+        self.urls.append(url)
+        if "page=" in url:
+            return _FakeResponse({"list": [], "hasNext": False})
+        return _FakeResponse({})
+
+
+def _client_with_open_payments_breaker(session: _FakeSession) -> EonApiClient:
+    """Client autentificat, cu o pagină veche de plăți memorată și breaker-ul plăților deschis."""
+    client = EonApiClient(session, "user@example.com", "secret")
+    client.inject_token(
+        {
+            "access_token": "token",
+            "refresh_token": "refresh",
+            "expires_in": 3600,
+            "obtained_at_wallclock": time.time(),
+        }
+    )
+    client._validators.remember(
+        f"{URL_PAYMENT_LIST}?accountContract={CONTRACT}&page=1", None, None, b"", STALE_PAGE
+    )
+    breaker = client._breaker("payments")
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        breaker.record(503)
+    return client
+
+
+async def test_page_walk_with_open_breaker_fails() -> None:
+    """Pagina servită din fallback-ul breaker-ului nu finalizează parcurgerea."""
+    session = _FakeSession()
+    client = _client_with_open_payments_breaker(session)
+    cursor = PageCursor()
+
+    client.reset_request_outcome()
+    pages = [chunk async for chunk in client.async_iter_payments(CONTRACT, cursor=cursor)]
+
+    assert pages == []
+    assert cursor.failed
+    assert not cursor.complete
+    assert client.requests_failed
+    assert not any("payments" in url for url in session.urls)
+
+
+async def test_open_breaker_does_not_mark_history_fresh(hass) -> None:
+    """Cu breaker-ul deschis, plățile nu sunt marcate proaspete; restul tipurilor da."""
+    session = _FakeSession()
+    client = _client_with_open_payments_breaker(session)
+    coordinator = EonRomaniaCoordinator(hass, client, CONTRACT, 21600)
+
+    await coordinator.async_refresh()
+    coordinator._async_cancel_prewarm()
+
+    assert coordinator.last_update_success
+    freshness = coordinator.freshness
+    assert freshness["payments"]["age_s"] is None
+    assert freshness["invoices_prosum"]["age_s"] is not None